@@ -0,0 +1,8 @@
+"""Benchmarks of the OxyGent framework itself.
+
+The suite builds MASes from configurable topologies whose LLMs are in-process
+fakes with scripted responses, so that the numbers measure the cost of the
+framework (agents, flows, storage, messaging) rather than the cost of a model.
+
+Run ``python -m benchmarks --help`` from the repository root.
+"""
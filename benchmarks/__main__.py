@@ -0,0 +1,107 @@
+"""Command line entry point: ``python -m benchmarks``.
+
+Examples:
+    python -m benchmarks
+    python -m benchmarks -t react -t hierarchical --concurrency 16 --requests 500
+    python -m benchmarks -t chat --requests 20 --save-data
+    python -m benchmarks --llm-latency 0.05 --output report.json
+"""
+
+import argparse
+import asyncio
+import json
+
+from .runner import run_benchmarks
+from .topologies import TOPOLOGIES
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Measure the per-call overhead of the OxyGent framework.",
+    )
+    parser.add_argument(
+        "-t",
+        "--topology",
+        action="append",
+        choices=sorted(TOPOLOGIES),
+        help="Topology to run, repeatable (default: all)",
+    )
+    parser.add_argument("--requests", type=int, default=50, help="Measured traces")
+    parser.add_argument("--concurrency", type=int, default=1, help="Traces in flight")
+    parser.add_argument("--warmup", type=int, default=5, help="Discarded traces")
+    parser.add_argument(
+        "--llm-latency", type=float, default=0.0, help="Seconds per fake LLM call"
+    )
+    parser.add_argument("--n-tools", type=int, default=4, help="Tools per ReAct agent")
+    parser.add_argument("--n-sub-agents", type=int, default=3, help="Sub-agents")
+    parser.add_argument("--team-size", type=int, default=4, help="ParallelAgent team")
+    parser.add_argument("--n-steps", type=int, default=3, help="PlanAndSolve steps")
+    parser.add_argument(
+        "--alloc-requests",
+        type=int,
+        default=10,
+        help="Traces run under tracemalloc, 0 disables allocation tracking",
+    )
+    parser.add_argument(
+        "--save-data",
+        action="store_true",
+        help="Save node records to LocalEs to include the storage cost (slow)",
+    )
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    return parser.parse_args(argv)
+
+
+def format_report(report: dict) -> str:
+    latency = report["latency_ms"]
+    lines = [
+        f"[{report['topology']}] {report['description']}",
+        f"  oxy calls/trace      {report['oxy_calls_per_trace']}",
+        f"  throughput           {report['throughput_rps']} traces/s"
+        f" @ concurrency {report['concurrency']}",
+        f"  latency ms           mean {latency['mean']}  p50 {latency['p50']}"
+        f"  p99 {latency['p99']}  max {latency['max']}",
+        f"  overhead ms          {report['overhead_ms_per_trace']} per trace,"
+        f" {report['overhead_ms_per_call']} per oxy call",
+        f"  background drain ms  {report['background_drain_ms']}",
+    ]
+    for backend, stats in report["storage"].items():
+        lines.append(
+            f"  {backend:<20} {stats['calls_per_trace']} calls,"
+            f" {stats['busy_ms_per_trace']} ms busy per trace"
+        )
+    if report["allocations"]:
+        allocations = report["allocations"]
+        lines.append(
+            f"  allocations          peak {allocations['peak_kb']} KiB,"
+            f" retained {allocations['retained_kb_per_trace']} KiB per trace"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    reports = asyncio.run(
+        run_benchmarks(
+            args.topology or list(TOPOLOGIES),
+            is_save_data=args.save_data,
+            n_requests=args.requests,
+            concurrency=args.concurrency,
+            warmup=args.warmup,
+            llm_latency=args.llm_latency,
+            alloc_requests=args.alloc_requests,
+            n_tools=args.n_tools,
+            n_sub_agents=args.n_sub_agents,
+            team_size=args.team_size,
+            n_steps=args.n_steps,
+        )
+    )
+    for report in reports:
+        print(format_report(report))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(reports, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
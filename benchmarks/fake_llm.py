@@ -0,0 +1,69 @@
+"""In-process LLM stand-in with scripted responses and configurable latency."""
+
+import asyncio
+import json
+from typing import Optional
+
+from pydantic import Field
+
+from oxygent.oxy.llms.base_llm import BaseLLM
+from oxygent.schemas import OxyRequest, OxyResponse, OxyState
+
+
+def count_tool_calls(messages: list) -> int:
+    """Number of tool calls the assistant already made in ``messages``."""
+    return sum(
+        1
+        for message in messages
+        if message.get("role") == "assistant"
+        and '"tool_name"' in str(message.get("content", ""))
+    )
+
+
+def scripted_response(messages: list, tool_calls: list, answer: str) -> str:
+    """Next response of a ReAct script: the next tool call, then ``answer``."""
+    done = count_tool_calls(messages)
+    if done >= len(tool_calls):
+        return answer
+    tool_name, arguments = tool_calls[done]
+    return json.dumps(
+        {
+            "think": f"Step {done + 1}: call {tool_name}.",
+            "tool_name": tool_name,
+            "arguments": arguments,
+        },
+        ensure_ascii=False,
+    )
+
+
+class FakeLLM(BaseLLM):
+    """LLM answering from a script instead of a model.
+
+    The script is stateless with respect to concurrency: the next response is
+    derived from the messages of the request, so one instance can serve any
+    number of concurrent traces.
+
+    - while the conversation holds fewer tool calls than ``tool_calls``, the
+      next tool call of the script is returned in the ReAct JSON format
+    - afterwards ``answer`` is returned
+    """
+
+    latency: float = Field(0.0, description="Seconds slept before answering")
+    tool_calls: list = Field(
+        default_factory=list,
+        description="Scripted (tool_name, arguments) pairs, called in order",
+    )
+    answer: str = Field("This is the answer.", description="Final answer")
+    usage: Optional[dict] = Field(
+        default_factory=lambda: {"prompt_tokens": 0, "completion_tokens": 0},
+        description="Token usage reported with every response",
+    )
+
+    async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        output = scripted_response(
+            oxy_request.arguments.get("messages", []), self.tool_calls, self.answer
+        )
+        extra = {"usage": dict(self.usage)} if self.usage else {}
+        return OxyResponse(state=OxyState.COMPLETED, output=output, extra=extra)
@@ -0,0 +1,115 @@
+"""Pure Python HDR (high dynamic range) histogram.
+
+Values are bucketed with a bounded *relative* error instead of fixed bucket
+bounds, so a single histogram covers microseconds to minutes while keeping
+``significant_figures`` digits of precision: a value ``v`` is stored as its top
+``sub_bucket_bits`` bits plus the shift that was dropped.
+"""
+
+import math
+
+
+class HdrHistogram:
+    """Record integer values (e.g. microseconds) with bounded relative error."""
+
+    def __init__(self, significant_figures: int = 3):
+        if not 1 <= significant_figures <= 5:
+            raise ValueError("significant_figures must be between 1 and 5")
+        self.significant_figures = significant_figures
+        self.sub_bucket_bits = math.ceil(math.log2(2 * 10**significant_figures))
+        self.counts: dict[int, int] = {}
+        self.total_count = 0
+        self.min_value = None
+        self.max_value = 0
+
+    def _index(self, value: int) -> tuple:
+        shift = max(0, value.bit_length() - self.sub_bucket_bits)
+        return shift, value >> shift
+
+    def _key(self, value: int) -> int:
+        shift, sub_bucket = self._index(value)
+        return (shift << self.sub_bucket_bits) | sub_bucket
+
+    def _highest_equivalent_value(self, key: int) -> int:
+        shift = key >> self.sub_bucket_bits
+        sub_bucket = key & ((1 << self.sub_bucket_bits) - 1)
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, value, count: int = 1):
+        value = max(0, int(value))
+        key = self._key(value)
+        self.counts[key] = self.counts.get(key, 0) + count
+        self.total_count += count
+        if self.min_value is None or value < self.min_value:
+            self.min_value = value
+        if value > self.max_value:
+            self.max_value = value
+
+    def merge(self, other: "HdrHistogram"):
+        for key, count in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + count
+        self.total_count += other.total_count
+        if other.min_value is not None:
+            self.min_value = (
+                other.min_value
+                if self.min_value is None
+                else min(self.min_value, other.min_value)
+            )
+        self.max_value = max(self.max_value, other.max_value)
+
+    def percentile(self, q: float) -> int:
+        """Value at percentile ``q`` (0-100), exact up to the bucket precision."""
+        if not self.total_count:
+            return 0
+        # Rounded first: 99.9 / 100 * 5000 is 4995.000000000001, one rank too far
+        target = max(1, math.ceil(round(q * self.total_count / 100, 9)))
+        seen = 0
+        for key in sorted(self.counts):
+            seen += self.counts[key]
+            if seen >= target:
+                return min(self._highest_equivalent_value(key), self.max_value)
+        return self.max_value
+
+    def mean(self) -> float:
+        if not self.total_count:
+            return 0.0
+        total = sum(
+            self._highest_equivalent_value(key) * count
+            for key, count in self.counts.items()
+        )
+        return total / self.total_count
+
+    def summary(self, scale: float = 1.0) -> dict:
+        """Percentiles divided by ``scale``, e.g. ``1000`` for us -> ms."""
+        return {
+            "count": self.total_count,
+            "min": (self.min_value or 0) / scale,
+            "mean": round(self.mean() / scale, 3),
+            "p50": self.percentile(50) / scale,
+            "p90": self.percentile(90) / scale,
+            "p99": self.percentile(99) / scale,
+            "p99.9": self.percentile(99.9) / scale,
+            "max": self.max_value / scale,
+        }
+
+    def to_dict(self) -> dict:
+        """Bucket counts for JSON reports, readable with :meth:`from_dict`."""
+        return {
+            "significant_figures": self.significant_figures,
+            "min": self.min_value,
+            "max": self.max_value,
+            "counts": {
+                str(self._highest_equivalent_value(key)): count
+                for key, count in sorted(self.counts.items())
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HdrHistogram":
+        histogram = cls(data["significant_figures"])
+        for value, count in data["counts"].items():
+            histogram.record(int(value), count)
+        if histogram.total_count:
+            histogram.min_value = data["min"]
+            histogram.max_value = data["max"]
+        return histogram
@@ -0,0 +1,195 @@
+"""Cold-start import time of OxyGent.
+
+Every scenario runs in fresh interpreters, so nothing is cached in
+``sys.modules``. Reported per scenario: median wall time of the imports, number
+of loaded modules and which optional heavy dependencies (database clients,
+pandas, FastAPI, the MCP and OpenAI SDKs) were pulled in.
+
+``--baseline REF`` runs the same scenarios against the ``oxygent`` package of a
+git revision (extracted with ``git archive``) to compare both trees.
+
+Usage:
+    python -m benchmarks.import_time --repeat 10
+    python -m benchmarks.import_time --baseline HEAD~1 --importtime 15
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+from io import BytesIO
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    "import": "import oxygent",
+    "chat_agent": "from oxygent import MAS, Config, oxy\noxy.ChatAgent, oxy.HttpLLM",
+    "preset_tool": "from oxygent import preset_tools\npreset_tools.math_tools",
+    "everything": (
+        "from oxygent import MAS, OxyFactory, oxy, preset_tools\n"
+        "[getattr(oxy, name) for name in oxy.__all__]\n"
+        "import oxygent.routes"
+    ),
+}
+
+HEAVY_MODULES = (
+    "elasticsearch",
+    "aioredis",
+    "pandas",
+    "numpy",
+    "fastapi",
+    "mcp",
+    "openai",
+)
+
+_CHILD = """
+import json, sys, time
+start = time.perf_counter()
+exec(compile({code!r}, "<scenario>", "exec"))
+seconds = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"seconds": seconds, "modules": len(sys.modules), "heavy": heavy}}))
+"""
+
+
+def _run_child(code: str, root: str, importtime: bool = False):
+    args = [sys.executable]
+    if importtime:
+        args += ["-X", "importtime"]
+    args += ["-c", _CHILD.format(code=code, heavy=HEAVY_MODULES)]
+    env = dict(os.environ, PYTHONPATH=root)
+    completed = subprocess.run(
+        args, cwd=root, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1]), completed.stderr
+
+
+def parse_importtime(stderr: str) -> list:
+    """``(self_us, cumulative_us, module)`` of ``-X importtime`` output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        rows.append((int(self_us), int(cumulative_us), module.strip()))
+    return rows
+
+
+def run_scenario(code: str, root: str = ROOT, repeat: int = 5) -> dict:
+    """Median import time of ``code`` over ``repeat`` fresh interpreters."""
+    results = [_run_child(code, root)[0] for _ in range(repeat)]
+    return {
+        "median_ms": round(statistics.median(r["seconds"] for r in results) * 1e3, 1),
+        "min_ms": round(min(r["seconds"] for r in results) * 1e3, 1),
+        "modules": results[-1]["modules"],
+        "heavy": results[-1]["heavy"],
+    }
+
+
+def slowest_imports(code: str, root: str = ROOT, top: int = 10) -> list:
+    """Modules with the largest self time when running ``code``."""
+    _, stderr = _run_child(code, root, importtime=True)
+    rows = sorted(parse_importtime(stderr), reverse=True)[:top]
+    return [
+        {"module": module, "self_ms": self_us / 1e3, "cumulative_ms": cum_us / 1e3}
+        for self_us, cum_us, module in rows
+    ]
+
+
+def extract_revision(ref: str, directory: str) -> str:
+    """Extract the ``oxygent`` package at git ``ref`` into ``directory``."""
+    archive = subprocess.run(
+        ["git", "archive", "--format=tar", ref, "oxygent"],
+        cwd=ROOT,
+        capture_output=True,
+        check=True,
+    ).stdout
+    with tarfile.open(fileobj=BytesIO(archive)) as tar:
+        tar.extractall(directory)
+    return directory
+
+
+def run_import_benchmarks(
+    scenarios=None, repeat: int = 5, baseline: str = "", importtime: int = 0
+) -> dict:
+    names = scenarios or list(SCENARIOS)
+    report = {"repeat": repeat, "scenarios": {}}
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline_root = extract_revision(baseline, tmp) if baseline else ""
+        for name in names:
+            code = SCENARIOS[name]
+            result = {"current": run_scenario(code, ROOT, repeat)}
+            if baseline_root:
+                result["baseline"] = run_scenario(code, baseline_root, repeat)
+                result["speedup"] = round(
+                    result["baseline"]["median_ms"]
+                    / max(result["current"]["median_ms"], 1e-3),
+                    2,
+                )
+            if importtime:
+                result["slowest_imports"] = slowest_imports(code, ROOT, importtime)
+            report["scenarios"][name] = result
+    if baseline:
+        report["baseline"] = baseline
+    return report
+
+
+def format_report(report: dict) -> str:
+    lines = []
+    for name, result in report["scenarios"].items():
+        current = result["current"]
+        line = (
+            f"{name:<12} {current['median_ms']:>8.1f} ms"
+            f"  {current['modules']:>5} modules"
+        )
+        if "baseline" in result:
+            baseline = result["baseline"]
+            line += (
+                f"  | {report['baseline']}: {baseline['median_ms']:.1f} ms,"
+                f" {baseline['modules']} modules ({result['speedup']}x)"
+            )
+        lines.append(line)
+        lines.append(f"{'':<12} heavy: {', '.join(current['heavy']) or '-'}")
+        for row in result.get("slowest_imports", []):
+            lines.append(
+                f"{'':<12} {row['self_ms']:>8.1f} ms self"
+                f"  {row['cumulative_ms']:>8.1f} ms cum  {row['module']}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.import_time",
+        description="Measure the cold-start import time of OxyGent.",
+    )
+    parser.add_argument(
+        "-s",
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Scenario to run, repeatable (default: all)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Interpreters/scenario")
+    parser.add_argument("--baseline", default="", help="Git revision to compare to")
+    parser.add_argument(
+        "--importtime", type=int, default=0, help="Show the N slowest imports"
+    )
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    report = run_import_benchmarks(
+        args.scenario, args.repeat, args.baseline, args.importtime
+    )
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+"""Load generator for the ``/chat``, ``/sse/chat`` and ``/async/chat`` endpoints.
+
+Drives a running MAS either open-loop at a target rate (``--rps``) or closed-loop
+with a fixed number of virtual users (``--concurrency``). Every arrival starts a
+session of ``--turns`` chained requests: each turn after the first sends the
+``from_trace_id`` of the previous one, like a multi-turn conversation in the web
+UI. Payloads can carry attachments and group_data.
+
+Measured per request, recorded in HDR histograms (microseconds):
+
+    - ``latency``: until the full response (``/chat``) or the acknowledgement
+      (``/async/chat``) is received, or the SSE stream is closed
+    - ``time_to_first_event``: first SSE event (``/sse/chat`` only)
+    - ``time_to_answer``: first SSE ``answer`` message (``/sse/chat`` only)
+
+In open-loop mode times are measured from the *scheduled* start, so a slow
+server is not hidden by the load generator falling behind (coordinated omission).
+
+Usage:
+    python -m benchmarks.loadgen --url http://127.0.0.1:8080 --endpoint sse \\
+        --rps 50 --duration 60 --turns 3 --output report.json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Optional
+
+import httpx
+
+from .hdr_histogram import HdrHistogram
+
+ENDPOINTS = {
+    "chat": "/chat",
+    "sse": "/sse/chat",
+    "async": "/async/chat",
+}
+
+DEFAULT_QUERIES = [
+    "What time is it now?",
+    "Summarize the attached document in three sentences.",
+    "Compute 123 * 456 and explain the steps.",
+    "Which tools can you use? List them briefly.",
+]
+
+
+@dataclass
+class PayloadFactory:
+    """Build realistic chat payloads."""
+
+    queries: list = field(default_factory=lambda: list(DEFAULT_QUERIES))
+    attachments: list = field(default_factory=list)
+    attachment_ratio: float = 0.0
+    group_data: dict = field(default_factory=dict)
+    n_users: int = 100
+
+    def build(self, session_id: int, turn: int, from_trace_id: str = "") -> dict:
+        payload = {
+            "query": self.queries[(session_id + turn) % len(self.queries)],
+            "current_trace_id": uuid.uuid4().hex,
+            "group_data": {
+                **self.group_data,
+                "user_id": f"user-{session_id % self.n_users}",
+            },
+        }
+        if from_trace_id:
+            payload["from_trace_id"] = from_trace_id
+        if self.attachments and random.random() < self.attachment_ratio:
+            payload["attachments"] = [random.choice(self.attachments)]
+        return payload
+
+
+@dataclass
+class LoadStats:
+    latency: HdrHistogram = field(default_factory=HdrHistogram)
+    time_to_first_event: HdrHistogram = field(default_factory=HdrHistogram)
+    time_to_answer: HdrHistogram = field(default_factory=HdrHistogram)
+    requests: int = 0
+    ok: int = 0
+    errors: dict = field(default_factory=dict)
+    dropped: int = 0
+
+    def add_error(self, kind: str):
+        self.errors[kind] = self.errors.get(kind, 0) + 1
+
+
+def _elapsed_us(start: float) -> int:
+    return int((time.perf_counter() - start) * 1e6)
+
+
+class LoadGenerator:
+    """Send chat sessions to one endpoint of a MAS and collect statistics."""
+
+    def __init__(
+        self,
+        url: str,
+        endpoint: str = "chat",
+        turns: int = 1,
+        timeout: float = 300.0,
+        payload_factory: Optional[PayloadFactory] = None,
+        max_in_flight: int = 1000,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.path = ENDPOINTS[endpoint]
+        self.endpoint = endpoint
+        self.turns = turns
+        self.payload_factory = payload_factory or PayloadFactory()
+        self.max_in_flight = max_in_flight
+        self.stats = LoadStats()
+        self._in_flight = 0
+        self._client = httpx.AsyncClient(
+            base_url=url,
+            timeout=timeout,
+            transport=transport,
+            limits=httpx.Limits(max_connections=max_in_flight),
+        )
+
+    async def close(self):
+        await self._client.aclose()
+
+    async def _send(self, payload: dict, start: float) -> bool:
+        stats = self.stats
+        stats.requests += 1
+        try:
+            if self.endpoint != "sse":
+                response = await self._client.post(self.path, json=payload)
+                stats.latency.record(_elapsed_us(start))
+                if response.status_code != 200:
+                    stats.add_error(str(response.status_code))
+                    return False
+                stats.ok += 1
+                return True
+
+            is_first_event, is_answered = True, False
+            async with self._client.stream("POST", self.path, json=payload) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    stats.latency.record(_elapsed_us(start))
+                    stats.add_error(str(response.status_code))
+                    return False
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    if is_first_event:
+                        stats.time_to_first_event.record(_elapsed_us(start))
+                        is_first_event = False
+                    if not is_answered and '"answer"' in line:
+                        try:
+                            message = json.loads(line[5:])
+                        except json.JSONDecodeError:
+                            continue
+                        if (
+                            isinstance(message, dict)
+                            and message.get("type") == "answer"
+                        ):
+                            stats.time_to_answer.record(_elapsed_us(start))
+                            is_answered = True
+            stats.latency.record(_elapsed_us(start))
+            if not is_answered:
+                stats.add_error("no_answer")
+                return False
+            stats.ok += 1
+            return True
+        except httpx.HTTPError as e:
+            stats.latency.record(_elapsed_us(start))
+            stats.add_error(type(e).__name__)
+            return False
+
+    async def run_session(self, session_id: int, start: Optional[float] = None):
+        """Run the chained turns of one session.
+
+        ``start`` is the scheduled start of the first turn in open-loop mode.
+        """
+        self._in_flight += 1
+        try:
+            from_trace_id = ""
+            for turn in range(self.turns):
+                payload = self.payload_factory.build(session_id, turn, from_trace_id)
+                turn_start = start if (start and turn == 0) else time.perf_counter()
+                if not await self._send(payload, turn_start):
+                    break
+                from_trace_id = payload["current_trace_id"]
+        finally:
+            self._in_flight -= 1
+
+    async def run_open_loop(self, rps: float, duration: float):
+        """Start sessions at a fixed rate for ``duration`` seconds."""
+        tasks = set()
+        begin = time.perf_counter()
+        for session_id in itertools.count():
+            offset = session_id / rps
+            if offset >= duration:
+                break
+            scheduled = begin + offset
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if self._in_flight >= self.max_in_flight:
+                self.stats.dropped += 1
+                continue
+            task = asyncio.create_task(self.run_session(session_id, scheduled))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        await asyncio.gather(*tasks)
+
+    async def run_closed_loop(self, concurrency: int, duration: float):
+        """Keep ``concurrency`` virtual users busy for ``duration`` seconds."""
+        session_ids = itertools.count()
+        deadline = time.perf_counter() + duration
+
+        async def user():
+            while time.perf_counter() < deadline:
+                await self.run_session(next(session_ids))
+
+        await asyncio.gather(*[user() for _ in range(concurrency)])
+
+    def report(self, wall_time: float, mode: dict) -> dict:
+        stats = self.stats
+        histograms = {
+            "latency": stats.latency,
+            "time_to_first_event": stats.time_to_first_event,
+            "time_to_answer": stats.time_to_answer,
+        }
+        return {
+            "endpoint": self.path,
+            **mode,
+            "turns": self.turns,
+            "wall_time_s": round(wall_time, 3),
+            "requests": stats.requests,
+            "ok": stats.ok,
+            "errors": stats.errors,
+            "error_rate": (
+                round(1 - stats.ok / stats.requests, 4) if stats.requests else 0.0
+            ),
+            "dropped_by_client": stats.dropped,
+            "achieved_rps": round(stats.requests / wall_time, 2) if wall_time else 0.0,
+            "latency_ms": {
+                name: histogram.summary(scale=1000)
+                for name, histogram in histograms.items()
+                if histogram.total_count
+            },
+            "histograms_us": {
+                name: histogram.to_dict()
+                for name, histogram in histograms.items()
+                if histogram.total_count
+            },
+        }
+
+
+async def run_load(
+    url: str,
+    endpoint: str = "chat",
+    rps: float = 0.0,
+    concurrency: int = 0,
+    duration: float = 30.0,
+    turns: int = 1,
+    payload_factory: Optional[PayloadFactory] = None,
+    max_in_flight: int = 1000,
+    timeout: float = 300.0,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> dict:
+    """Run one load test and return its report."""
+    if bool(rps) == bool(concurrency):
+        raise ValueError("Exactly one of rps and concurrency must be given")
+    generator = LoadGenerator(
+        url,
+        endpoint=endpoint,
+        turns=turns,
+        timeout=timeout,
+        payload_factory=payload_factory,
+        max_in_flight=max_in_flight,
+        transport=transport,
+    )
+    begin = time.perf_counter()
+    try:
+        if rps:
+            await generator.run_open_loop(rps, duration)
+            mode = {"mode": "open_loop", "target_rps": rps}
+        else:
+            await generator.run_closed_loop(concurrency, duration)
+            mode = {"mode": "closed_loop", "concurrency": concurrency}
+    finally:
+        await generator.close()
+    return generator.report(time.perf_counter() - begin, mode)
+
+
+def format_report(report: dict) -> str:
+    lines = [
+        f"{report['endpoint']} {report['mode']}: {report['requests']} requests in"
+        f" {report['wall_time_s']}s ({report['achieved_rps']} rps),"
+        f" error rate {report['error_rate']:.2%}",
+    ]
+    if report["errors"]:
+        lines.append(f"  errors: {report['errors']}")
+    if report["dropped_by_client"]:
+        lines.append(f"  dropped by client: {report['dropped_by_client']}")
+    for name, summary in report["latency_ms"].items():
+        lines.append(
+            f"  {name:<20} p50 {summary['p50']:.1f}  p90 {summary['p90']:.1f}"
+            f"  p99 {summary['p99']:.1f}  p99.9 {summary['p99.9']:.1f}"
+            f"  max {summary['max']:.1f} ms"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.loadgen",
+        description="Drive the chat endpoints of a running MAS.",
+    )
+    parser.add_argument("--url", default="http://127.0.0.1:8080")
+    parser.add_argument("--endpoint", choices=sorted(ENDPOINTS), default="chat")
+    parser.add_argument("--rps", type=float, default=0.0, help="Open-loop sessions/s")
+    parser.add_argument("--concurrency", type=int, default=0, help="Virtual users")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds")
+    parser.add_argument("--turns", type=int, default=1, help="Chained turns/session")
+    parser.add_argument("--queries", help="File with one query per line")
+    parser.add_argument(
+        "--attachment", action="append", default=[], help="Attachment URL, repeatable"
+    )
+    parser.add_argument(
+        "--attachment-ratio", type=float, default=0.0, help="Share with attachments"
+    )
+    parser.add_argument(
+        "--group-data", default="{}", help="JSON group_data sent with every request"
+    )
+    parser.add_argument("--max-in-flight", type=int, default=1000)
+    parser.add_argument("--timeout", type=float, default=300.0)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+    if bool(args.rps) == bool(args.concurrency):
+        parser.error("exactly one of --rps and --concurrency is required")
+
+    payload_factory = PayloadFactory(
+        attachments=args.attachment,
+        attachment_ratio=args.attachment_ratio,
+        group_data=json.loads(args.group_data),
+    )
+    if args.queries:
+        with open(args.queries, encoding="utf-8") as f:
+            payload_factory.queries = [line.strip() for line in f if line.strip()]
+
+    report = asyncio.run(
+        run_load(
+            args.url,
+            endpoint=args.endpoint,
+            rps=args.rps,
+            concurrency=args.concurrency,
+            duration=args.duration,
+            turns=args.turns,
+            payload_factory=payload_factory,
+            max_in_flight=args.max_in_flight,
+            timeout=args.timeout,
+        )
+    )
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""OpenAI / Ollama / Gemini compatible mock LLM server for load tests.
+
+Speaks the endpoints ``HttpLLM`` targets, so a whole deployment (HTTP layer, SSE,
+Redis, ES writes) can be driven without GPUs or network access:
+
+    - ``POST /chat/completions`` and ``/v1/chat/completions`` (OpenAI, SSE stream)
+    - ``POST /api/chat`` (Ollama, NDJSON stream)
+    - ``POST /models/{model}:generateContent`` and ``:streamGenerateContent`` (Gemini)
+
+Answers follow a ReAct script (see :func:`benchmarks.fake_llm.scripted_response`)
+with configurable time-to-first-token, tokens per second, error rate and 429
+injection. Point an ``HttpLLM`` at it with ``base_url="http://127.0.0.1:8001"``
+(add an ``api_key`` for the OpenAI protocol, leave it out for Ollama).
+
+Usage:
+    python -m benchmarks.mock_llm_server --port 8001 --ttft 0.2 --tokens-per-sec 50
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass, field
+
+from .fake_llm import scripted_response
+
+
+@dataclass
+class MockLLMConfig:
+    ttft: float = 0.0
+    tokens_per_sec: float = 0.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after: int = 1
+    tool_calls: list = field(default_factory=list)
+    answer: str = "This is the answer from the mock LLM."
+    model_name: str = "mock-llm"
+
+
+@dataclass
+class MockLLMStats:
+    requests: int = 0
+    streamed: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+    completion_tokens: int = 0
+
+
+def _tokenize(text: str) -> list:
+    """Split ``text`` into word-sized tokens that concatenate back to it."""
+    tokens = []
+    for i, word in enumerate(text.split(" ")):
+        tokens.append(word if i == 0 else " " + word)
+    return tokens
+
+
+def _count_prompt_tokens(messages: list) -> int:
+    return sum(len(str(message.get("content", "")).split()) for message in messages)
+
+
+def create_app(config: MockLLMConfig = None):
+    """Build the FastAPI app of the mock server."""
+    from fastapi import FastAPI, Request
+    from fastapi.responses import JSONResponse, StreamingResponse
+
+    config = config or MockLLMConfig()
+    stats = MockLLMStats()
+    app = FastAPI()
+    app.state.config = config
+    app.state.stats = stats
+
+    async def inject_failure():
+        """Return an error response if one is drawn, else ``None``."""
+        draw = random.random()
+        if draw < config.rate_limit_rate:
+            stats.rate_limited += 1
+            return JSONResponse(
+                status_code=429,
+                headers={"Retry-After": str(config.retry_after)},
+                content={"error": {"message": "Rate limit exceeded (mock)"}},
+            )
+        if draw < config.rate_limit_rate + config.error_rate:
+            stats.errors += 1
+            return JSONResponse(
+                status_code=500,
+                content={"error": {"message": "Internal error (mock)"}},
+            )
+        return None
+
+    async def generate_tokens(answer: str):
+        """Yield the tokens of ``answer`` paced by ttft and tokens_per_sec."""
+        tokens = _tokenize(answer)
+        stats.completion_tokens += len(tokens)
+        if config.ttft:
+            await asyncio.sleep(config.ttft)
+        interval = 1.0 / config.tokens_per_sec if config.tokens_per_sec else 0.0
+        for i, token in enumerate(tokens):
+            if interval and i:
+                await asyncio.sleep(interval)
+            yield token
+
+    async def full_answer(messages: list) -> tuple:
+        answer = scripted_response(messages, config.tool_calls, config.answer)
+        tokens = [token async for token in generate_tokens(answer)]
+        return answer, len(tokens)
+
+    async def read_request(request: Request) -> dict:
+        stats.requests += 1
+        return await request.json()
+
+    @app.post("/chat/completions")
+    @app.post("/v1/chat/completions")
+    async def openai_chat(request: Request):
+        payload = await read_request(request)
+        failure = await inject_failure()
+        if failure is not None:
+            return failure
+        messages = payload.get("messages", [])
+        model = payload.get("model", config.model_name)
+        created = int(time.time())
+        if payload.get("stream"):
+            stats.streamed += 1
+            answer = scripted_response(messages, config.tool_calls, config.answer)
+
+            async def event_stream():
+                async for token in generate_tokens(answer):
+                    chunk = {
+                        "id": "chatcmpl-mock",
+                        "object": "chat.completion.chunk",
+                        "created": created,
+                        "model": model,
+                        "choices": [
+                            {
+                                "index": 0,
+                                "delta": {"content": token},
+                                "finish_reason": None,
+                            }
+                        ],
+                    }
+                    yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+                yield "data: [DONE]\n\n"
+
+            return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+        answer, completion_tokens = await full_answer(messages)
+        prompt_tokens = _count_prompt_tokens(messages)
+        return {
+            "id": "chatcmpl-mock",
+            "object": "chat.completion",
+            "created": created,
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": answer},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    @app.post("/api/chat")
+    async def ollama_chat(request: Request):
+        payload = await read_request(request)
+        failure = await inject_failure()
+        if failure is not None:
+            return failure
+        messages = payload.get("messages", [])
+        model = payload.get("model", config.model_name)
+        if payload.get("stream"):
+            stats.streamed += 1
+            answer = scripted_response(messages, config.tool_calls, config.answer)
+
+            async def ndjson_stream():
+                async for token in generate_tokens(answer):
+                    chunk = {
+                        "model": model,
+                        "message": {"role": "assistant", "content": token},
+                        "done": False,
+                    }
+                    yield json.dumps(chunk, ensure_ascii=False) + "\n"
+                yield json.dumps({"model": model, "done": True}) + "\n"
+
+            return StreamingResponse(ndjson_stream(), media_type="application/x-ndjson")
+
+        answer, completion_tokens = await full_answer(messages)
+        return {
+            "model": model,
+            "message": {"role": "assistant", "content": answer},
+            "done": True,
+            "prompt_eval_count": _count_prompt_tokens(messages),
+            "eval_count": completion_tokens,
+        }
+
+    @app.post("/models/{model_action}")
+    @app.post("/v1beta/models/{model_action}")
+    async def gemini_generate(model_action: str, request: Request):
+        payload = await read_request(request)
+        failure = await inject_failure()
+        if failure is not None:
+            return failure
+        messages = [
+            {
+                "role": "user" if content.get("role") == "user" else "assistant",
+                "content": "".join(
+                    part.get("text", "") for part in content.get("parts", [])
+                ),
+            }
+            for content in payload.get("contents", [])
+        ]
+
+        def candidate(text):
+            return {
+                "content": {"role": "model", "parts": [{"text": text}]},
+                "finishReason": "STOP",
+            }
+
+        if model_action.endswith(":streamGenerateContent"):
+            stats.streamed += 1
+            answer = scripted_response(messages, config.tool_calls, config.answer)
+
+            async def event_stream():
+                async for token in generate_tokens(answer):
+                    chunk = {"candidates": [candidate(token)]}
+                    yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+
+            return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+        answer, completion_tokens = await full_answer(messages)
+        return {
+            "candidates": [candidate(answer)],
+            "usageMetadata": {
+                "promptTokenCount": _count_prompt_tokens(messages),
+                "candidatesTokenCount": completion_tokens,
+            },
+        }
+
+    @app.get("/stats")
+    async def get_stats():
+        return stats.__dict__
+
+    return app
+
+
+def parse_tool_calls(spec: str) -> list:
+    """Parse ``'tool_a;tool_b:{"x": 1}'`` into (tool_name, arguments) pairs."""
+    tool_calls = []
+    for item in filter(None, (part.strip() for part in spec.split(";"))):
+        tool_name, _, arguments = item.partition(":")
+        tool_calls.append((tool_name, json.loads(arguments) if arguments else {}))
+    return tool_calls
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.mock_llm_server",
+        description="OpenAI / Ollama / Gemini compatible mock LLM server.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--ttft", type=float, default=0.0, help="Time to first token")
+    parser.add_argument(
+        "--tokens-per-sec", type=float, default=0.0, help="0 streams at once"
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 ratio")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429 ratio")
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument(
+        "--tool-calls",
+        default="",
+        help="ReAct script, e.g. 'time_tool;math_tool:{\"a\": 1}'",
+    )
+    parser.add_argument("--answer", default=MockLLMConfig.answer)
+    args = parser.parse_args(argv)
+
+    import uvicorn
+
+    config = MockLLMConfig(
+        ttft=args.ttft,
+        tokens_per_sec=args.tokens_per_sec,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        tool_calls=parse_tool_calls(args.tool_calls),
+        answer=args.answer,
+    )
+    uvicorn.run(
+        create_app(config),
+        host=args.host,
+        port=args.port,
+        log_level="warning",
+        access_log=False,
+    )
+
+
+if __name__ == "__main__":
+    main()
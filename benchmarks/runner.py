@@ -0,0 +1,216 @@
+"""Run a topology through a MAS and collect framework overhead numbers."""
+
+import asyncio
+import inspect
+import logging
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+from oxygent import MAS, Config
+
+from .topologies import TOPOLOGIES, Topology
+
+
+def percentile(values: list, q: float) -> float:
+    """Nearest-rank percentile of ``values``, ``q`` in [0, 100]."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(q / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def _oxy_call_count(mas) -> int:
+    return sum(mas.metrics.oxy_calls.values())
+
+
+class BusyClock:
+    """Calls of a client and the time at least one of them was in flight.
+
+    Concurrent calls, e.g. background writes queued on a LocalEs lock, are
+    counted once, so the busy time never exceeds the wall time.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self._in_flight = 0
+        self._since = 0.0
+
+    def instrument(self, client):
+        if client is None:
+            return
+        for name, _ in inspect.getmembers(type(client), inspect.iscoroutinefunction):
+            if not name.startswith("_") and name != "close":
+                setattr(client, name, self._timed(getattr(client, name)))
+
+    def _timed(self, method):
+        async def wrapper(*args, **kwargs):
+            self.calls += 1
+            if not self._in_flight:
+                self._since = time.perf_counter()
+            self._in_flight += 1
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                self._in_flight -= 1
+                if not self._in_flight:
+                    self.seconds += time.perf_counter() - self._since
+
+        return wrapper
+
+    def snapshot(self) -> tuple:
+        return self.calls, self.seconds
+
+
+def _configure(cache_dir: str):
+    Config.set_app_name("benchmark")
+    Config.set_cache_save_dir(cache_dir)
+    Config.set_metrics_is_enabled(True)
+    Config.set_message_is_stored(False)
+    Config.set_message_is_show_in_terminal(False)
+    Config.set_server_auto_open_webpage(False)
+    Config.set_log_level_root("WARNING")
+    Config.set_log_level_terminal("WARNING")
+    Config.set_log_level_file("WARNING")
+
+
+async def _run_trace(mas, index: int) -> float:
+    start = time.perf_counter()
+    oxy_response = await mas.chat_with_agent(payload={"query": f"benchmark {index}"})
+    latency = time.perf_counter() - start
+    if oxy_response.state.name != "COMPLETED":
+        raise RuntimeError(f"Trace {index} ended in state {oxy_response.state.name}")
+    return latency
+
+
+async def _run_load(mas, n_requests: int, concurrency: int) -> list:
+    latencies = []
+    queue = iter(range(n_requests))
+
+    async def worker():
+        for index in queue:
+            latencies.append(await _run_trace(mas, index))
+
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return latencies
+
+
+async def run_topology(
+    topology: Topology,
+    n_requests: int = 50,
+    concurrency: int = 1,
+    warmup: int = 5,
+    llm_latency: float = 0.0,
+    alloc_requests: int = 10,
+    is_save_data: bool = False,
+) -> dict:
+    """Benchmark one topology and return the report as a dict.
+
+    Args:
+        topology: Topology to run, built with the same ``llm_latency``.
+        n_requests: Measured traces.
+        concurrency: Number of traces in flight at the same time.
+        warmup: Traces run (and discarded) before measuring.
+        llm_latency: Scripted latency of every fake LLM call.
+        alloc_requests: Sequential traces run under tracemalloc, 0 disables.
+        is_save_data: Whether oxys save their node records to LocalEs. LocalEs
+            rewrites an index file per write, so keep ``n_requests`` low.
+    """
+    if not is_save_data:
+        for oxy_instance in topology.oxy_space:
+            oxy_instance.is_save_data = False
+
+    async with MAS(oxy_space=topology.oxy_space) as mas:
+        logging.getLogger().setLevel(logging.WARNING)
+        clocks = {"es": BusyClock(), "redis": BusyClock()}
+        clocks["es"].instrument(mas.es_client)
+        clocks["redis"].instrument(mas.redis_client)
+        await _run_load(mas, warmup, max(1, min(concurrency, warmup)))
+        await asyncio.gather(*mas.background_tasks)
+
+        calls_before = _oxy_call_count(mas)
+        storage_before = {k: clock.snapshot() for k, clock in clocks.items()}
+        start = time.perf_counter()
+        latencies = await _run_load(mas, n_requests, concurrency)
+        wall_time = time.perf_counter() - start
+        drain_start = time.perf_counter()
+        await asyncio.gather(*mas.background_tasks)
+        drain_time = time.perf_counter() - drain_start
+        oxy_calls = (_oxy_call_count(mas) - calls_before) / n_requests
+        storage_after = {k: clock.snapshot() for k, clock in clocks.items()}
+
+        allocations = {}
+        if alloc_requests:
+            tracemalloc.start()
+            base_current, _ = tracemalloc.get_traced_memory()
+            await _run_load(mas, alloc_requests, 1)
+            await asyncio.gather(*mas.background_tasks)
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            allocations = {
+                "peak_kb": round((peak - base_current) / 1024, 1),
+                "retained_kb_per_trace": round(
+                    (current - base_current) / 1024 / alloc_requests, 2
+                ),
+            }
+
+    mean_latency = statistics.fmean(latencies)
+    llm_time = topology.critical_path_llm_calls * llm_latency
+    storage = {}
+    for backend, (calls, seconds) in storage_after.items():
+        calls_before, seconds_before = storage_before[backend]
+        if calls == calls_before:
+            continue
+        storage[backend] = {
+            "calls_per_trace": round((calls - calls_before) / n_requests, 2),
+            "busy_ms_per_trace": round(
+                (seconds - seconds_before) * 1000 / n_requests, 3
+            ),
+        }
+    return {
+        "topology": topology.name,
+        "description": topology.description,
+        "requests": n_requests,
+        "concurrency": concurrency,
+        "llm_latency_ms": llm_latency * 1000,
+        "oxy_calls_per_trace": round(oxy_calls, 2),
+        "throughput_rps": round(n_requests / wall_time, 2),
+        "latency_ms": {
+            "mean": round(mean_latency * 1000, 3),
+            "p50": round(percentile(latencies, 50) * 1000, 3),
+            "p99": round(percentile(latencies, 99) * 1000, 3),
+            "max": round(max(latencies) * 1000, 3),
+        },
+        "overhead_ms_per_trace": round((mean_latency - llm_time) * 1000, 3),
+        "overhead_ms_per_call": round(
+            (mean_latency - llm_time) * 1000 / max(oxy_calls, 1), 3
+        ),
+        "background_drain_ms": round(drain_time * 1000, 3),
+        "storage": storage,
+        "allocations": allocations,
+    }
+
+
+async def run_benchmarks(
+    topology_names: list, cache_dir: str = None, is_save_data: bool = False, **kwargs
+) -> list:
+    """Run several topologies one after the other, each in its own MAS."""
+    topology_kwargs = {
+        k: kwargs.pop(k)
+        for k in ("n_tools", "n_sub_agents", "team_size", "n_steps")
+        if k in kwargs
+    }
+    llm_latency = kwargs.get("llm_latency", 0.0)
+    reports = []
+    with tempfile.TemporaryDirectory(dir=cache_dir) as tmp_dir:
+        _configure(os.path.join(tmp_dir, "cache_dir"))
+        for name in topology_names:
+            topology = TOPOLOGIES[name](llm_latency=llm_latency, **topology_kwargs)
+            reports.append(
+                await run_topology(topology, is_save_data=is_save_data, **kwargs)
+            )
+    return reports
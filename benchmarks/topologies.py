@@ -0,0 +1,201 @@
+"""Agent topologies used by the benchmarks.
+
+Every builder returns a :class:`Topology` whose LLMs are :class:`FakeLLM`
+instances. ``critical_path_llm_calls`` is the number of LLM calls a trace waits
+for sequentially, so that the scripted LLM latency can be subtracted from the
+measured latency to obtain the framework overhead.
+"""
+
+import json
+from dataclasses import dataclass
+
+from pydantic import Field
+
+from oxygent import oxy
+
+from .fake_llm import FakeLLM
+
+
+@dataclass
+class Topology:
+    name: str
+    oxy_space: list
+    critical_path_llm_calls: int
+    description: str = ""
+
+
+async def echo(text: str = Field("", description="Text to echo back")):
+    return text
+
+
+def _tools(prefix: str, n_tools: int) -> list:
+    return [
+        oxy.FunctionTool(
+            name=f"{prefix}_tool_{i}", desc="Echo the text back", func_process=echo
+        )
+        for i in range(n_tools)
+    ]
+
+
+def _tool_calls(tool_names: list, argument_key: str = "text") -> list:
+    return [(name, {argument_key: f"call {name}"}) for name in tool_names]
+
+
+def build_chat(llm_latency: float = 0.0, **kwargs) -> Topology:
+    """A single ChatAgent answering directly."""
+    return Topology(
+        name="chat",
+        oxy_space=[
+            FakeLLM(name="chat_llm", latency=llm_latency),
+            oxy.ChatAgent(name="chat_agent", is_master=True, llm_model="chat_llm"),
+        ],
+        critical_path_llm_calls=1,
+        description="ChatAgent -> LLM",
+    )
+
+
+def build_react(llm_latency: float = 0.0, n_tools: int = 4, **kwargs) -> Topology:
+    """A ReActAgent calling each of its ``n_tools`` tools once."""
+    tools = _tools("react", n_tools)
+    tool_names = [tool.name for tool in tools]
+    return Topology(
+        name="react",
+        oxy_space=[
+            FakeLLM(
+                name="react_llm",
+                latency=llm_latency,
+                tool_calls=_tool_calls(tool_names),
+            ),
+            *tools,
+            oxy.ReActAgent(
+                name="react_agent",
+                is_master=True,
+                llm_model="react_llm",
+                tools=tool_names,
+            ),
+        ],
+        critical_path_llm_calls=n_tools + 1,
+        description=f"ReActAgent with {n_tools} sequential tool calls",
+    )
+
+
+def build_hierarchical(
+    llm_latency: float = 0.0, n_tools: int = 2, n_sub_agents: int = 3, **kwargs
+) -> Topology:
+    """A master ReActAgent delegating to ``n_sub_agents`` ReAct sub-agents."""
+    oxy_space = []
+    sub_agent_names = []
+    for i in range(n_sub_agents):
+        tools = _tools(f"sub_{i}", n_tools)
+        tool_names = [tool.name for tool in tools]
+        sub_agent_name = f"sub_agent_{i}"
+        oxy_space += [
+            FakeLLM(
+                name=f"sub_llm_{i}",
+                latency=llm_latency,
+                tool_calls=_tool_calls(tool_names),
+            ),
+            *tools,
+            oxy.ReActAgent(
+                name=sub_agent_name,
+                desc=f"Sub agent {i}",
+                llm_model=f"sub_llm_{i}",
+                tools=tool_names,
+            ),
+        ]
+        sub_agent_names.append(sub_agent_name)
+    oxy_space += [
+        FakeLLM(
+            name="master_llm",
+            latency=llm_latency,
+            tool_calls=_tool_calls(sub_agent_names, argument_key="query"),
+        ),
+        oxy.ReActAgent(
+            name="master_agent",
+            is_master=True,
+            llm_model="master_llm",
+            sub_agents=sub_agent_names,
+        ),
+    ]
+    return Topology(
+        name="hierarchical",
+        oxy_space=oxy_space,
+        critical_path_llm_calls=n_sub_agents + 1 + n_sub_agents * (n_tools + 1),
+        description=f"ReAct master -> {n_sub_agents} ReAct sub-agents x {n_tools} tools",
+    )
+
+
+def build_parallel(llm_latency: float = 0.0, team_size: int = 4, **kwargs) -> Topology:
+    """A ParallelAgent fanning out to ``team_size`` ChatAgents."""
+    oxy_space = []
+    member_names = []
+    for i in range(team_size):
+        oxy_space += [
+            FakeLLM(name=f"member_llm_{i}", latency=llm_latency),
+            oxy.ChatAgent(
+                name=f"member_{i}", desc=f"Team member {i}", llm_model=f"member_llm_{i}"
+            ),
+        ]
+        member_names.append(f"member_{i}")
+    oxy_space += [
+        FakeLLM(name="summary_llm", latency=llm_latency),
+        oxy.ParallelAgent(
+            name="parallel_agent",
+            is_master=True,
+            llm_model="summary_llm",
+            sub_agents=member_names,
+        ),
+    ]
+    return Topology(
+        name="parallel",
+        oxy_space=oxy_space,
+        critical_path_llm_calls=2,
+        description=f"ParallelAgent -> {team_size} ChatAgents -> summary",
+    )
+
+
+def build_plan_and_solve(
+    llm_latency: float = 0.0, n_tools: int = 1, n_steps: int = 3, **kwargs
+) -> Topology:
+    """PlanAndSolve with a scripted ``n_steps`` plan executed by a ReActAgent."""
+    tools = _tools("executor", n_tools)
+    tool_names = [tool.name for tool in tools]
+    plan = json.dumps({"steps": [f"step {i}" for i in range(n_steps)]})
+    return Topology(
+        name="plan_and_solve",
+        oxy_space=[
+            FakeLLM(name="planner_llm", latency=llm_latency, answer=plan),
+            oxy.ChatAgent(
+                name="planner_agent", desc="Plan maker", llm_model="planner_llm"
+            ),
+            FakeLLM(
+                name="executor_llm",
+                latency=llm_latency,
+                tool_calls=_tool_calls(tool_names),
+            ),
+            *tools,
+            oxy.ReActAgent(
+                name="executor_agent",
+                desc="Plan executor",
+                llm_model="executor_llm",
+                tools=tool_names,
+            ),
+            oxy.PlanAndSolve(
+                name="plan_and_solve",
+                is_master=True,
+                planner_agent_name="planner_agent",
+                executor_agent_name="executor_agent",
+            ),
+        ],
+        critical_path_llm_calls=1 + n_steps * (n_tools + 1),
+        description=f"PlanAndSolve, {n_steps} steps x {n_tools} tools",
+    )
+
+
+TOPOLOGIES = {
+    "chat": build_chat,
+    "react": build_react,
+    "hierarchical": build_hierarchical,
+    "parallel": build_parallel,
+    "plan_and_solve": build_plan_and_solve,
+}
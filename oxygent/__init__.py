@@ -1,13 +1,26 @@
+from typing import TYPE_CHECKING
+
 from dotenv import load_dotenv
 
 from .config import Config
-from .mas import MAS
-from .oxy import Oxy
-from .oxy_factory import OxyFactory
 from .schemas import OxyOutput, OxyRequest, OxyResponse, OxyState
+from .utils.lazy_import import lazy_module
+
+if TYPE_CHECKING:
+    from .mas import MAS
+    from .oxy import Oxy
+    from .oxy_factory import OxyFactory
 
 load_dotenv(".env")
 
+# Loaded on first access (PEP 562): ``MAS`` pulls in the database clients and
+# the web service, ``OxyFactory`` every operator class
+_LAZY_IMPORTS = {
+    "MAS": ".mas",
+    "Oxy": ".oxy",
+    "OxyFactory": ".oxy_factory",
+}
+
 __all__ = [
     "Oxy",
     "MAS",
@@ -18,3 +31,6 @@ __all__ = [
     "OxyFactory",
     "Config",
 ]
+
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
@@ -0,0 +1,214 @@
+"""admission.py Admission control and load shedding of the chat endpoints.
+
+Every request reaching ``/chat``, ``/sse/chat`` or ``/async/chat`` starts a trace.
+Without a bound, overload shows up as cascading timeouts deep inside the agents.
+The :class:`AdmissionController` caps the number of in-flight traces and puts the
+excess into a bounded FIFO queue:
+
+    - a full queue, or a wait longer than ``max_queue_wait``, sheds the request
+    - CoDel-style adaptive shedding: when even the shortest queueing delay seen
+      over a whole ``codel_interval`` exceeds ``codel_target``, the queue is a
+      standing one and every request that waited longer than the target is shed
+
+Shed requests are answered with HTTP 429 and a ``Retry-After`` header.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import Optional
+
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is shed by the admission controller."""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(f"Request rejected by admission control: {reason}")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Bound the in-flight traces of the MAS web service.
+
+    Args:
+        max_in_flight: Maximum number of traces executed concurrently.
+        max_queue_size: Maximum number of requests waiting for admission.
+        max_queue_wait: Maximum seconds a request may wait for admission.
+        retry_after: Minimum ``Retry-After`` seconds advertised to shed clients.
+        codel_target: Acceptable standing queueing delay in seconds, ``0``
+            disables adaptive shedding.
+        codel_interval: Window in seconds over which the minimum delay is taken.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 64,
+        max_queue_size: int = 128,
+        max_queue_wait: float = 10.0,
+        retry_after: int = 1,
+        codel_target: float = 0.5,
+        codel_interval: float = 5.0,
+    ):
+        self.max_in_flight = max_in_flight
+        self.max_queue_size = max_queue_size
+        self.max_queue_wait = max_queue_wait
+        self.retry_after = retry_after
+        self.codel_target = codel_target
+        self.codel_interval = codel_interval
+
+        self.in_flight = 0
+        self._waiters: deque = deque()
+        self._overloaded = False
+        self._interval_min = math.inf
+        self._interval_end = 0.0
+        self._service_time = 0.0
+
+        self.admitted = 0
+        self.completed = 0
+        self.rejected: dict[str, int] = {
+            "queue_full": 0,
+            "queue_timeout": 0,
+            "codel": 0,
+        }
+        self.total_queue_wait = 0.0
+
+    @classmethod
+    def from_config(cls) -> Optional["AdmissionController"]:
+        """Build the controller from ``Config``, ``None`` if it is disabled."""
+        admission_config = Config.get_admission_config()
+        if not admission_config.get("is_enabled"):
+            return None
+        return cls(
+            max_in_flight=admission_config.get("max_in_flight", 64),
+            max_queue_size=admission_config.get("max_queue_size", 128),
+            max_queue_wait=admission_config.get("max_queue_wait", 10.0),
+            retry_after=admission_config.get("retry_after", 1),
+            codel_target=admission_config.get("codel_target", 0.5),
+            codel_interval=admission_config.get("codel_interval", 5.0),
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def get_retry_after(self) -> int:
+        """Seconds until a slot is likely to be free, at least ``retry_after``."""
+        estimate = self._service_time * (self.queue_depth + 1) / self.max_in_flight
+        return max(self.retry_after, min(math.ceil(estimate), 60))
+
+    def _reject(self, reason: str):
+        self.rejected[reason] += 1
+        logger.warning(
+            f"Request shed by admission control: {reason}, "
+            f"in_flight={self.in_flight}, queue_depth={self.queue_depth}"
+        )
+        return AdmissionRejected(reason, self.get_retry_after())
+
+    def _observe(self, sojourn: float, now: float) -> bool:
+        """Track the queueing delay, return whether the request must be shed."""
+        if now >= self._interval_end:
+            was_overloaded = self._overloaded
+            if self._interval_min != math.inf:
+                # An interval without any dequeue keeps the previous state
+                self._overloaded = bool(self.codel_target) and (
+                    self._interval_min > self.codel_target
+                )
+            if self._overloaded != was_overloaded:
+                logger.warning(
+                    f"Admission control {'entered' if self._overloaded else 'left'} "
+                    f"overload state, min queueing delay={self._interval_min:.3f}s"
+                )
+            self._interval_min = math.inf
+            self._interval_end = now + self.codel_interval
+        if sojourn < self._interval_min:
+            self._interval_min = sojourn
+        return self._overloaded and sojourn > self.codel_target
+
+    def _admit(self, sojourn: float) -> float:
+        self.in_flight += 1
+        self.admitted += 1
+        self.total_queue_wait += sojourn
+        return time.monotonic()
+
+    async def acquire(self) -> float:
+        """Wait for admission.
+
+        Returns:
+            float: Admission time, to be handed back to :meth:`release`.
+
+        Raises:
+            AdmissionRejected: If the request is shed.
+        """
+        if self.in_flight < self.max_in_flight and not self._waiters:
+            self._observe(0.0, time.monotonic())
+            return self._admit(0.0)
+        if len(self._waiters) >= self.max_queue_size:
+            raise self._reject("queue_full")
+
+        future = asyncio.get_running_loop().create_future()
+        waiter = (time.monotonic(), future)
+        self._waiters.append(waiter)
+        try:
+            return await asyncio.wait_for(future, self.max_queue_wait)
+        except asyncio.TimeoutError:
+            self._discard(waiter)
+            raise self._reject("queue_timeout")
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled() and not future.exception():
+                # Admitted right before the cancellation: hand the slot on
+                self.release(future.result())
+            self._discard(waiter)
+            raise
+
+    def _discard(self, waiter):
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def release(self, admitted_at: Optional[float] = None):
+        """Give back the slot of a finished trace and admit the next waiter."""
+        self.in_flight -= 1
+        self.completed += 1
+        if admitted_at is not None:
+            # Exponentially weighted mean, used to estimate Retry-After
+            elapsed = time.monotonic() - admitted_at
+            self._service_time += 0.1 * (elapsed - self._service_time)
+        self._wake_up_next()
+
+    def _wake_up_next(self):
+        while self._waiters and self.in_flight < self.max_in_flight:
+            enqueued_at, future = self._waiters.popleft()
+            if future.done():
+                continue
+            now = time.monotonic()
+            sojourn = now - enqueued_at
+            if self._observe(sojourn, now):
+                future.set_exception(self._reject("codel"))
+                continue
+            future.set_result(self._admit(sojourn))
+
+    def get_stats(self) -> dict:
+        """Counters for load balancers and the metrics endpoint."""
+        return {
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue_size": self.max_queue_size,
+            "overloaded": self._overloaded,
+            "admitted": self.admitted,
+            "completed": self.completed,
+            "rejected": dict(self.rejected),
+            "avg_queue_wait": (
+                self.total_queue_wait / self.admitted if self.admitted else 0.0
+            ),
+            "avg_service_time": self._service_time,
+            "retry_after": self.get_retry_after(),
+        }
@@ -51,6 +51,13 @@ class Config:
             "color_observation": "CYAN",
             "is_detailed_tool_call": True,
             "is_detailed_observation": True,
+            "is_async": True,
+            "queue_size": 10000,
+            "max_bytes": 100 * 1024 * 1024,
+            "backup_count": 5,
+            "file_format": "text",
+            "max_observation_length": 2000,
+            "sample_rate": 1.0,
         },
         "llm": {
             "cls": "oxygent.llms.OllamaLLM",
@@ -72,6 +79,11 @@ class Config:
             "is_send_full_arguments": False,
         },
         "vearch": {},
+        "embedding": {
+            "batch_size": 64,
+            "max_concurrency": 4,
+            "batch_window": 0.005,
+        },
         "es": {},
         "es_schema": {
             "shared_data": {"type": "text"},
@@ -105,7 +117,52 @@ class Config:
         },
         "tool": {
             "mcp_is_keep_alive": True,
+            "mcp_is_manifest_cached": False,
+            "mcp_session_pool_size": 8,
+            "mcp_session_idle_timeout": 60,
+            "mcp_session_health_check_interval": 30,
+            "mcp_ping_interval": 30,
+            "mcp_reconnect_max_delay": 30,
+            "mcp_reconnect_grace_period": 10,
             "is_concurrent_init": True,
+            "init_timeout": 300,
+            "function_executor": "thread",
+            "function_max_threads": 32,
+            "function_max_processes": 0,
+            "function_is_arguments_validated": False,
+            "http_max_connections": 100,
+            "http_max_keepalive": 20,
+            "http_keepalive_expiry": 30,
+            "http_is_http2": False,
+            "http_max_response_size": 1048576,
+        },
+        "scheduler": {
+            "is_enabled": False,
+            "tenant_weights": {},
+            "default_weight": 1,
+            "tenant_key": "tenant",
+            "tenant_header": "x-tenant-id",
+            "categories": ["llm", "tool"],
+        },
+        "admission": {
+            "is_enabled": False,
+            "max_in_flight": 64,
+            "max_queue_size": 128,
+            "max_queue_wait": 10,
+            "retry_after": 1,
+            "codel_target": 0.5,
+            "codel_interval": 5,
+        },
+        "tracing": {
+            "is_enabled": False,
+            "exporter": "memory",
+            "file_path": "",
+            "max_spans": 10000,
+        },
+        "metrics": {
+            "is_enabled": True,
+            "prefix": "oxygent",
+            "buckets": [],
         },
     }
 
@@ -195,12 +252,24 @@ class Config:
     def get_log_level_root(cls):
         return cls.get_module_config("log", "level_root")
 
+    @staticmethod
+    def _get_log_handlers():
+        """Handlers of the root logger, including those behind a log queue."""
+        handlers = []
+        for handler in logging.getLogger().handlers:
+            handlers.append(handler)
+            listener = getattr(handler, "listener", None)
+            if listener is not None:
+                handlers.extend(listener.handlers)
+        return handlers
+
     @classmethod
     def set_log_level_terminal(cls, level_terminal):
         cls.set_module_config("log", "level_terminal", level_terminal)
-        logger = logging.getLogger()
-        for handler in logger.handlers:
-            if isinstance(handler, logging.StreamHandler):
+        for handler in cls._get_log_handlers():
+            if isinstance(handler, logging.StreamHandler) and not isinstance(
+                handler, logging.FileHandler
+            ):
                 handler.setLevel(level_terminal)
 
     @classmethod
@@ -210,8 +279,7 @@ class Config:
     @classmethod
     def set_log_level_file(cls, level_file):
         cls.set_module_config("log", "level_file", level_file)
-        logger = logging.getLogger()
-        for handler in logger.handlers:
+        for handler in cls._get_log_handlers():
             if isinstance(handler, logging.FileHandler):
                 handler.setLevel(level_file)
 
@@ -275,6 +343,62 @@ class Config:
     def get_log_is_detailed_observation(cls):
         return cls.get_module_config("log", "is_detailed_observation")
 
+    @classmethod
+    def set_log_is_async(cls, is_async=True):
+        cls.set_module_config("log", "is_async", is_async)
+
+    @classmethod
+    def get_log_is_async(cls):
+        return cls.get_module_config("log", "is_async")
+
+    @classmethod
+    def set_log_queue_size(cls, queue_size):
+        cls.set_module_config("log", "queue_size", queue_size)
+
+    @classmethod
+    def get_log_queue_size(cls):
+        return cls.get_module_config("log", "queue_size")
+
+    @classmethod
+    def set_log_max_bytes(cls, max_bytes):
+        cls.set_module_config("log", "max_bytes", max_bytes)
+
+    @classmethod
+    def get_log_max_bytes(cls):
+        return cls.get_module_config("log", "max_bytes")
+
+    @classmethod
+    def set_log_backup_count(cls, backup_count):
+        cls.set_module_config("log", "backup_count", backup_count)
+
+    @classmethod
+    def get_log_backup_count(cls):
+        return cls.get_module_config("log", "backup_count")
+
+    @classmethod
+    def set_log_file_format(cls, file_format):
+        cls.set_module_config("log", "file_format", file_format)
+
+    @classmethod
+    def get_log_file_format(cls):
+        return cls.get_module_config("log", "file_format")
+
+    @classmethod
+    def set_log_max_observation_length(cls, max_observation_length):
+        cls.set_module_config("log", "max_observation_length", max_observation_length)
+
+    @classmethod
+    def get_log_max_observation_length(cls):
+        return cls.get_module_config("log", "max_observation_length")
+
+    @classmethod
+    def set_log_sample_rate(cls, sample_rate):
+        cls.set_module_config("log", "sample_rate", sample_rate)
+
+    @classmethod
+    def get_log_sample_rate(cls):
+        return cls.get_module_config("log", "sample_rate")
+
     """ llm """
 
     @classmethod
@@ -442,6 +566,49 @@ class Config:
     def get_vearch_embedding_model_url(cls):
         return cls.get_module_config("vearch", "embedding_model_url")
 
+    @classmethod
+    def set_vearch_backend(cls, backend):
+        cls.set_module_config("vearch", "backend", backend)
+
+    @classmethod
+    def get_vearch_backend(cls):
+        """``"vearch"`` or ``"local"`` for :class:`LocalVectorDB`."""
+        return cls.get_module_config("vearch", "backend", "vearch")
+
+    """ embedding """
+
+    @classmethod
+    def set_embedding_config(cls, embedding_config):
+        cls.set_module_config("embedding", embedding_config)
+
+    @classmethod
+    def get_embedding_config(cls):
+        return cls.get_module_config("embedding")
+
+    @classmethod
+    def set_embedding_batch_size(cls, batch_size):
+        cls.set_module_config("embedding", "batch_size", batch_size)
+
+    @classmethod
+    def get_embedding_batch_size(cls):
+        return cls.get_module_config("embedding", "batch_size")
+
+    @classmethod
+    def set_embedding_max_concurrency(cls, max_concurrency):
+        cls.set_module_config("embedding", "max_concurrency", max_concurrency)
+
+    @classmethod
+    def get_embedding_max_concurrency(cls):
+        return cls.get_module_config("embedding", "max_concurrency")
+
+    @classmethod
+    def set_embedding_batch_window(cls, batch_window):
+        cls.set_module_config("embedding", "batch_window", batch_window)
+
+    @classmethod
+    def get_embedding_batch_window(cls):
+        return cls.get_module_config("embedding", "batch_window")
+
     """ redis """
 
     @classmethod
@@ -596,6 +763,74 @@ class Config:
     def get_tool_mcp_is_keep_alive(cls):
         return cls.get_module_config("tool", "mcp_is_keep_alive")
 
+    @classmethod
+    def set_tool_mcp_is_manifest_cached(cls, mcp_is_manifest_cached):
+        cls.set_module_config("tool", "mcp_is_manifest_cached", mcp_is_manifest_cached)
+
+    @classmethod
+    def get_tool_mcp_is_manifest_cached(cls):
+        return cls.get_module_config("tool", "mcp_is_manifest_cached")
+
+    @classmethod
+    def set_tool_mcp_session_pool_size(cls, mcp_session_pool_size):
+        cls.set_module_config("tool", "mcp_session_pool_size", mcp_session_pool_size)
+
+    @classmethod
+    def get_tool_mcp_session_pool_size(cls):
+        return cls.get_module_config("tool", "mcp_session_pool_size")
+
+    @classmethod
+    def set_tool_mcp_session_idle_timeout(cls, mcp_session_idle_timeout):
+        cls.set_module_config(
+            "tool", "mcp_session_idle_timeout", mcp_session_idle_timeout
+        )
+
+    @classmethod
+    def get_tool_mcp_session_idle_timeout(cls):
+        return cls.get_module_config("tool", "mcp_session_idle_timeout")
+
+    @classmethod
+    def set_tool_mcp_session_health_check_interval(
+        cls, mcp_session_health_check_interval
+    ):
+        cls.set_module_config(
+            "tool",
+            "mcp_session_health_check_interval",
+            mcp_session_health_check_interval,
+        )
+
+    @classmethod
+    def get_tool_mcp_session_health_check_interval(cls):
+        return cls.get_module_config("tool", "mcp_session_health_check_interval")
+
+    @classmethod
+    def set_tool_mcp_ping_interval(cls, mcp_ping_interval):
+        cls.set_module_config("tool", "mcp_ping_interval", mcp_ping_interval)
+
+    @classmethod
+    def get_tool_mcp_ping_interval(cls):
+        return cls.get_module_config("tool", "mcp_ping_interval")
+
+    @classmethod
+    def set_tool_mcp_reconnect_max_delay(cls, mcp_reconnect_max_delay):
+        cls.set_module_config(
+            "tool", "mcp_reconnect_max_delay", mcp_reconnect_max_delay
+        )
+
+    @classmethod
+    def get_tool_mcp_reconnect_max_delay(cls):
+        return cls.get_module_config("tool", "mcp_reconnect_max_delay")
+
+    @classmethod
+    def set_tool_mcp_reconnect_grace_period(cls, mcp_reconnect_grace_period):
+        cls.set_module_config(
+            "tool", "mcp_reconnect_grace_period", mcp_reconnect_grace_period
+        )
+
+    @classmethod
+    def get_tool_mcp_reconnect_grace_period(cls):
+        return cls.get_module_config("tool", "mcp_reconnect_grace_period")
+
     @classmethod
     def set_tool_is_concurrent_init(cls, is_concurrent_init):
         cls.set_module_config("tool", "is_concurrent_init", is_concurrent_init)
@@ -603,3 +838,181 @@ class Config:
     @classmethod
     def get_tool_is_concurrent_init(cls):
         return cls.get_module_config("tool", "is_concurrent_init")
+
+    @classmethod
+    def set_tool_init_timeout(cls, init_timeout):
+        cls.set_module_config("tool", "init_timeout", init_timeout)
+
+    @classmethod
+    def get_tool_init_timeout(cls):
+        return cls.get_module_config("tool", "init_timeout")
+
+    @classmethod
+    def set_tool_function_executor(cls, function_executor):
+        cls.set_module_config("tool", "function_executor", function_executor)
+
+    @classmethod
+    def get_tool_function_executor(cls):
+        return cls.get_module_config("tool", "function_executor")
+
+    @classmethod
+    def set_tool_function_max_threads(cls, function_max_threads):
+        cls.set_module_config("tool", "function_max_threads", function_max_threads)
+
+    @classmethod
+    def get_tool_function_max_threads(cls):
+        return cls.get_module_config("tool", "function_max_threads")
+
+    @classmethod
+    def set_tool_function_max_processes(cls, function_max_processes):
+        cls.set_module_config("tool", "function_max_processes", function_max_processes)
+
+    @classmethod
+    def get_tool_function_max_processes(cls):
+        return cls.get_module_config("tool", "function_max_processes")
+
+    @classmethod
+    def set_tool_function_is_arguments_validated(cls, function_is_arguments_validated):
+        cls.set_module_config(
+            "tool", "function_is_arguments_validated", function_is_arguments_validated
+        )
+
+    @classmethod
+    def get_tool_function_is_arguments_validated(cls):
+        return cls.get_module_config("tool", "function_is_arguments_validated")
+
+    @classmethod
+    def set_tool_http_max_connections(cls, http_max_connections):
+        cls.set_module_config("tool", "http_max_connections", http_max_connections)
+
+    @classmethod
+    def get_tool_http_max_connections(cls):
+        return cls.get_module_config("tool", "http_max_connections")
+
+    @classmethod
+    def set_tool_http_max_keepalive(cls, http_max_keepalive):
+        cls.set_module_config("tool", "http_max_keepalive", http_max_keepalive)
+
+    @classmethod
+    def get_tool_http_max_keepalive(cls):
+        return cls.get_module_config("tool", "http_max_keepalive")
+
+    @classmethod
+    def set_tool_http_keepalive_expiry(cls, http_keepalive_expiry):
+        cls.set_module_config("tool", "http_keepalive_expiry", http_keepalive_expiry)
+
+    @classmethod
+    def get_tool_http_keepalive_expiry(cls):
+        return cls.get_module_config("tool", "http_keepalive_expiry")
+
+    @classmethod
+    def set_tool_http_is_http2(cls, http_is_http2):
+        cls.set_module_config("tool", "http_is_http2", http_is_http2)
+
+    @classmethod
+    def get_tool_http_is_http2(cls):
+        return cls.get_module_config("tool", "http_is_http2")
+
+    @classmethod
+    def set_tool_http_max_response_size(cls, http_max_response_size):
+        cls.set_module_config("tool", "http_max_response_size", http_max_response_size)
+
+    @classmethod
+    def get_tool_http_max_response_size(cls):
+        return cls.get_module_config("tool", "http_max_response_size")
+
+    """ scheduler """
+
+    @classmethod
+    def set_scheduler_config(cls, scheduler_config):
+        cls.set_module_config("scheduler", scheduler_config)
+
+    @classmethod
+    def get_scheduler_config(cls):
+        return cls.get_module_config("scheduler")
+
+    @classmethod
+    def set_scheduler_is_enabled(cls, is_enabled=True):
+        cls.set_module_config("scheduler", "is_enabled", is_enabled)
+
+    @classmethod
+    def get_scheduler_is_enabled(cls):
+        return cls.get_module_config("scheduler", "is_enabled")
+
+    @classmethod
+    def set_scheduler_tenant_weights(cls, tenant_weights):
+        cls.set_module_config("scheduler", "tenant_weights", tenant_weights)
+
+    @classmethod
+    def get_scheduler_tenant_weights(cls):
+        return cls.get_module_config("scheduler", "tenant_weights")
+
+    """ admission """
+
+    @classmethod
+    def set_admission_config(cls, admission_config):
+        cls.set_module_config("admission", admission_config)
+
+    @classmethod
+    def get_admission_config(cls):
+        return cls.get_module_config("admission")
+
+    @classmethod
+    def set_admission_is_enabled(cls, is_enabled=True):
+        cls.set_module_config("admission", "is_enabled", is_enabled)
+
+    @classmethod
+    def get_admission_is_enabled(cls):
+        return cls.get_module_config("admission", "is_enabled")
+
+    @classmethod
+    def set_admission_max_in_flight(cls, max_in_flight):
+        cls.set_module_config("admission", "max_in_flight", max_in_flight)
+
+    @classmethod
+    def get_admission_max_in_flight(cls):
+        return cls.get_module_config("admission", "max_in_flight")
+
+    """ tracing """
+
+    @classmethod
+    def set_tracing_config(cls, tracing_config):
+        cls.set_module_config("tracing", tracing_config)
+
+    @classmethod
+    def get_tracing_config(cls):
+        return cls.get_module_config("tracing")
+
+    @classmethod
+    def set_tracing_is_enabled(cls, is_enabled=True):
+        cls.set_module_config("tracing", "is_enabled", is_enabled)
+
+    @classmethod
+    def get_tracing_is_enabled(cls):
+        return cls.get_module_config("tracing", "is_enabled")
+
+    @classmethod
+    def set_tracing_exporter(cls, exporter):
+        cls.set_module_config("tracing", "exporter", exporter)
+
+    @classmethod
+    def get_tracing_exporter(cls):
+        return cls.get_module_config("tracing", "exporter")
+
+    """ metrics """
+
+    @classmethod
+    def set_metrics_config(cls, metrics_config):
+        cls.set_module_config("metrics", metrics_config)
+
+    @classmethod
+    def get_metrics_config(cls):
+        return cls.get_module_config("metrics")
+
+    @classmethod
+    def set_metrics_is_enabled(cls, is_enabled=True):
+        cls.set_module_config("metrics", "is_enabled", is_enabled)
+
+    @classmethod
+    def get_metrics_is_enabled(cls):
+        return cls.get_module_config("metrics", "is_enabled")
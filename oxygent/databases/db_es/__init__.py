@@ -1,7 +1,22 @@
-from .jes_es import JesEs
-from .local_es import LocalEs
+"""Elasticsearch clients, imported on first use: ``JesEs`` loads ``elasticsearch``."""
+
+from typing import TYPE_CHECKING
+
+from ...utils.lazy_import import lazy_module
+
+if TYPE_CHECKING:
+    from .jes_es import JesEs
+    from .local_es import LocalEs
+
+_LAZY_IMPORTS = {
+    "JesEs": ".jes_es",
+    "LocalEs": ".local_es",
+}
 
 __all__ = [
     "JesEs",
     "LocalEs",
 ]
+
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
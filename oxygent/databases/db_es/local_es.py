@@ -20,6 +20,7 @@ import json
 import locale
 import logging
 import os
+import shutil
 from typing import Any, Dict, Optional
 
 import aiofiles
@@ -64,6 +65,20 @@ class LocalEs(BaseEs):
             if await aiofiles.os.path.exists(tmp_path):
                 await aiofiles.os.unlink(tmp_path)
 
+    async def _backup(self, path: str, backup_path: str) -> None:
+        """Keep the current *path* as *backup_path* without moving it away.
+
+        Unlocked readers such as :meth:`search` must never find the index
+        missing, so the backup is a hard link (a copy where links are not
+        supported) and the index itself is only ever replaced atomically.
+        """
+        if await aiofiles.os.path.exists(backup_path):
+            await aiofiles.os.unlink(backup_path)
+        try:
+            await aiofiles.os.link(path, backup_path)
+        except OSError:
+            await asyncio.to_thread(shutil.copyfile, path, backup_path)
+
     # ------------------------------------------------------------------
     # Encoding‑aware read helper (returns **None** on unrecoverable corruption)
     # ------------------------------------------------------------------
@@ -158,7 +173,7 @@ class LocalEs(BaseEs):
 
             # --- backup & persist ---
             if await aiofiles.os.path.exists(data_path):
-                await aiofiles.os.replace(data_path, backup_path)
+                await self._backup(data_path, backup_path)
             await self._write_json_atomic(data_path, data)
 
         return {"_id": doc_id, "result": "updated" if update_mode else "created"}
@@ -1,15 +1,30 @@
+"""Redis clients, imported on first use: ``JimdbApRedis`` loads ``aioredis``."""
+
 import sys
+from typing import TYPE_CHECKING
+
+from ...utils.lazy_import import lazy_module
 
-if sys.version_info < (3, 11):
+if TYPE_CHECKING:
+    from .base_redis import BaseRedis
     from .jimdb_ap_redis import JimdbApRedis
-else:
-    JimdbApRedis = None
+    from .local_redis import LocalRedis
 
-from .base_redis import BaseRedis
-from .local_redis import LocalRedis
+_LAZY_IMPORTS = {
+    "JimdbApRedis": ".jimdb_ap_redis",
+    "BaseRedis": ".base_redis",
+    "LocalRedis": ".local_redis",
+}
+
+if sys.version_info >= (3, 11):
+    # aioredis does not support Python 3.11+
+    JimdbApRedis = None
 
 __all__ = [
     "JimdbApRedis",
     "BaseRedis",
     "LocalRedis",
 ]
+
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
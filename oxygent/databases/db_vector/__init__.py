@@ -1,7 +1,25 @@
-from .base_vector_db import BaseVectorDB
-from .vearch_db import VearchDB
+"""Vector databases, imported on first use: ``VearchDB`` loads pandas and numpy."""
+
+from typing import TYPE_CHECKING
+
+from ...utils.lazy_import import lazy_module
+
+if TYPE_CHECKING:
+    from .base_vector_db import BaseVectorDB
+    from .local_vector_db import LocalVectorDB
+    from .vearch_db import VearchDB
+
+_LAZY_IMPORTS = {
+    "BaseVectorDB": ".base_vector_db",
+    "LocalVectorDB": ".local_vector_db",
+    "VearchDB": ".vearch_db",
+}
 
 __all__ = [
     "BaseVectorDB",
+    "LocalVectorDB",
     "VearchDB",
 ]
+
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
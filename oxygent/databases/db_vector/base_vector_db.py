@@ -4,6 +4,8 @@ This file defines the abstract base class for vector database services, inheriti
 BaseDB and providing the interface contract for Redis operations.
 """
 
+import hashlib
+import json
 import logging
 from abc import ABC, abstractmethod
 
@@ -12,6 +14,12 @@ from oxygent.databases.base_db import BaseDB
 logger = logging.getLogger(__name__)
 
 
+def tool_doc_id(app_name, agent_name, tool_name, tool_desc):
+    """Document id of a tool, changed by any change of the tool."""
+    key = json.dumps([app_name, agent_name, tool_name, tool_desc], ensure_ascii=False)
+    return hashlib.md5(key.encode("utf-8")).hexdigest()
+
+
 class BaseVectorDB(BaseDB, ABC):
     @abstractmethod
     async def create_space(self, index_name, body):
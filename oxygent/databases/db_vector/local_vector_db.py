@@ -0,0 +1,472 @@
+"""local_vector_db.py In-process Vector Database Module.
+
+``LocalVectorDB`` serves tool retrieval without a Vearch cluster. Each space is a
+matrix of L2-normalized float32 vectors kept in memory and sorted by
+``app_name``/``agent_name``, so a filtered search is an exact dot product over one
+contiguous slice of the matrix. Spaces are persisted under ``persist_dir`` as
+``vectors.npy``, memory-mapped on load, and ``docs.json``. With ``index_type``
+``"ivf"``, slices of at least ``ivf_min_size`` vectors are searched through an
+inverted file index instead, saved next to them as ``ivf.npz``.
+
+It is selected with ``"backend": "local"`` in ``Config.vearch``.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import uuid
+
+import numpy as np
+
+from oxygent.config import Config
+from oxygent.databases.db_vector.base_vector_db import BaseVectorDB, tool_doc_id
+from oxygent.embedding_cache import EmbeddingBatcher, EmbeddingCache, embedding_batcher
+
+logger = logging.getLogger(__name__)
+
+# Fields the rows of a space are sorted by, in this order
+FILTER_FIELDS = ("app_name", "agent_name")
+
+
+def _normalize(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+class IVFIndex:
+    """Inverted file index: the rows grouped by the nearest of ``nlist`` centroids.
+
+    Centroids are trained with spherical k-means on a sample of the vectors, a
+    search scores only the rows of the ``nprobe`` centroids nearest the query.
+    """
+
+    def __init__(self, centroids, rows, offsets):
+        self.centroids = centroids
+        self.rows = rows
+        self.offsets = offsets
+
+    @classmethod
+    def train(cls, vectors, nlist=None, n_iter=8, seed=0):
+        n = len(vectors)
+        nlist = min(n, nlist or int(np.sqrt(n)))
+        rng = np.random.default_rng(seed)
+        sample = np.asarray(vectors[np.sort(rng.choice(n, min(n, nlist * 32), False))])
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)]
+        for _ in range(n_iter):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            # Empty clusters keep their centroid
+            is_empty = np.bincount(assignment, minlength=nlist) == 0
+            centroids = _normalize(np.where(is_empty[:, None], centroids, sums))
+        assignment = np.concatenate(
+            [
+                np.argmax(vectors[i : i + 8192] @ centroids.T, axis=1)
+                for i in range(0, n, 8192)
+            ]
+        )
+        return cls(
+            centroids,
+            np.argsort(assignment, kind="stable"),
+            np.concatenate([[0], np.cumsum(np.bincount(assignment, minlength=nlist))]),
+        )
+
+    def candidates(self, query, nprobe):
+        """Rows of the ``nprobe`` lists nearest to ``query``."""
+        nprobe = min(nprobe, len(self.centroids))
+        lists = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+        return np.concatenate(
+            [self.rows[self.offsets[c] : self.offsets[c + 1]] for c in lists]
+        )
+
+
+class VectorSpace:
+    """The normalized vectors and documents of one space, sorted by the filter
+    fields."""
+
+    def __init__(self, vectors, docs):
+        self.vectors = vectors
+        self.docs = docs
+        self.ivf = None
+        # (app_name,) and (app_name, agent_name) -> (start, end) of their rows
+        self.ranges = {}
+        for row, doc in enumerate(docs):
+            key = ()
+            for field in FILTER_FIELDS:
+                key += (str(doc.get(field, "")),)
+                start, _ = self.ranges.get(key, (row, row))
+                self.ranges[key] = (start, row + 1)
+
+    @classmethod
+    def build(cls, vectors, docs):
+        order = sorted(
+            range(len(docs)),
+            key=lambda i: tuple(str(docs[i].get(f, "")) for f in FILTER_FIELDS),
+        )
+        vectors = _normalize(vectors)[order] if order else np.empty((0, 0), "float32")
+        return cls(vectors, [docs[i] for i in order])
+
+    def _select(self, filter):
+        """``(start, end, mask)`` of the rows matching ``filter``: the filter
+        fields set in order give a slice, other conditions a mask over it."""
+        key = ()
+        for field in FILTER_FIELDS:
+            if filter.get(field) is None:
+                break
+            key += (str(filter[field]),)
+        start, end = self.ranges.get(key, (0, 0)) if key else (0, len(self.docs))
+        conditions = {
+            k: str(v)
+            for k, v in filter.items()
+            if v is not None and k not in FILTER_FIELDS[: len(key)]
+        }
+        if not conditions or start == end:
+            return start, end, None
+        mask = np.array(
+            [
+                all(str(doc.get(k, "")) == v for k, v in conditions.items())
+                for doc in self.docs[start:end]
+            ]
+        )
+        return start, end, mask
+
+    def search(self, query, top_k, filter=None, ivf_min_size=0, nprobe=8):
+        """``[(row, score)]`` of the ``top_k`` rows most similar to ``query``."""
+        start, end, mask = self._select(filter or {})
+        if end <= start or top_k <= 0:
+            return []
+        rows = None
+        if self.ivf is not None and end - start >= ivf_min_size:
+            rows = self.ivf.candidates(query, nprobe)
+            rows = rows[(rows >= start) & (rows < end)]
+            if mask is not None:
+                rows = rows[mask[rows - start]]
+            if len(rows) < top_k:  # The probed lists hold too few matches
+                rows = None
+        if rows is None:
+            rows = np.arange(start, end)
+            scores = self.vectors[start:end] @ query
+            if mask is not None:
+                scores = np.where(mask, scores, -np.inf)
+        else:
+            scores = self.vectors[rows] @ query
+        k = min(top_k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(rows[i]), float(scores[i])) for i in top if scores[i] > -np.inf]
+
+
+class LocalVectorDB(BaseVectorDB):
+    """In-process vector database with the tool retrieval API of VearchDB.
+
+    Config keys, all optional: ``tool_space_name``, ``persist_dir`` (default
+    ``<cache dir>/local_vector_db``), ``embedding_model_url``, ``index_type``
+    (``"flat"`` or ``"ivf"``), ``ivf_min_size`` (10000) and ``ivf_nprobe`` (8).
+    """
+
+    def __init__(self, config=None, emb_func=None):
+        """Initialize the local vector database.
+
+        Args:
+            config: Configuration dictionary, usually ``Config.get_vearch_config()``
+            emb_func: Async function embedding a list of texts. Defaults to the
+                model at ``embedding_model_url``, or to ``get_embedding``
+        """
+        self.config = config or {}
+        self.tool_space_name = self.config.get("tool_space_name", "oxy_tools")
+        self.persist_dir = self.config.get("persist_dir") or os.path.join(
+            Config.get_cache_save_dir(), "local_vector_db"
+        )
+        self.index_type = self.config.get("index_type", "flat")
+        self.ivf_min_size = self.config.get("ivf_min_size", 10000)
+        self.ivf_nprobe = self.config.get("ivf_nprobe", 8)
+        if emb_func is None and "embedding_model_url" in self.config:
+            from .vearch_db import EmbeddingModel
+
+            emb_model = EmbeddingModel(url=self.config["embedding_model_url"])
+            emb_func = EmbeddingBatcher(emb_model.get_embeddings_async).embed
+        self.emb_func = emb_func or embedding_batcher.embed
+        self._spaces = {}
+        self._locks = {}
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _space_dir(self, space_name):
+        return os.path.join(self.persist_dir, space_name)
+
+    def _index(self, space, ivf_file=None):
+        """Attach the IVF index of ``ivf_file``, or a newly trained one."""
+        if self.index_type != "ivf" or len(space.docs) < self.ivf_min_size:
+            return space
+        if ivf_file and os.path.exists(ivf_file):
+            with np.load(ivf_file) as ivf:
+                if len(ivf["rows"]) == len(space.docs):
+                    space.ivf = IVFIndex(ivf["centroids"], ivf["rows"], ivf["offsets"])
+        if space.ivf is None:
+            space.ivf = IVFIndex.train(space.vectors)
+        return space
+
+    def _get_space(self, space_name):
+        """The space loaded in memory, or from disk, or ``None``."""
+        space = self._spaces.get(space_name)
+        if space is None:
+            space_dir = self._space_dir(space_name)
+            if not os.path.exists(os.path.join(space_dir, "docs.json")):
+                return None
+            with open(os.path.join(space_dir, "docs.json"), encoding="utf-8") as f:
+                docs = json.load(f)
+            vectors = np.load(
+                os.path.join(space_dir, "vectors.npy"),
+                mmap_mode="r" if docs else None,
+            )
+            space = self._spaces[space_name] = self._index(
+                VectorSpace(vectors, docs), os.path.join(space_dir, "ivf.npz")
+            )
+        return space
+
+    def _save_space(self, space_name, vectors, docs):
+        """Sort, index and atomically persist a new version of the space."""
+        space = self._index(VectorSpace.build(vectors, docs))
+        space_dir = self._space_dir(space_name)
+        os.makedirs(space_dir, exist_ok=True)
+        with open(os.path.join(space_dir, "vectors.npy.tmp"), "wb") as f:
+            np.save(f, space.vectors)
+        with open(os.path.join(space_dir, "docs.json.tmp"), "w", encoding="utf-8") as f:
+            json.dump(space.docs, f, ensure_ascii=False)
+        # Vectors first: the documents of a version never outlive its vectors
+        os.replace(
+            os.path.join(space_dir, "vectors.npy.tmp"),
+            os.path.join(space_dir, "vectors.npy"),
+        )
+        ivf_file = os.path.join(space_dir, "ivf.npz")
+        if space.ivf is not None:
+            with open(f"{ivf_file}.tmp", "wb") as f:
+                np.savez(
+                    f,
+                    centroids=space.ivf.centroids,
+                    rows=space.ivf.rows,
+                    offsets=space.ivf.offsets,
+                )
+            os.replace(f"{ivf_file}.tmp", ivf_file)
+        elif os.path.exists(ivf_file):
+            os.remove(ivf_file)
+        os.replace(
+            os.path.join(space_dir, "docs.json.tmp"),
+            os.path.join(space_dir, "docs.json"),
+        )
+        self._spaces[space_name] = space
+        return space
+
+    async def _update_space(self, space_name, update):
+        """Apply ``update(vectors, docs) -> (vectors, docs)`` to a space."""
+        lock = self._locks.setdefault(space_name, asyncio.Lock())
+        async with lock:
+            space = self._get_space(space_name)
+            if space is None:
+                vectors, docs = np.empty((0, 0), "float32"), []
+            else:
+                vectors, docs = space.vectors, space.docs
+            vectors, docs = update(vectors, docs)
+            return await asyncio.to_thread(self._save_space, space_name, vectors, docs)
+
+    # ------------------------------------------------------------------
+    # Space operations
+    # ------------------------------------------------------------------
+
+    async def create_space(self, space_name, body=None):
+        """Create an empty space if it does not exist.
+
+        Args:
+            space_name: Name of the space
+            body: Ignored, spaces take the dimension of their first vectors
+        """
+        if not await self.check_space_exist(space_name):
+            await self._update_space(space_name, lambda vectors, docs: (vectors, docs))
+        return True
+
+    async def drop_space(self, space_name):
+        """Delete a space and its files."""
+        self._spaces.pop(space_name, None)
+        space_dir = self._space_dir(space_name)
+        for file_name in ("docs.json", "vectors.npy", "ivf.npz"):
+            path = os.path.join(space_dir, file_name)
+            if os.path.exists(path):
+                os.remove(path)
+        return True
+
+    async def check_space_exist(self, space_name):
+        return self._get_space(space_name) is not None
+
+    async def insert(self, space_name, docs, vectors):
+        """Add documents and their vectors to a space.
+
+        Args:
+            space_name: Name of the space, created if missing
+            docs: List of field dictionaries, ``_id`` is generated if missing
+            vectors: Array of shape ``(len(docs), dimension)``
+
+        Returns:
+            list: The ``_id`` of the inserted documents
+        """
+        docs = [{"_id": uuid.uuid4().hex, **doc} for doc in docs]
+
+        def update(old_vectors, old_docs):
+            if not old_docs:
+                return vectors, docs
+            return np.concatenate([old_vectors, _normalize(vectors)]), old_docs + docs
+
+        await self._update_space(space_name, update)
+        return [doc["_id"] for doc in docs]
+
+    async def delete_by_filter(self, space_name, filter):
+        """Delete the documents whose fields equal all values of ``filter``.
+
+        Returns:
+            int: Number of deleted documents
+        """
+        space = self._get_space(space_name)
+        if space is None:
+            return 0
+        deleted = []
+
+        def update(vectors, docs):
+            keep = [not all(doc.get(k) == v for k, v in filter.items()) for doc in docs]
+            deleted.append(len(docs) - sum(keep))
+            return vectors[np.array(keep, dtype=bool)], [
+                doc for doc, is_kept in zip(docs, keep) if is_kept
+            ]
+
+        await self._update_space(space_name, update)
+        return deleted[0]
+
+    async def search(self, space_name, vector, top_k, filter=None, threshold=None):
+        """Exact (or IVF) inner product search of a normalized ``vector``.
+
+        Returns:
+            list: Documents with their ``_score``, most similar first
+        """
+        space = self._get_space(space_name)
+        if space is None:
+            return []
+        query = _normalize(np.asarray(vector).reshape(-1))
+        hits = space.search(query, top_k, filter, self.ivf_min_size, self.ivf_nprobe)
+        return [
+            {**space.docs[row], "_score": score}
+            for row, score in hits
+            if threshold is None or score > threshold
+        ]
+
+    async def query_search(
+        self, space_name, query, retrieval_nums, fields=[], threshold=None
+    ):
+        """Perform semantic search based on a text query.
+
+        Returns:
+            pd.DataFrame: ``_id``, ``_score`` and the requested ``fields`` (all if
+            empty) of the results
+        """
+        import pandas as pd
+
+        emb = await self.emb_func([query])
+        hits = await self.search(space_name, emb[0], retrieval_nums, None, threshold)
+        if fields:
+            hits = [
+                {k: v for k, v in hit.items() if k in ("_id", "_score", *fields)}
+                for hit in hits
+            ]
+        return pd.DataFrame(hits)
+
+    ##
+    ## NOTE: System-level methods for tool management
+    ##
+    async def create_vearch_table_by_tool_list(self, tool_list):
+        """Synchronize the tools of an app with the tool space.
+
+        Tools are keyed by a hash of their app, agent, name and description: only
+        new or changed tools are embedded, and an unchanged app is not written.
+
+        Args:
+            tool_list: List of tuples containing tool information
+                      Format: [('app_name', 'agent_name', 'tool_name', 'tool_desc'), ...]
+        """
+        app_names = {app_name for app_name, _, _, _ in tool_list}
+        assert len(app_names) == 1, "app_name must be unique"
+        (app_name,) = app_names
+
+        tools = {tool_doc_id(*tool): tool for tool in tool_list}
+        space = self._get_space(self.tool_space_name)
+        existing_ids = {
+            doc["_id"]
+            for doc in (space.docs if space else [])
+            if doc.get("app_name") == app_name
+        }
+        if existing_ids == set(tools):
+            return
+        new_ids = [doc_id for doc_id in tools if doc_id not in existing_ids]
+        docs = [
+            {
+                "_id": doc_id,
+                **dict(
+                    zip(
+                        ("app_name", "agent_name", "tool_name", "tool_desc"),
+                        tools[doc_id],
+                    )
+                ),
+            }
+            for doc_id in new_ids
+        ]
+        if docs:
+            with EmbeddingCache() as embedding:
+                vectors = await embedding.get([doc["tool_desc"] for doc in docs])
+
+        def update(old_vectors, old_docs):
+            keep = [
+                doc.get("app_name") != app_name or doc["_id"] in tools
+                for doc in old_docs
+            ]
+            old_vectors = old_vectors[np.array(keep, dtype=bool)] if old_docs else None
+            old_docs = [doc for doc, is_kept in zip(old_docs, keep) if is_kept]
+            if not docs:
+                return old_vectors, old_docs
+            if not old_docs:
+                return vectors, docs
+            return np.concatenate([old_vectors, _normalize(vectors)]), old_docs + docs
+
+        await self._update_space(self.tool_space_name, update)
+        logger.info(
+            f"Synced the tools of {app_name}: {len(new_ids)} embedded,"
+            f" {len(existing_ids - set(tools))} deleted"
+        )
+
+    async def delete_by_appname(self, app_name):
+        """Delete all tools of an app."""
+        return await self.delete_by_filter(self.tool_space_name, {"app_name": app_name})
+
+    async def tool_retrieval(
+        self,
+        query,
+        app_name=None,
+        agent_name=None,
+        top_k=5,
+        threshold=0.01,
+        *args,
+        **kwargs,
+    ):
+        """Retrieve relevant tools based on query with app and agent filtering.
+
+        Returns:
+            list: List of tool names that match the criteria
+        """
+        emb = await self.emb_func([query])
+        hits = await self.search(
+            self.tool_space_name,
+            emb[0],
+            top_k,
+            {"app_name": app_name, "agent_name": agent_name},
+            threshold,
+        )
+        return [hit["tool_name"] for hit in hits]
@@ -8,14 +8,17 @@ embedding support and advanced filtering capabilities.
 import asyncio
 import base64
 import json
+import logging
 import random
 
 import httpx
 import numpy as np
 import pandas as pd
 
-from oxygent.databases.db_vector.base_vector_db import BaseVectorDB
-from oxygent.embedding_cache import EmbeddingCache
+from oxygent.databases.db_vector.base_vector_db import BaseVectorDB, tool_doc_id
+from oxygent.embedding_cache import EmbeddingBatcher, EmbeddingCache
+
+logger = logging.getLogger(__name__)
 
 
 class VectorToolAsync(object):
@@ -132,6 +135,27 @@ class VectorToolAsync(object):
             response = await client.post(url, data=data_list)
             return response.text
 
+    @staticmethod
+    async def delete_batch(db_name, space_name, router_url, doc_ids):
+        """Delete multiple documents in one request of the bulk API.
+
+        Args:
+            db_name: Name of the target database
+            space_name: Name of the target space
+            router_url: URL of the Vearch router node
+            doc_ids: IDs of the documents to delete
+
+        Returns:
+            str: Text response from the Vearch API
+        """
+        url = f"{router_url}/{db_name}/{space_name}/_bulk"
+        data_list = "".join(
+            json.dumps({"delete": {"_id": doc_id}}) + "\n" for doc_id in doc_ids
+        )
+        async with httpx.AsyncClient() as client:
+            response = await client.post(url, data=data_list)
+            return response.text
+
     @staticmethod
     async def check_info(db_name, space_name, master_url):
         """Check space information and status.
@@ -364,7 +388,8 @@ class VearchDB(BaseVectorDB):
 
         if "embedding_model_url" in config:  # Initalize  embedding function
             emb_model = EmbeddingModel(url=self.config.embedding_model_url)
-            self.emb_func = emb_model.get_embeddings_async
+            # Concurrent queries share one request to the embedding model
+            self.emb_func = EmbeddingBatcher(emb_model.get_embeddings_async).embed
         else:
             self.emb_func = None
 
@@ -549,11 +574,12 @@ class VearchDB(BaseVectorDB):
     ## NOTE: System-level methods for tool management
     ##
     async def create_vearch_table_by_tool_list(self, tool_list):
-        """Initialize Vearch database with tool information for system use.
+        """Synchronize the tools of an app with the system tool space.
 
-        This method creates and populates the system tool space with tool metadata
-        and embeddings for efficient retrieval. It handles the complete workflow
-        from space creation to data upload.
+        Each tool is stored under an id hashed from its app, agent, name and
+        description, so the tools are diffed against the documents of the app:
+        only new or changed tools are embedded and uploaded, and the tools no
+        longer listed are deleted in one bulk request.
 
         Args:
             tool_list: List of tuples containing tool information
@@ -566,33 +592,45 @@ class VearchDB(BaseVectorDB):
         if not await self.check_space_exist(self.config.tool_space_name):
             await self.create_tool_df_space(self.config.tool_space_name)
 
-        df = pd.DataFrame(
-            tool_list, columns=["app_name", "agent_name", "tool_name", "tool_desc"]
-        )
-        # print(df)
-
-        # 1. Generate embeddings for tool dscriptions
-        with EmbeddingCache() as embedding:
-            # Method 1: Individual embedding
-            # for app_name, agent_name, tool_name, tool_desc in tool_list:
-            #     tool_desc_embedding = embedding.get(tool_desc)
-            #     print(tool_desc_embedding)
-
-            # Method 2: Batch embedding
-            tool_desc_embeddings = await embedding.get(list(df["tool_desc"]))
-            df["tool_desc_embedding"] = list(tool_desc_embeddings)
-
-        # 2. Validate single app constraint
-        unique_app_name = df["app_name"].unique()
+        # 1. Validate single app constraint
+        unique_app_name = {tool[0] for tool in tool_list}
         assert len(unique_app_name) == 1, "app_name must be unique"
+        (app_name,) = unique_app_name
 
-        # 3. Clean existing data for this app
-        await self.delete_by_appname(unique_app_name[0])
-
-        # 4. Update new data
-        await self.upload_by_df(df)
-
-        return
+        # 2. Diff the tools against the documents of this app
+        tools = {tool_doc_id(*tool): tool for tool in tool_list}
+        try:
+            existing_ids = set(await self._recall_ids(app_name))
+        except Exception as e:
+            # Upload everything, which overwrites by id; stale tools are left
+            # until a later sync can recall them
+            logger.warning(
+                f"Recalling the tools of {app_name} failed, uploading all of them: {e}"
+            )
+            existing_ids = set()
+        new_ids = [doc_id for doc_id in tools if doc_id not in existing_ids]
+        removed_ids = [doc_id for doc_id in existing_ids if doc_id not in tools]
+
+        # 3. Embed and upload the new or changed tools
+        if new_ids:
+            df = pd.DataFrame(
+                [tools[doc_id] for doc_id in new_ids],
+                columns=["app_name", "agent_name", "tool_name", "tool_desc"],
+            )
+            df["_id"] = new_ids
+            with EmbeddingCache() as embedding:
+                tool_desc_embeddings = await embedding.get(list(df["tool_desc"]))
+                df["tool_desc_embedding"] = list(tool_desc_embeddings)
+            await self.upload_by_df(df)
+
+        # 4. Delete the removed tools
+        if removed_ids:
+            await self.delete_by_ids(app_name, removed_ids)
+
+        logger.info(
+            f"Synced the tools of {app_name}: {len(new_ids)} uploaded,"
+            f" {len(removed_ids)} deleted, {len(tools) - len(new_ids)} unchanged"
+        )
 
     async def upload_by_df(self, df):
         """Upload tool data from DataFrame to Vearch.
@@ -605,6 +643,7 @@ class VearchDB(BaseVectorDB):
         """
         items = ""
         for ind, row in df.iterrows():
+            doc_id = row["_id"] if "_id" in df else None
             # Prepare document data
             data = {
                 "app_name": row["app_name"],
@@ -618,7 +657,13 @@ class VearchDB(BaseVectorDB):
             }
             # Build NDJSON format for bulk insert
             items += (
-                json.dumps({"index": {"_id": self.vearch_tools.generate_random_str()}})
+                json.dumps(
+                    {
+                        "index": {
+                            "_id": doc_id or self.vearch_tools.generate_random_str()
+                        }
+                    }
+                )
                 + "\n"
                 + json.dumps(data)
                 + "\n"
@@ -651,6 +696,63 @@ class VearchDB(BaseVectorDB):
             )
         return
 
+    async def delete_by_ids(self, app_name, doc_ids):
+        """Delete documents of an app in one bulk request.
+
+        Args:
+            app_name: Name of the application owning the documents
+            doc_ids: IDs of the documents to delete
+
+        NOTE:
+            Documents the bulk request reports as not deleted, or all of them
+            when the response is not understood (Vearch versions whose bulk API
+            does not delete), are deleted one request at a time. The documents
+            are not recalled again: the index may still return deleted ones.
+        """
+        response_text = await self.vearch_tools.delete_batch(
+            self.config.db_name,
+            self.config.tool_space_name,
+            self.config.router_url,
+            doc_ids,
+        )
+        remaining = self._failed_bulk_ids(response_text, doc_ids)
+        for i in range(0, len(remaining), 32):
+            await asyncio.gather(
+                *(
+                    self.vearch_tools.delete_by_docid(
+                        self.config.db_name,
+                        self.config.tool_space_name,
+                        self.config.router_url,
+                        doc_id,
+                    )
+                    for doc_id in remaining[i : i + 32]
+                )
+            )
+        return
+
+    @staticmethod
+    def _failed_bulk_ids(response_text, doc_ids):
+        """IDs of a bulk request not confirmed by its response."""
+        try:
+            response = json.loads(response_text)
+        except (TypeError, ValueError):
+            return list(doc_ids)
+        if isinstance(response, dict) and response.get("code", 0) not in (0, 200):
+            return list(doc_ids)
+
+        failed = []
+        items = [response]
+        while items:
+            item = items.pop()
+            if isinstance(item, list):
+                items.extend(item)
+            elif isinstance(item, dict):
+                status = item.get("status")
+                if "_id" in item and isinstance(status, int) and status >= 300:
+                    failed.append(item["_id"])
+                items.extend(item.values())
+        return failed
+
     async def recall_by_appname(self, app_name):
         """Retrieve all document IDs for a specific app name.
 
@@ -660,6 +762,9 @@ class VearchDB(BaseVectorDB):
         Returns:
             list: List of document IDs associated with the app
         """
+        return await self._recall_ids(app_name)
+
+    async def _recall_ids(self, app_name):
         search_query = {
             "query": {
                 "filter": [
@@ -1,15 +1,22 @@
+import asyncio
 import base64
 import hashlib
 import json
 import logging
 import os
 import pickle
+from collections.abc import Mapping
+from contextlib import contextmanager
 
-import httpx
 import numpy as np
-from tqdm import tqdm
 
 from .config import Config
+from .utils.http_client import get_http_client
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
@@ -55,11 +62,10 @@ async def get_embedding(querys):
         }
         headers = {"Accept-Encoding": "identity"}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url=Config.get_vearch_embedding_model_url(), headers=headers, json=data
-            )
-            result = response.json()
+        response = await get_http_client().post(
+            url=Config.get_vearch_embedding_model_url(), headers=headers, json=data
+        )
+        result = response.json()
 
         # ------------------------------------------------------------------
         # The server returns a list whose elements are base64‑encoded strings
@@ -84,68 +90,332 @@ async def get_embedding(querys):
         logger.error(e)
 
 
+class EmbeddingBatcher:
+    """Merge concurrent embedding requests into batched calls.
+
+    Texts passed to :meth:`embed` by different coroutines within
+    ``batch_window`` seconds of each other are sent to the embedding service
+    together, in requests of at most ``max_batch_size`` texts of which at most
+    ``max_concurrency`` run at once.  A text already waiting for a batch is not
+    sent twice.  Unset limits are read from the ``embedding`` settings of
+    :class:`~config.Config` when used.
+
+    Example:
+        >>> vectors = await embedding_batcher.embed(["query", "other query"])
+    """
+
+    def __init__(
+        self,
+        embed_func=None,
+        max_batch_size=None,
+        batch_window=None,
+        max_concurrency=None,
+    ):
+        """
+        Args:
+            embed_func (Callable, optional): ``await embed_func(texts)`` returns
+                the embeddings of a list of texts. Defaults to
+                :func:`get_embedding`.
+        """
+        self.embed_func = embed_func
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+        self.max_concurrency = max_concurrency
+        self.requests = 0
+        self._loop = None
+
+    def _reset(self, loop):
+        self._loop = loop
+        self._queue = {}  # text -> future, in submission order
+        self._timer = None
+        self._tasks = set()
+        self._semaphore = asyncio.Semaphore(
+            self.max_concurrency or Config.get_embedding_max_concurrency()
+        )
+
+    async def embed(self, texts) -> np.ndarray:
+        """Return the embeddings of *texts*, in order, as a 2-D array."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._reset(loop)
+        # The futures are shared with other callers waiting for the same text:
+        # shield them so that cancelling this caller does not cancel theirs.
+        futures = [asyncio.shield(self._submit(text)) for text in texts]
+        return np.array(await asyncio.gather(*futures))
+
+    def _submit(self, text):
+        future = self._queue.get(text)
+        if future is None:
+            future = self._queue[text] = self._loop.create_future()
+            max_batch_size = self.max_batch_size or Config.get_embedding_batch_size()
+            if len(self._queue) >= max_batch_size:
+                self._flush()
+            elif self._timer is None:
+                batch_window = self.batch_window
+                if batch_window is None:
+                    batch_window = Config.get_embedding_batch_window()
+                self._timer = self._loop.call_later(batch_window, self._flush)
+        return future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._queue = self._queue, {}
+        if batch:
+            task = self._loop.create_task(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch):
+        async with self._semaphore:
+            try:
+                self.requests += 1
+                vectors = await (self.embed_func or get_embedding)(list(batch))
+                if vectors is None or len(vectors) != len(batch):
+                    raise ValueError(
+                        f"Embedding service returned no result for {len(batch)} texts"
+                    )
+            except asyncio.CancelledError:
+                for future in batch.values():
+                    future.cancel()
+                raise
+            except Exception as e:
+                for future in batch.values():
+                    if not future.done():
+                        future.set_exception(e)
+                return
+        for future, vector in zip(batch.values(), vectors):
+            if not future.done():
+                future.set_result(vector)
+
+
+embedding_batcher = EmbeddingBatcher()
+
+
+class _EmbeddingView(Mapping):
+    """Read-only ``md5 -> vector`` view of an :class:`EmbeddingCache`."""
+
+    def __init__(self, cache):
+        self._cache = cache
+
+    def __getitem__(self, key_md5):
+        vector = self._cache._lookup(key_md5)
+        if vector is None:
+            raise KeyError(key_md5)
+        return vector
+
+    def __iter__(self):
+        yield from self._cache.rows
+        yield from (k for k in self._cache.pending if k not in self._cache.rows)
+
+    def __len__(self):
+        return len(self._cache.rows) + sum(
+            k not in self._cache.rows for k in self._cache.pending
+        )
+
+
 class EmbeddingCache:
     """Lightweight, disk‑backed cache for text embeddings.
 
     The cache stores the MD5 hash of an input string as the key and its
-    corresponding embedding vector as the value.  Writing to disk is batched to
-    minimise I/O overhead.
+    corresponding embedding vector as the value.  Vectors live in one
+    contiguous ``embeddings.npy`` matrix that is memory-mapped on read, so
+    opening the cache only reads the key index and cached vectors are returned
+    as zero-copy views.  The key index ``embeddings.keys`` is append-only: line
+    *i* holds the MD5 of row *i*.
+
+    New embeddings are buffered and appended every ``save_batch`` inserts and on
+    exit, without rewriting what is already on disk.  Appends hold an exclusive
+    ``flock`` on ``embeddings.lock`` and first pick up the rows appended by other
+    processes, so several processes can share one cache directory.
 
     Example:
-        >>> async with EmbeddingCache() as cache:
+        >>> with EmbeddingCache() as cache:
         ...     vec = await cache.get("hello world")
     """
 
-    def __init__(self, save_batch=1000):
-        """Create a new cache instance and eagerly load any persisted data.
+    def __init__(self, save_batch=1000, dtype="float32"):
+        """Create a new cache instance and read the persisted key index.
 
         Args:
             save_batch (int, optional): Number of *new* embeddings that can
-                accumulate before the in‑memory cache is flushed to disk.
+                accumulate before they are appended to disk.
                 Defaults to ``1000``.
+            dtype (str, optional): ``"float32"`` or ``"float16"``, the type of a
+                new matrix; an existing matrix keeps its own. Defaults to
+                ``"float32"``.
         """
-        self.file = os.path.join(Config.get_cache_save_dir(), "cache.pkl")
+        save_dir = Config.get_cache_save_dir()
+        self.file = os.path.join(save_dir, "embeddings.npy")
+        self.index_file = os.path.join(save_dir, "embeddings.keys")
+        self.lock_file = os.path.join(save_dir, "embeddings.lock")
+        self.legacy_file = os.path.join(save_dir, "cache.pkl")
         self.count = 0
         self.save_batch = save_batch
-        self.data = self.load()
+        self.dtype = np.dtype(dtype)
+        self.dim = None
+        self.rows = {}  # md5 -> row of the matrix
+        self.pending = {}  # md5 -> vector not written yet
+        self._n_rows = 0
+        self._index_offset = 0
+        self._matrix = None
+        self.load()
+
+    @property
+    def data(self):
+        """Read-only mapping of every cached ``md5 -> vector``."""
+        return _EmbeddingView(self)
 
     @staticmethod
     def get_md5(key):
         """Return the 32‑character MD5 hex digest for *key*."""
         return hashlib.md5(key.encode("utf-8")).hexdigest()
 
+    @contextmanager
+    def _lock(self, shared=False):
+        if fcntl is None:  # Windows: no cross-process locking
+            yield
+            return
+        with open(self.lock_file, "a") as f:
+            fcntl.flock(f, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _read_header(f):
+        """``(shape, dtype, data offset)`` of the open ``.npy`` file *f*."""
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, _, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, _, dtype = np.lib.format.read_array_header_2_0(f)
+        return shape, dtype, f.tell()
+
+    def _read_index(self):
+        """Read the keys appended to the index since the last read."""
+        if not os.path.exists(self.index_file):
+            return
+        with open(self.index_file, "rb") as f:
+            f.seek(self._index_offset)
+            chunk = f.read()
+        # A line without newline is an append cut short, it has no row yet
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].decode("ascii").splitlines():
+            self.rows.setdefault(line, self._n_rows)
+            self._n_rows += 1
+        self._index_offset += end
+
     def load(self):
-        """Load the on‑disk cache if it exists; otherwise, return an empty dict."""
-        if not os.path.exists(self.file):
-            return dict()
-        with open(self.file, "rb") as f:
-            return pickle.load(f)
+        """Read the key index; vectors are memory-mapped on first access.
+
+        A ``cache.pkl`` written by older versions is imported once.
+        """
+        with self._lock(shared=True):
+            self._read_index()
+            if os.path.exists(self.file):
+                with open(self.file, "rb") as f:
+                    shape, self.dtype, _ = self._read_header(f)
+                self.dim = shape[1]
+        if not self.rows and os.path.exists(self.legacy_file):
+            with open(self.legacy_file, "rb") as f:
+                legacy = pickle.load(f)
+            for key_md5, value in legacy.items():
+                self._add(key_md5, value)
+            self.save()
+            logger.info(f"Imported {len(legacy)} embeddings from {self.legacy_file}")
+
+    def _append(self, vectors):
+        """Write *vectors* after the last indexed row, then index their keys."""
+        matrix = np.stack(list(vectors.values())).astype(self.dtype, copy=False)
+        n_rows = self._n_rows + len(matrix)
+        is_new = not os.path.exists(self.file)
+        with open(self.file, "w+b" if is_new else "r+b") as f:
+            if is_new:
+                offset = None
+            else:
+                shape, dtype, offset = self._read_header(f)
+                if dtype != self.dtype or shape[1] != matrix.shape[1]:
+                    raise ValueError(
+                        f"Embeddings of {matrix.shape[1]} {self.dtype} do not match"
+                        f" the cache of {shape[1]} {dtype}"
+                    )
+            # The header leaves room for the row count to grow, so rewriting
+            # it in place keeps the rows at the same offset
+            f.seek(0)
+            np.lib.format.write_array_header_1_0(
+                f,
+                {
+                    "descr": np.lib.format.dtype_to_descr(self.dtype),
+                    "fortran_order": False,
+                    "shape": (n_rows, matrix.shape[1]),
+                },
+            )
+            if offset is not None and f.tell() != offset:
+                raise ValueError(f"Cannot grow the header of {self.file}")
+            f.seek(f.tell() + self._n_rows * matrix.shape[1] * self.dtype.itemsize)
+            f.write(matrix.tobytes())
+        # Rows are written before their keys: a key always points to a row
+        with open(self.index_file, "ab") as f:
+            f.truncate(self._index_offset)
+            f.write("".join(f"{key_md5}\n" for key_md5 in vectors).encode("ascii"))
+        self._read_index()
 
-    # TODO: save embeddings
     def save(self):
-        """Persist the in‑memory cache to disk (no‑op if nothing new)."""
-        if not self.count:
+        """Append the new embeddings to disk (no‑op if nothing new)."""
+        if not self.pending:
             return
         try:
-            with open(self.file, "wb") as f:
-                pickle.dump(self.data, f)
+            with self._lock():
+                self._read_index()
+                vectors = {
+                    key_md5: vector
+                    for key_md5, vector in self.pending.items()
+                    if key_md5 not in self.rows
+                }
+                if vectors:
+                    self._append(vectors)
+            self.pending.clear()
             self.count = 0
         except Exception as e:
-            logger.error("Failed to save embedding cache", e)
+            logger.error(f"Failed to save embedding cache: {e}")
+
+    def _lookup(self, key_md5):
+        if key_md5 in self.pending:
+            return self.pending[key_md5]
+        row = self.rows.get(key_md5)
+        if row is None:
+            return None
+        if self._matrix is None or row >= len(self._matrix):
+            self._matrix = np.load(self.file, mmap_mode="r")
+        return self._matrix[row]
+
+    def _add(self, key_md5, value):
+        vector = np.asarray(value, dtype=self.dtype).reshape(-1)
+        if self.dim is None:
+            self.dim = len(vector)
+        elif len(vector) != self.dim:
+            raise ValueError(f"Expected an embedding of {self.dim}, got {len(vector)}")
+        self.pending[key_md5] = vector
+        self.count += 1
 
     # ---------------------------------------------------------------------
     # Public API
     # ---------------------------------------------------------------------
 
     def is_in(self, key):
-        return self.get_md5(key) in self.data
+        key_md5 = self.get_md5(key)
+        return key_md5 in self.rows or key_md5 in self.pending
 
     def set(self, key, value):
-        self.data[self.get_md5(key)] = value
-        self.count += 1
-        if self.count % self.save_batch == 0:
+        key_md5 = self.get_md5(key)
+        if key_md5 in self.rows:
+            return
+        self._add(key_md5, value)
+        if self.count >= self.save_batch:
             self.save()
-            self.count = 0
 
     async def get(self, key):
         """Return cached or freshly computed embeddings."""
@@ -155,48 +425,25 @@ class EmbeddingCache:
             return await self._get_single(key)
 
     async def _get_multiple(self, keys):
-        feature_list = []
-        texts = []
-
-        for k in tqdm(keys, desc="embedding tools"):
-            feature = await self._get_or_queue(k, texts)
-            if feature is not None:
-                feature_list.append(feature)
-
-            # Send queued texts if any
-            if len(texts) >= 1:
-                features = await self._embed_and_cache(texts)
-                feature_list.extend(features)
-                texts.clear()
-
-        # Final flush for remaining texts
+        keys = list(keys)
+        features = [self._lookup(self.get_md5(k)) for k in keys]
+        texts = list(dict.fromkeys(k for k, f in zip(keys, features) if f is None))
         if texts:
-            features = await self._embed_and_cache(texts)
-            feature_list.extend(features)
-
-        return np.array(feature_list)
+            # One call: the batcher splits it into concurrent batched requests
+            embedded = dict(zip(texts, await embedding_batcher.embed(texts)))
+            for content, feature in embedded.items():
+                self.set(content, feature)
+            features = [embedded[k] if f is None else f for k, f in zip(keys, features)]
+        return np.array(features)
 
     async def _get_single(self, key):
-        key_md5 = self.get_md5(key)
-        if key_md5 in self.data:
-            return self.data[key_md5]
-        feature = (await get_embedding([key]))[0]
+        feature = self._lookup(self.get_md5(key))
+        if feature is not None:
+            return feature
+        feature = (await embedding_batcher.embed([key]))[0]
         self.set(key, feature)
         return feature
 
-    async def _get_or_queue(self, key, texts):
-        key_md5 = self.get_md5(key)
-        if key_md5 in self.data:
-            return self.data[key_md5]
-        texts.append(key)
-        return None
-
-    async def _embed_and_cache(self, texts):
-        features = await get_embedding(texts)
-        for content, feature in zip(texts, features):
-            self.set(content, feature)
-        return features
-
     def __enter__(self):
         return self
 
@@ -13,15 +13,27 @@ The implementation relies on *Colorama* for terminal color rendering and a
 small *Config* helper to read user‑defined preferences such as the minimum
 log level, where to store the log file, and whether to highlight the full
 line or the message body only.
+
+By default records are handed to a bounded queue and written by a background
+thread (``QueueHandler`` / ``QueueListener``), so logging never blocks the
+event loop on disk or terminal I/O. When the queue is full, records are
+dropped and counted (see :func:`get_log_stats`) instead of stalling callers.
 """
 
+import atexit
+import copy
+import json
 import logging
 import os
+import queue
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from colorama import Back, Fore, Style
 
 from .config import Config
 from .schemas.color import Color
+from .utils.common_utils import get_md5
 
 # Logging level to color mapping
 LEVEL_COLOR_MAP = {
@@ -42,17 +54,22 @@ class IDAwareFormatter(logging.Formatter):
     """
 
     def format(self, record):
-        # trace_id
-        if hasattr(record, "trace_id"):
-            record.trace_id = f" - {record.trace_id} -"
-        else:
-            record.trace_id = ""
-        # node_id
-        if hasattr(record, "node_id"):
-            record.node_id = f" {record.node_id} -"
-        else:
-            record.node_id = ""
-        return super().format(record)
+        # The record is shared by all handlers, restore the raw ids afterwards
+        trace_id = getattr(record, "trace_id", None)
+        node_id = getattr(record, "node_id", None)
+        record.trace_id = f" - {trace_id} -" if trace_id is not None else ""
+        record.node_id = f" {node_id} -" if node_id is not None else ""
+        try:
+            return super().format(record)
+        finally:
+            if trace_id is None:
+                del record.trace_id
+            else:
+                record.trace_id = trace_id
+            if node_id is None:
+                del record.node_id
+            else:
+                record.node_id = node_id
 
 
 def get_style_by_record(record):
@@ -112,6 +129,118 @@ class ColorMessageFormatter(IDAwareFormatter):
         return super().formatMessage(record)
 
 
+class JsonFormatter(logging.Formatter):
+    """Formatter emitting one JSON object per line, for log shippers."""
+
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "trace_id": getattr(record, "trace_id", ""),
+            "node_id": getattr(record, "node_id", ""),
+            "pathname": record.pathname,
+            "lineno": record.lineno,
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class LogQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking on a full queue.
+
+    Attributes:
+        dropped: Number of dropped records per level name.
+        listener: The :class:`LogQueueListener` draining the queue.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped: dict[str, int] = {}
+        self.listener = None
+
+    def prepare(self, record):
+        # Merge the arguments and render the traceback in the calling thread,
+        # both may change afterwards. Formatting is left to the listener.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped[record.levelname] = self.dropped.get(record.levelname, 0) + 1
+
+
+class LogQueueListener(QueueListener):
+    """Queue listener writing records with the handlers in a background thread."""
+
+    def enqueue_sentinel(self):
+        # Wait for room instead of failing on a full queue at shutdown
+        self.queue.put(self._sentinel)
+
+
+def truncate_text(value, max_length: int) -> str:
+    """Return ``str(value)`` cut to ``max_length`` characters, 0 keeps it whole."""
+    text = value if isinstance(value, str) else str(value)
+    if max_length and len(text) > max_length:
+        return f"{text[:max_length]}... ({len(text) - max_length} more chars)"
+    return text
+
+
+def is_trace_sampled(trace_id: str, sample_rate: float) -> bool:
+    """Whether detailed logs of ``trace_id`` are kept at ``sample_rate``.
+
+    The decision is a hash of the trace id, so every node of a trace, in any
+    process, makes the same one without shared state.
+    """
+    if sample_rate >= 1:
+        return True
+    if sample_rate <= 0:
+        return False
+    return int(get_md5(trace_id or "")[:8], 16) < sample_rate * 0x100000000
+
+
+def _iter_log_handlers(logger=None):
+    """Yield the handlers of ``logger``, including those behind a queue."""
+    for handler in (logger or logging.getLogger()).handlers:
+        yield handler
+        listener = getattr(handler, "listener", None)
+        if listener is not None:
+            yield from listener.handlers
+
+
+def get_log_stats() -> dict:
+    """Depth and drop counters of the logging queue, empty if logging is sync."""
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, LogQueueHandler):
+            return {
+                "queue_depth": handler.queue.qsize(),
+                "queue_size": handler.queue.maxsize,
+                "dropped": dict(handler.dropped),
+            }
+    return {}
+
+
+def shutdown_logging():
+    """Flush the logging queue and stop its writer thread."""
+    for handler in logging.getLogger().handlers:
+        listener = getattr(handler, "listener", None)
+        if listener is not None and listener._thread is not None:
+            listener.stop()
+
+
 def setup_logging():
     """Configure root logger with colored stream handler and plain file handler.
 
@@ -129,13 +258,26 @@ def setup_logging():
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("elasticsearch").setLevel(logging.WARNING)
 
-    # File handler – no colors
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        # Already configured, by a previous call or by the application
+        return root_logger
+
+    # File handler – no colors, rotated by size
     os.makedirs(os.path.dirname(Config.get_log_path()), exist_ok=True)
-    file_handler = logging.FileHandler(Config.get_log_path(), encoding="utf-8")
-    file_handler.setLevel(Config.get_log_level_file())
-    file_formatter = IDAwareFormatter(
-        "%(asctime)s - %(levelname)s%(trace_id)s%(node_id)s %(pathname)s line:%(lineno)d - %(message)s"
+    file_handler = RotatingFileHandler(
+        Config.get_log_path(),
+        maxBytes=Config.get_log_max_bytes() or 0,
+        backupCount=Config.get_log_backup_count() or 0,
+        encoding="utf-8",
     )
+    file_handler.setLevel(Config.get_log_level_file())
+    if Config.get_log_file_format() == "json":
+        file_formatter = JsonFormatter()
+    else:
+        file_formatter = IDAwareFormatter(
+            "%(asctime)s - %(levelname)s%(trace_id)s%(node_id)s %(pathname)s line:%(lineno)d - %(message)s"
+        )
     file_handler.setFormatter(file_formatter)
 
     # Stream handler – optional colors
@@ -150,10 +292,17 @@ def setup_logging():
     stream_handler.setFormatter(stream_formatter)
 
     # Root logger wiring
-    logging.basicConfig(
-        level=Config.get_log_level_root(), handlers=[stream_handler, file_handler]
-    )
-    return logging.getLogger()
+    handlers = [stream_handler, file_handler]
+    if Config.get_log_is_async():
+        queue_handler = LogQueueHandler(queue.Queue(Config.get_log_queue_size()))
+        queue_handler.listener = LogQueueListener(
+            queue_handler.queue, *handlers, respect_handler_level=True
+        )
+        queue_handler.listener.start()
+        atexit.register(shutdown_logging)
+        handlers = [queue_handler]
+    logging.basicConfig(level=Config.get_log_level_root(), handlers=handlers)
+    return root_logger
 
 
 if __name__ == "__main__":
@@ -14,24 +14,27 @@ NOTE: This module contains the following parts:
     - es_client / redis_client / vearch_client: Database clients for Elasticsearch, Redis, and Vearch
     - agent_organization: Dictionary representing the organization structure of agents
     - lock: Boolean to control task execution flow
+    - scheduler: Weighted fair scheduler of llm/tool slots across tenants
+    - admission: Admission controller bounding the in-flight traces of the web service
+    - tracer: Exporter of OpenTelemetry-compatible spans of every oxy call
+    - metrics: Prometheus-style runtime metrics, served on /metrics
 """
 # from __future__ import annotations
 
 import asyncio
 import json
 import os
+import time
 import traceback
 from collections import OrderedDict
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 import msgpack
-from elasticsearch import AsyncElasticsearch
 from pydantic import BaseModel, ConfigDict, Field
 
+from .admission import AdmissionController, AdmissionRejected
 from .config import Config
-from .databases.db_es import JesEs, LocalEs
-from .databases.db_redis import JimdbApRedis, LocalRedis
-from .databases.db_vector import VearchDB
+from .metrics import MetricsRegistry
 from .db_factory import DBFactory
 from .log_setup import setup_logging
 from .oxy import Oxy
@@ -41,8 +44,9 @@ from .oxy.base_flow import BaseFlow
 from .oxy.base_tool import BaseTool
 from .oxy.llms.base_llm import BaseLLM
 from .oxy.mcp_tools.base_mcp_client import BaseMCPClient
-from .routes import router
+from .scheduler import FairScheduler
 from .schemas import OxyRequest, OxyResponse, WebResponse
+from .tracing import Tracer
 from .utils.common_utils import (
     generate_uuid,
     get_format_time,
@@ -75,9 +79,10 @@ class MAS(BaseModel):
 
     agent_organization: dict = Field(default_factory=list)
 
-    vearch_client: Optional[VearchDB] = Field(None)
-    es_client: Optional[AsyncElasticsearch] = Field(None)
-    redis_client: Optional[JimdbApRedis] = Field(None)
+    # The client classes are imported when configured, not with this module
+    vearch_client: Optional[Any] = Field(None, description="VearchDB")
+    es_client: Optional[Any] = Field(None, description="JesEs or LocalEs")
+    redis_client: Optional[Any] = Field(None, description="JimdbApRedis or LocalRedis")
 
     lock: bool = Field(False)
     active_tasks: dict = Field(default_factory=dict)
@@ -86,6 +91,31 @@ class MAS(BaseModel):
 
     message_prefix: str = Field("oxygent")
 
+    startup_timings: dict = Field(
+        default_factory=dict,
+        description="Seconds spent per init phase and per component",
+    )
+
+    scheduler: Optional[FairScheduler] = Field(
+        default_factory=FairScheduler.from_config,
+        description="Weighted fair scheduler of llm/tool slots across tenants",
+    )
+
+    admission: Optional[AdmissionController] = Field(
+        default_factory=AdmissionController.from_config,
+        description="Admission control and load shedding of the chat endpoints",
+    )
+
+    tracer: Optional[Tracer] = Field(
+        default_factory=Tracer.from_config,
+        description="Exporter of the per-phase spans of oxy calls",
+    )
+
+    metrics: Optional[MetricsRegistry] = Field(
+        default_factory=MetricsRegistry.from_config,
+        description="Runtime metrics served on /metrics",
+    )
+
     global_data: dict = Field(
         default_factory=dict, description="public data in the scope of application"
     )
@@ -131,6 +161,11 @@ class MAS(BaseModel):
         await self.es_client.close()
         await self.redis_client.close()
         await self.cleanup_servers()
+        from .utils.http_client import close_http_client
+
+        await close_http_client()
+        if self.tracer:
+            self.tracer.shutdown()
 
     @classmethod
     async def create(cls, **kwargs):
@@ -192,7 +227,11 @@ class MAS(BaseModel):
         - Initializing the database connections (Elasticsearch, Redis)
         - Setting up the agent organization structure
         - Initialize the vector search if configured
+
+        The databases and the oxy instances are initialized concurrently, and the
+        vector tables are created while the organization is shown.
         """
+        start = time.perf_counter()
         self.show_banner()
         self.show_mas_info()
         # Register default oxy_space
@@ -201,18 +240,35 @@ class MAS(BaseModel):
             from .core_tools.retrieve_tools import fh as retrieve_fh
 
             self.add_oxy(retrieve_fh)
-        # Initialize datebase asynchronously
-        await self.init_db()
-        # Initialize all oxy instances
-        await self.init_all_oxy()
+        phases = self.startup_timings.setdefault("phases", {})
+        # Initialize the datebase and all oxy instances asynchronously
+        await asyncio.gather(
+            self._timed(self.init_db(), phases, "db"),
+            self._timed(self.init_all_oxy(), phases, "oxy"),
+        )
         # Initialize the master agent name
         self.init_master_agent_name()
-        # Initialize the Redis client
+        # Create the tool tables of the vector search
+        vearch_task = None
         if Config.get_vearch_config():
-            await self.create_vearch_table()
+            vearch_task = asyncio.create_task(
+                self._timed(self.create_vearch_table(), phases, "vearch")
+            )
         # Build the agent organization structure
         self.init_agent_organization()
         self.show_org()
+        if vearch_task:
+            await vearch_task
+        self.startup_timings["total"] = time.perf_counter() - start
+        self.show_startup_timings()
+
+    @staticmethod
+    async def _timed(coro, timings: dict, key: str):
+        start = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            timings[key] = time.perf_counter() - start
 
     async def cleanup_servers(self) -> None:
         """Gracefully shut down remote servers/clients.
@@ -244,13 +300,19 @@ class MAS(BaseModel):
         # es
         db_factory = DBFactory()
         if Config.get_es_config():
+            from .databases.db_es import JesEs
+
             jes_config = Config.get_es_config()
             hosts = jes_config["hosts"]
             user = jes_config["user"]
             password = jes_config["password"]
             self.es_client = db_factory.get_instance(JesEs, hosts, user, password)
         else:
+            from .databases.db_es import LocalEs
+
             self.es_client = db_factory.get_instance(LocalEs)
+        if self.metrics:
+            self.metrics.instrument_client(self.es_client, "es")
         # trace table
         await self.es_client.create_index(
             Config.get_app_name() + "_trace",
@@ -355,6 +417,8 @@ class MAS(BaseModel):
         # init redis client
         redis_config = Config.get_redis_config()
         if redis_config:
+            from .databases.db_redis import JimdbApRedis
+
             host = redis_config["host"]
             port = redis_config["port"]
             password = redis_config["password"]
@@ -363,7 +427,11 @@ class MAS(BaseModel):
                 host=host, port=port, password=password, db=db
             )
         else:
+            from .databases.db_redis import LocalRedis
+
             self.redis_client = LocalRedis()
+        if self.metrics:
+            self.metrics.instrument_client(self.redis_client, "redis")
 
     async def batch_init_oxy(self, *class_type):
         """Batch initialize oxy objects of specified types asynchronously.
@@ -388,11 +456,127 @@ class MAS(BaseModel):
         if tasks:
             await asyncio.gather(*tasks)
 
+    def get_init_graph(self) -> dict:
+        """Map the name of every LLM, tool, flow and agent to the names it waits for.
+
+        Dependencies come from :meth:`Oxy.get_init_dependencies`. A dependency that
+        is not registered yet, e.g. a function of a FunctionHub, is created while
+        initializing another oxy, so the dependent waits for all LLMs and tools.
+
+        Raises:
+            ValueError: If the dependencies form a cycle.
+        """
+        oxys = {
+            oxy_name: oxy
+            for oxy_name, oxy in self.oxy_name_to_oxy.items()
+            if isinstance(oxy, (BaseLLM, BaseTool, BaseFlow, BaseAgent))
+        }
+        producers = {
+            oxy_name
+            for oxy_name, oxy in oxys.items()
+            if isinstance(oxy, (BaseLLM, BaseTool))
+        }
+        graph = {}
+        for oxy_name, oxy in oxys.items():
+            dependencies = set()
+            for dependency in oxy.get_init_dependencies():
+                if dependency in oxys:
+                    dependencies.add(dependency)
+                elif dependency not in self.oxy_name_to_oxy:
+                    dependencies |= producers
+            dependencies.discard(oxy_name)
+            graph[oxy_name] = dependencies
+
+        # Kahn's algorithm, only to report cycles before anything is started
+        remaining = {oxy_name: set(deps) for oxy_name, deps in graph.items()}
+        while remaining:
+            ready = [oxy_name for oxy_name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(
+                    f"Circular init dependencies between {sorted(remaining)}"
+                )
+            for oxy_name in ready:
+                del remaining[oxy_name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return graph
+
+    async def _init_oxy(self, oxy: Oxy, timings: dict):
+        oxy.set_mas(self)
+        start = time.perf_counter()
+        try:
+            if oxy.init_timeout:
+                await asyncio.wait_for(oxy.init(), oxy.init_timeout)
+            else:
+                await oxy.init()
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Init of [{oxy.name}] timed out after {oxy.init_timeout}s"
+            ) from None
+        finally:
+            timings[oxy.name] = {
+                "category": oxy.category,
+                "class_name": oxy.class_name,
+                "seconds": time.perf_counter() - start,
+            }
+
     async def init_all_oxy(self):
-        """Initializing all tools and agents assign values of agent.tools to each
-        agent."""
-        await self.batch_init_oxy(BaseLLM, BaseTool)
-        await self.batch_init_oxy(BaseFlow, BaseAgent)
+        """Initialize all LLMs, tools, flows and agents along their dependencies.
+
+        An agent starts once its LLM and tools are ready, so a slow MCP server only
+        delays the agents using it. Oxys are initialized one by one in dependency
+        order when ``Config.get_tool_is_concurrent_init()`` is off.
+        """
+        graph = self.get_init_graph()
+        oxys = {oxy_name: self.oxy_name_to_oxy[oxy_name] for oxy_name in graph}
+        timings = self.startup_timings.setdefault("components", {})
+
+        if not Config.get_tool_is_concurrent_init():
+            done = set()
+            while len(done) < len(graph):
+                for oxy_name, deps in graph.items():
+                    if oxy_name not in done and deps <= done:
+                        await self._init_oxy(oxys[oxy_name], timings)
+                        done.add(oxy_name)
+            return
+
+        events = {oxy_name: asyncio.Event() for oxy_name in graph}
+
+        async def init_after_dependencies(oxy_name):
+            for dependency in graph[oxy_name]:
+                await events[dependency].wait()
+            await self._init_oxy(oxys[oxy_name], timings)
+            events[oxy_name].set()
+
+        tasks = [
+            asyncio.create_task(init_after_dependencies(oxy_name)) for oxy_name in graph
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def show_startup_timings(self, top: int = 5):
+        """Log the startup time, per phase and of the slowest components."""
+        timings = self.startup_timings
+        components = sorted(
+            timings.get("components", {}).items(),
+            key=lambda item: item[1]["seconds"],
+            reverse=True,
+        )
+        logger.info("⏱️ OxyGent MAS Startup Timings")
+        logger.info("=" * 64)
+        logger.info(f"Total        : {timings.get('total', 0):.3f}s")
+        for phase, seconds in timings.get("phases", {}).items():
+            logger.info(f"{phase:<13}: {seconds:.3f}s")
+        for oxy_name, timing in components[:top]:
+            logger.info(
+                f"  {timing['seconds']:>8.3f}s  {oxy_name} ({timing['category']})"
+            )
+        logger.info("=" * 64)
 
     def init_master_agent_name(self):
         """Initialize the master agent name.
@@ -492,7 +676,14 @@ class MAS(BaseModel):
                 tool_list.append((self.name, tool_name, permitted_tool_name, tool_desc))
         if tool_list:
             # vearch
-            self.vearch_client = VearchDB(Config.get_vearch_config())
+            if Config.get_vearch_backend() == "local":
+                from .databases.db_vector import LocalVectorDB
+
+                self.vearch_client = LocalVectorDB(Config.get_vearch_config())
+            else:
+                from .databases.db_vector import VearchDB
+
+                self.vearch_client = VearchDB(Config.get_vearch_config())
             await self.vearch_client.create_vearch_table_by_tool_list(tool_list)
 
     # ------------------------------------------------------------------
@@ -740,6 +931,12 @@ class MAS(BaseModel):
             if not oxy_request.callee:
                 oxy_request.callee = self.master_agent_name
 
+            if self.scheduler and not payload.get("tenant"):
+                oxy_request.tenant = self.scheduler.resolve_tenant(
+                    oxy_request.group_data,
+                    oxy_request.shared_data.get("_headers", {}),
+                )
+
             oxy_response = await oxy_request.start()
 
             if send_msg_key:
@@ -782,6 +979,8 @@ class MAS(BaseModel):
     # ------------------------------------------------------------------
 
     async def event_stream(self, redis_key, current_trace_id, task):
+        if self.metrics:
+            self.metrics.sse_connections += 1
         try:
             task.add_done_callback(
                 lambda future: self.active_tasks.pop(current_trace_id, None)
@@ -828,6 +1027,9 @@ class MAS(BaseModel):
             )
             self.active_tasks[current_trace_id].cancel()
             raise
+        finally:
+            if self.metrics:
+                self.metrics.sse_connections -= 1
 
     async def start_web_service(
         self, first_query=None, welcome_message=None, host=None, port=None
@@ -850,6 +1052,7 @@ class MAS(BaseModel):
 
         import uvicorn
         from fastapi import FastAPI, Request
+        from fastapi.responses import JSONResponse, PlainTextResponse
         from fastapi.staticfiles import StaticFiles
         from sse_starlette.sse import EventSourceResponse
 
@@ -868,6 +1071,8 @@ class MAS(BaseModel):
         for app_middleware in self.middlewares:
             app.add_middleware(app_middleware)
 
+        from .routes import router
+
         app.include_router(router)
         for app_router in self.routers:
             app.include_router(app_router)
@@ -965,6 +1170,10 @@ class MAS(BaseModel):
             elif request.method == "POST":
                 payload = await request.json()
 
+            # Clients do not pick their scheduling class: the tenant is resolved
+            # by the scheduler, or set by func_filter after authentication
+            payload.pop("tenant", None)
+            payload.pop("priority", None)
             payload = self.func_filter(payload)
 
             if "query" not in payload:
@@ -980,6 +1189,44 @@ class MAS(BaseModel):
 
             return payload
 
+        """
+        Admission control: a request is either admitted, queued for a bounded
+        time, or shed with 429 and Retry-After. The slot is given back when the
+        chat task finishes, including when the SSE client disconnects.
+        """
+
+        async def admit():
+            try:
+                return await self.admission.acquire(), None
+            except AdmissionRejected as e:
+                return None, JSONResponse(
+                    status_code=429,
+                    headers={"Retry-After": str(e.retry_after)},
+                    content=WebResponse(code=429, message=str(e)).to_dict(),
+                )
+
+        def release_on_done(task, admitted_at):
+            task.add_done_callback(lambda future: self.admission.release(admitted_at))
+
+        @app.get("/metrics")
+        async def get_metrics():
+            # Async on purpose: rendering runs on the event loop, which is the
+            # only writer of the counters, so no lock is needed
+            if not self.metrics:
+                return PlainTextResponse("", status_code=404)
+            return PlainTextResponse(
+                self.metrics.render(self),
+                media_type="text/plain; version=0.0.4; charset=utf-8",
+            )
+
+        @app.get("/admission")
+        def get_admission():
+            if not self.admission:
+                return WebResponse(data={"is_enabled": False}).to_dict()
+            return WebResponse(
+                data={"is_enabled": True, **self.admission.get_stats()}
+            ).to_dict()
+
         @app.api_route("/chat", methods=["GET", "POST"])
         async def chat(request: Request):
             payload = await request_to_payload(request)
@@ -987,7 +1234,16 @@ class MAS(BaseModel):
             intercepted_response = self.func_interceptor(payload)
             if intercepted_response is not None:
                 return intercepted_response
-            oxy_response = await self.chat_with_agent(payload=payload)
+            if self.admission:
+                admitted_at, rejected_response = await admit()
+                if rejected_response is not None:
+                    return rejected_response
+                try:
+                    oxy_response = await self.chat_with_agent(payload=payload)
+                finally:
+                    self.admission.release(admitted_at)
+            else:
+                oxy_response = await self.chat_with_agent(payload=payload)
             return oxy_response.output
 
         @app.api_route("/sse/chat", methods=["GET", "POST"])
@@ -997,6 +1253,10 @@ class MAS(BaseModel):
             intercepted_response = self.func_interceptor(payload)
             if intercepted_response is not None:
                 return intercepted_response
+            if self.admission:
+                admitted_at, rejected_response = await admit()
+                if rejected_response is not None:
+                    return rejected_response
             current_trace_id = payload["current_trace_id"]
 
             logger.info(
@@ -1007,6 +1267,8 @@ class MAS(BaseModel):
             task = asyncio.create_task(
                 self.chat_with_agent(payload=payload, send_msg_key=redis_key)
             )
+            if self.admission:
+                release_on_done(task, admitted_at)
 
             return EventSourceResponse(
                 self.event_stream(redis_key, current_trace_id, task)
@@ -1019,6 +1281,10 @@ class MAS(BaseModel):
             intercepted_response = self.func_interceptor(payload)
             if intercepted_response is not None:
                 return intercepted_response
+            if self.admission:
+                admitted_at, rejected_response = await admit()
+                if rejected_response is not None:
+                    return rejected_response
             current_trace_id = payload["current_trace_id"]
 
             logger.info(
@@ -1029,6 +1295,8 @@ class MAS(BaseModel):
             task = asyncio.create_task(
                 self.chat_with_agent(payload=payload, send_msg_key=redis_key)
             )
+            if self.admission:
+                release_on_done(task, admitted_at)
             task.add_done_callback(
                 lambda future: self.active_tasks.pop(current_trace_id, None)
             )
@@ -1068,13 +1336,18 @@ class MAS(BaseModel):
     # Batch helper
     # ------------------------------------------------------------------
 
-    async def start_batch_processing(self, querys, return_trace_id=False):
+    async def start_batch_processing(
+        self, querys, return_trace_id=False, tenant="batch", priority=0
+    ):
         """Execute a batch of queries concurrently.
 
         Args:
             querys: Iterable of natural-language prompts.
             return_trace_id: If ``True`` the trace ID is returned together
                 with each answer - handy for offline audits.
+            tenant: Scheduling tenant of the batch, so that the fair scheduler
+                can keep it from starving interactive traffic.
+            priority: Priority of the batch queries within ``tenant``.
 
         Returns:
             list: Answers (or dicts with *output* + *trace_id*).
@@ -1090,6 +1363,8 @@ class MAS(BaseModel):
                 "query": query,
                 "from_trace_id": from_trace_id,
                 "extra_arg": "value",
+                "tenant": tenant,
+                "priority": priority,
             }
             oxy_response = await self.chat_with_agent(payload=payload)
             from_trace_id = oxy_response.oxy_request.current_trace_id
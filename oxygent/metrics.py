@@ -0,0 +1,351 @@
+"""metrics.py Prometheus-style runtime metrics of a MAS.
+
+Counters and histograms are updated in place from the event loop thread, so no
+lock is taken on the hot path: a call costs a few dict lookups and a bisect.
+Gauges (queue depths, task counts, breaker states, ...) are not tracked at all;
+they are read from the live objects when ``/metrics`` is scraped.
+
+The text returned by :meth:`MetricsRegistry.render` follows the Prometheus
+exposition format 0.0.4.
+"""
+
+import inspect
+import logging
+import time
+from bisect import bisect_left
+from typing import Optional
+
+from .config import Config
+from .log_setup import get_log_stats
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple, values: tuple) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Writer:
+    """Accumulate metric families in the Prometheus text format."""
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self.lines: list[str] = []
+
+    def family(self, name: str, metric_type: str, help_text: str) -> str:
+        full_name = f"{self.prefix}_{name}"
+        self.lines.append(f"# HELP {full_name} {help_text}")
+        self.lines.append(f"# TYPE {full_name} {metric_type}")
+        return full_name
+
+    def sample(self, name: str, label_names: tuple, label_values: tuple, value):
+        self.lines.append(f"{name}{_labels(label_names, label_values)} {value}")
+
+    def scalar(self, name, metric_type, help_text, samples: dict, label_names=()):
+        full_name = self.family(name, metric_type, help_text)
+        for label_values, value in samples.items():
+            self.sample(full_name, label_names, label_values, value)
+
+    def histograms(self, name, help_text, histograms: dict, label_names: tuple):
+        full_name = self.family(name, "histogram", help_text)
+        bucket_names = label_names + ("le",)
+        for label_values, histogram in histograms.items():
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                self.sample(
+                    f"{full_name}_bucket",
+                    bucket_names,
+                    label_values + (bound,),
+                    cumulative,
+                )
+            self.sample(
+                f"{full_name}_bucket",
+                bucket_names,
+                label_values + ("+Inf",),
+                histogram.count,
+            )
+            self.sample(f"{full_name}_sum", label_names, label_values, histogram.sum)
+            self.sample(
+                f"{full_name}_count", label_names, label_values, histogram.count
+            )
+
+    def render(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+class MetricsRegistry:
+    """Runtime metrics of one MAS, rendered on ``/metrics``."""
+
+    def __init__(self, prefix: str = "oxygent", buckets: tuple = DEFAULT_BUCKETS):
+        self.prefix = prefix
+        self.buckets = tuple(buckets)
+        self.oxy_calls: dict[tuple, int] = {}
+        self.oxy_latency: dict[tuple, Histogram] = {}
+        self.db_calls: dict[tuple, int] = {}
+        self.db_latency: dict[tuple, Histogram] = {}
+        self.llm_tokens: dict[tuple, int] = {}
+        self.sse_connections = 0
+
+    @classmethod
+    def from_config(cls) -> Optional["MetricsRegistry"]:
+        """Build the registry from ``Config``, ``None`` if it is disabled."""
+        metrics_config = Config.get_metrics_config()
+        if not metrics_config.get("is_enabled"):
+            return None
+        return cls(
+            prefix=metrics_config.get("prefix", "oxygent"),
+            buckets=metrics_config.get("buckets") or DEFAULT_BUCKETS,
+        )
+
+    def _histogram(self, histograms: dict, key: tuple) -> Histogram:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = Histogram(self.buckets)
+        return histogram
+
+    def observe_oxy(self, oxy, oxy_response, duration: float):
+        """Count one finished oxy call and record its latency."""
+        key = (oxy.name, oxy.category)
+        state_key = key + (oxy_response.state.name,)
+        self.oxy_calls[state_key] = self.oxy_calls.get(state_key, 0) + 1
+        self._histogram(self.oxy_latency, key).observe(duration)
+        usage = oxy_response.extra.get("usage")
+        # Agents may pass the response of their LLM through
+        if usage and oxy.category == "llm":
+            for kind in ("prompt_tokens", "completion_tokens"):
+                token_key = (oxy.name, kind.split("_")[0])
+                self.llm_tokens[token_key] = self.llm_tokens.get(token_key, 0) + int(
+                    usage.get(kind) or 0
+                )
+
+    def observe_db(self, backend: str, method: str, duration: float, is_error: bool):
+        key = (backend, method, "error" if is_error else "ok")
+        self.db_calls[key] = self.db_calls.get(key, 0) + 1
+        self._histogram(self.db_latency, (backend, method)).observe(duration)
+
+    def instrument_client(self, client, backend: str):
+        """Time every public coroutine method of a database client in place."""
+        if client is None or getattr(client, "_is_metrics_instrumented", False):
+            return client
+        for name, _ in inspect.getmembers(type(client), inspect.iscoroutinefunction):
+            if name.startswith("_") or name == "close":
+                continue
+            setattr(client, name, self._timed(getattr(client, name), backend, name))
+        client._is_metrics_instrumented = True
+        return client
+
+    def _timed(self, method, backend: str, name: str):
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            is_error = True
+            try:
+                result = await method(*args, **kwargs)
+                is_error = False
+                return result
+            finally:
+                self.observe_db(backend, name, time.perf_counter() - start, is_error)
+
+        return wrapper
+
+    def render(self, mas=None) -> str:
+        """Render all metrics, reading the gauges from ``mas`` at call time."""
+        writer = _Writer(self.prefix)
+        writer.scalar(
+            "oxy_calls_total",
+            "counter",
+            "Finished oxy calls by final state.",
+            self.oxy_calls,
+            ("oxy", "category", "state"),
+        )
+        writer.histograms(
+            "oxy_latency_seconds",
+            "Latency of oxy calls, semaphore wait included.",
+            self.oxy_latency,
+            ("oxy", "category"),
+        )
+        writer.scalar(
+            "llm_tokens_total",
+            "counter",
+            "Tokens reported by LLM responses.",
+            self.llm_tokens,
+            ("oxy", "kind"),
+        )
+        writer.scalar(
+            "db_calls_total",
+            "counter",
+            "Database client calls by outcome.",
+            self.db_calls,
+            ("backend", "method", "outcome"),
+        )
+        writer.histograms(
+            "db_latency_seconds",
+            "Latency of database client calls.",
+            self.db_latency,
+            ("backend", "method"),
+        )
+        writer.scalar(
+            "sse_connections",
+            "gauge",
+            "Open SSE connections.",
+            {(): self.sse_connections},
+        )
+        log_stats = get_log_stats()
+        if log_stats:
+            writer.scalar(
+                "log_queue_depth",
+                "gauge",
+                "Log records waiting for the log writer thread.",
+                {(): log_stats["queue_depth"]},
+            )
+            writer.scalar(
+                "log_records_dropped_total",
+                "counter",
+                "Log records dropped because the log queue was full.",
+                {(level,): n for level, n in log_stats["dropped"].items()},
+                ("level",),
+            )
+        if mas is not None:
+            self._render_mas(writer, mas)
+        return writer.render()
+
+    def _render_mas(self, writer: _Writer, mas):
+        writer.scalar(
+            "background_tasks",
+            "gauge",
+            "Pending background tasks (data saving, ...).",
+            {(): len(mas.background_tasks)},
+        )
+        writer.scalar(
+            "active_tasks",
+            "gauge",
+            "Running chat tasks of the SSE and async endpoints.",
+            {(): len(mas.active_tasks)},
+        )
+
+        queue_depths, retries, circuit_states, budget_exhausted = {}, {}, {}, {}
+        for oxy in mas.oxy_name_to_oxy.values():
+            semaphore = getattr(oxy, "_semaphore", None)
+            waiters = getattr(semaphore, "_waiters", None)
+            queue_depths[(oxy.name, "default")] = len(waiters) if waiters else 0
+            retry_stats = oxy.retry_policy.get_stats()
+            if retry_stats["retries"]:
+                retries[(oxy.name,)] = retry_stats["retries"]
+            if retry_stats["budget_exhausted"]:
+                budget_exhausted[(oxy.name,)] = retry_stats["budget_exhausted"]
+            if oxy.retry_policy.breaker_failure_threshold > 0:
+                circuit_states[(oxy.name,)] = int(
+                    retry_stats["circuit_state"] != "closed"
+                )
+        avg_waits, max_waits = {}, {}
+        if mas.scheduler:
+            for name, tenant_stats in mas.scheduler.get_stats().items():
+                for tenant, stats in tenant_stats.items():
+                    queue_depths[(name, tenant)] = stats["queue_depth"]
+                    avg_waits[(name, tenant)] = stats["avg_wait"]
+                    max_waits[(name, tenant)] = stats["max_wait"]
+        writer.scalar(
+            "semaphore_queue_depth",
+            "gauge",
+            "Calls waiting for a concurrency slot of an oxy.",
+            queue_depths,
+            ("oxy", "tenant"),
+        )
+        writer.scalar(
+            "scheduler_wait_seconds_avg",
+            "gauge",
+            "Average wait for a fairly scheduled slot of an oxy, per tenant.",
+            avg_waits,
+            ("oxy", "tenant"),
+        )
+        writer.scalar(
+            "scheduler_wait_seconds_max",
+            "gauge",
+            "Longest wait for a fairly scheduled slot of an oxy, per tenant.",
+            max_waits,
+            ("oxy", "tenant"),
+        )
+        writer.scalar(
+            "retries_total",
+            "counter",
+            "Retried attempts of oxy calls.",
+            retries,
+            ("oxy",),
+        )
+        writer.scalar(
+            "circuit_open",
+            "gauge",
+            "Whether the circuit breaker of an oxy is open or half-open.",
+            circuit_states,
+            ("oxy",),
+        )
+        writer.scalar(
+            "retry_budget_exhausted_total",
+            "counter",
+            "Retries refused because the retry budget was exhausted.",
+            budget_exhausted,
+            ("oxy",),
+        )
+
+        if mas.admission:
+            admission_stats = mas.admission.get_stats()
+            writer.scalar(
+                "admission_in_flight",
+                "gauge",
+                "Admitted traces in flight.",
+                {(): admission_stats["in_flight"]},
+            )
+            writer.scalar(
+                "admission_queue_depth",
+                "gauge",
+                "Requests waiting for admission.",
+                {(): admission_stats["queue_depth"]},
+            )
+            writer.scalar(
+                "admission_rejected_total",
+                "counter",
+                "Requests shed by admission control.",
+                {(k,): v for k, v in admission_stats["rejected"].items()},
+                ("reason",),
+            )
@@ -1,23 +1,51 @@
-from .agents import (
-    ChatAgent,
-    ParallelAgent,
-    RAGAgent,
-    ReActAgent,
-    SSEOxyGent,
-    WorkflowAgent,
-)
-from .api_tools import HttpTool
-from .base_oxy import Oxy
-from .flows import (
-    MathReflexion,
-    PlanAndSolve,
-    Reflexion,
-    Workflow,
-)
-from .function_tools.function_hub import FunctionHub
-from .function_tools.function_tool import FunctionTool
-from .llms import HttpLLM, OpenAILLM
-from .mcp_tools import MCPTool, SSEMCPClient, StdioMCPClient, StreamableMCPClient
+"""Oxy classes, imported on first use (PEP 562).
+
+``from oxygent.oxy import ChatAgent`` only loads the modules ``ChatAgent`` needs,
+not the ``openai`` or ``mcp`` SDKs of the other classes.
+"""
+
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_import import lazy_module
+
+if TYPE_CHECKING:
+    from .agents import (
+        ChatAgent,
+        ParallelAgent,
+        RAGAgent,
+        ReActAgent,
+        SSEOxyGent,
+        WorkflowAgent,
+    )
+    from .api_tools import HttpTool
+    from .base_oxy import Oxy
+    from .flows import MathReflexion, PlanAndSolve, Reflexion, Workflow
+    from .function_tools import FunctionHub, FunctionTool
+    from .llms import HttpLLM, OpenAILLM
+    from .mcp_tools import MCPTool, SSEMCPClient, StdioMCPClient, StreamableMCPClient
+
+_LAZY_IMPORTS = {
+    "Oxy": ".base_oxy",
+    "ChatAgent": ".agents",
+    "RAGAgent": ".agents",
+    "ReActAgent": ".agents",
+    "WorkflowAgent": ".agents",
+    "ParallelAgent": ".agents",
+    "SSEOxyGent": ".agents",
+    "HttpTool": ".api_tools",
+    "HttpLLM": ".llms",
+    "OpenAILLM": ".llms",
+    "MCPTool": ".mcp_tools",
+    "StdioMCPClient": ".mcp_tools",
+    "StreamableMCPClient": ".mcp_tools",
+    "SSEMCPClient": ".mcp_tools",
+    "FunctionHub": ".function_tools",
+    "FunctionTool": ".function_tools",
+    "Workflow": ".flows",
+    "PlanAndSolve": ".flows",
+    "Reflexion": ".flows",
+    "MathReflexion": ".flows",
+}
 
 __all__ = [
     "Oxy",
@@ -41,3 +69,6 @@ __all__ = [
     "Reflexion",
     "MathReflexion",
 ]
+
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
@@ -1,9 +1,25 @@
-from .chat_agent import ChatAgent
-from .parallel_agent import ParallelAgent
-from .rag_agent import RAGAgent
-from .react_agent import ReActAgent
-from .sse_oxy_agent import SSEOxyGent
-from .workflow_agent import WorkflowAgent
+"""Agents, imported on first use."""
+
+from typing import TYPE_CHECKING
+
+from ...utils.lazy_import import lazy_module
+
+if TYPE_CHECKING:
+    from .chat_agent import ChatAgent
+    from .parallel_agent import ParallelAgent
+    from .rag_agent import RAGAgent
+    from .react_agent import ReActAgent
+    from .sse_oxy_agent import SSEOxyGent
+    from .workflow_agent import WorkflowAgent
+
+_LAZY_IMPORTS = {
+    "ChatAgent": ".chat_agent",
+    "RAGAgent": ".rag_agent",
+    "ReActAgent": ".react_agent",
+    "WorkflowAgent": ".workflow_agent",
+    "ParallelAgent": ".parallel_agent",
+    "SSEOxyGent": ".sse_oxy_agent",
+}
 
 __all__ = [
     "ChatAgent",
@@ -13,3 +29,6 @@ __all__ = [
     "ParallelAgent",
     "SSEOxyGent",
 ]
+
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
@@ -200,7 +200,9 @@ class BaseAgent(BaseFlow):
                     "query": oxy_request.get_query(),
                     "answer": oxy_response.output,
                 }
-                history.update(oxy_response.extra)
+                history.update(
+                    {k: v for k, v in oxy_response.extra.items() if k != "timings"}
+                )
 
                 # Store the conversation history record
                 history_id = generate_uuid()
@@ -20,7 +20,7 @@ from ..base_tool import BaseTool
 from ..function_tools.function_hub import FunctionHub
 from ..function_tools.function_tool import FunctionTool
 from ..mcp_tools.mcp_tool import MCPTool
-from ..mcp_tools.stdio_mcp_client import BaseMCPClient
+from ..mcp_tools.base_mcp_client import BaseMCPClient
 from .base_agent import BaseAgent
 
 logger = logging.getLogger(__name__)
@@ -149,12 +149,22 @@ class LocalAgent(BaseAgent):
             else:
                 logger.warning(f"Unknown tool type: {type(oxy)}")
 
+    def get_init_dependencies(self) -> list:
+        """The LLM and the tools that :meth:`init` reads."""
+        return [self.llm_model] + [
+            tool_name for tool_name in self.tools if tool_name not in self.except_tools
+        ]
+
     def __deepcopy__(self, memo):
         # Extract all fields from the current instance
         fields = self.model_dump()
 
         # Keep MAS reference shared (not deep copied) to maintain system connectivity
         fields["mas"] = self.mas
+        # Excluded from model_dump, but part of the retry configuration
+        fields["retry_policy"]["func_is_retryable"] = (
+            self.retry_policy.func_is_retryable
+        )
 
         # Deep copy all other fields to ensure complete isolation
         for k in fields:
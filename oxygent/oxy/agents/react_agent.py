@@ -13,6 +13,7 @@ from typing import Callable, Optional
 from pydantic import Field
 
 from ...config import Config
+from ...log_setup import truncate_text
 from ...prompts import SYSTEM_PROMPT, SYSTEM_PROMPT_RETRIEVAL
 from ...schemas import (
     ExecResult,
@@ -392,7 +393,11 @@ class ReActAgent(LocalAgent):
             else:
                 # Parsing error - add to memory for correction
                 logger.info(
-                    f"Format error, adding to react_memory: {llm_response.ori_response}",
+                    "Format error, adding to react_memory: %s",
+                    truncate_text(
+                        llm_response.ori_response,
+                        Config.get_log_max_observation_length(),
+                    ),
                     extra={
                         "trace_id": oxy_request.current_trace_id,
                         "node_id": oxy_request.node_id,
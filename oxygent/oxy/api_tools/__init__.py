@@ -1,5 +1,19 @@
-from .http_tool import HttpTool
+"""API tools, imported on first use."""
+
+from typing import TYPE_CHECKING
+
+from ...utils.lazy_import import lazy_module
+
+if TYPE_CHECKING:
+    from .http_tool import HttpTool
+
+_LAZY_IMPORTS = {
+    "HttpTool": ".http_tool",
+}
 
 __all__ = [
     "HttpTool",
 ]
+
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
@@ -3,14 +3,26 @@
 This module provides the HttpTool class, which enables making HTTP requests to external
 APIs and services. It supports configurable methods, headers, and parameters with proper
 timeout handling.
+
+Requests go through the pooled client of :mod:`oxygent.utils.http_client`, so
+connections are kept alive across calls. Responses are streamed and read up to
+``max_response_size`` bytes. With ``is_conditional_cached``, GET responses that
+carry an ``ETag`` or ``Last-Modified`` header are kept and revalidated, a
+``304 Not Modified`` answer returns the kept body.
 """
 
-import httpx
+import json
+from collections import OrderedDict
+
 from pydantic import Field
 
+from ...config import Config
 from ...schemas import OxyRequest, OxyResponse, OxyState
+from ...utils.http_client import get_http_client, read_response
 from ..base_tool import BaseTool
 
+BODY_METHODS = ("POST", "PUT", "PATCH")
+
 
 class HttpTool(BaseTool):
     """Tool for making HTTP requests to external APIs and services.
@@ -20,7 +32,13 @@ class HttpTool(BaseTool):
         url (str): Target URL for the HTTP request.
         headers (dict): HTTP headers to include in the request.
         default_params (dict): Default parameters that will be merged with
-            request arguments.
+            request arguments. They are sent as query parameters, or as the body
+            of POST, PUT and PATCH requests.
+        body_format (str): "json" or "form" encoding of the body.
+        max_response_size (int): Bytes of the response read at most, 0 for no
+            limit.
+        is_conditional_cached (bool): Whether GET responses are revalidated with
+            ``If-None-Match``/``If-Modified-Since`` instead of fetched again.
     """
 
     method: str = Field("GET", description="HTTP method to use")
@@ -29,6 +47,39 @@ class HttpTool(BaseTool):
     default_params: dict = Field(
         default_factory=dict, description="Default request parameters"
     )
+    body_format: str = Field("json", description="Body encoding: json or form")
+    max_response_size: int = Field(
+        default_factory=Config.get_tool_http_max_response_size,
+        description="Bytes of the response read at most, 0 = no limit",
+    )
+    is_conditional_cached: bool = Field(
+        False, description="Revalidate GET responses with ETag/Last-Modified"
+    )
+    cache_size: int = Field(128, description="GET responses kept for revalidation")
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._response_cache: OrderedDict = OrderedDict()
+
+    def _build_request_kwargs(self, params: dict) -> dict:
+        if self.method.upper() not in BODY_METHODS:
+            return {"params": params}
+        if self.body_format == "form":
+            return {"data": params}
+        return {"json": params}
+
+    def _cache_response(self, cache_key: str, response, text: str) -> None:
+        validators = {}
+        if "etag" in response.headers:
+            validators["If-None-Match"] = response.headers["etag"]
+        if "last-modified" in response.headers:
+            validators["If-Modified-Since"] = response.headers["last-modified"]
+        if not validators:
+            return
+        self._response_cache[cache_key] = (validators, text)
+        self._response_cache.move_to_end(cache_key)
+        while len(self._response_cache) > self.cache_size:
+            self._response_cache.popitem(last=False)
 
     async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
         """Execute the HTTP request."""
@@ -36,9 +87,31 @@ class HttpTool(BaseTool):
         params = self.default_params.copy()
         params.update(oxy_request.arguments)
 
-        # Make HTTP request with timeout handling
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            http_response = await client.get(
-                self.url, params=params, headers=self.headers
+        method = self.method.upper()
+        headers = self.headers
+        cache_key, cached = None, None
+        if self.is_conditional_cached and method == "GET":
+            cache_key = json.dumps(params, sort_keys=True, default=str)
+            cached = self._response_cache.get(cache_key)
+            if cached:
+                headers = {**self.headers, **cached[0]}
+
+        async with get_http_client().stream(
+            method,
+            self.url,
+            headers=headers,
+            timeout=self.timeout,
+            **self._build_request_kwargs(params),
+        ) as http_response:
+            if cached and http_response.status_code == 304:
+                self._response_cache.move_to_end(cache_key)
+                return OxyResponse(state=OxyState.COMPLETED, output=cached[1])
+            text, is_truncated = await read_response(
+                http_response, self.max_response_size
             )
-            return OxyResponse(state=OxyState.COMPLETED, output=http_response.text)
+
+        if is_truncated:
+            text += f"\n... (truncated at {self.max_response_size} bytes)"
+        elif cache_key and http_response.status_code == 200:
+            self._cache_response(cache_key, http_response, text)
+        return OxyResponse(state=OxyState.COMPLETED, output=text)
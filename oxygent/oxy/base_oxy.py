@@ -17,7 +17,10 @@ from pydantic import BaseModel, Field
 
 # from ..mas import MAS
 from ..config import Config
+from ..log_setup import is_trace_sampled, truncate_text
+from ..retry_policy import RetryPolicy
 from ..schemas import OxyRequest, OxyResponse, OxyState
+from ..tracing import PhaseTimer
 from ..utils.common_utils import (
     filter_json_types,
     generate_uuid,
@@ -71,7 +74,10 @@ class Oxy(BaseModel, ABC):
         is_permission_required (bool): Whether permission is needed for execution.
         semaphore (int): Maximum number of concurrent executions.
         timeout (float): Execution timeout in seconds.
+        init_timeout (float): Timeout of :meth:`init` in seconds, 0 for no limit.
         retries (int): Number of retry attempts on failure.
+        retry_policy (RetryPolicy): Backoff, retry budget and circuit breaker.
+            Oxys sharing one policy instance also share its budget and breaker.
     """
 
     name: str = Field(..., description="Identifier for the agent.")
@@ -151,12 +157,21 @@ class Oxy(BaseModel, ABC):
     )
     semaphore: int = Field(16, description="Concurrency limit")
     timeout: float = Field(3600, description="Timeout in seconds.")
+    init_timeout: float = Field(
+        default_factory=Config.get_tool_init_timeout,
+        description="Timeout of init() in seconds, 0 for no limit.",
+    )
     retries: int = Field(2)
     delay: float = Field(1.0)
+    retry_policy: RetryPolicy = Field(
+        default_factory=RetryPolicy,
+        description="Backoff, retry budget and circuit breaker policy",
+    )
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._semaphore: asyncio.Semaphore = asyncio.Semaphore(self.semaphore)
+        self.retry_policy.bind(self.name)
         self._ensure_async_functions()
         self._set_desc_for_llm()
 
@@ -222,6 +237,21 @@ class Oxy(BaseModel, ABC):
     async def init(self):
         self._set_desc_for_llm()
 
+    def get_init_dependencies(self) -> list:
+        """Names of the oxys that must be initialized before this one."""
+        return []
+
+    def _get_semaphore(self, oxy_request: OxyRequest):
+        """Return the concurrency guard for this call.
+
+        Slots are granted by the MAS fair scheduler when one is configured for this
+        category, otherwise by the FIFO semaphore of the oxy.
+        """
+        scheduler = getattr(self.mas, "scheduler", None) if self.mas else None
+        if scheduler and scheduler.is_scheduled(self):
+            return scheduler.slot(self, oxy_request)
+        return self._semaphore
+
     async def _pre_process(self, oxy_request: OxyRequest) -> OxyRequest:
         """Pre-process the request before execution."""
         # Initialize the parameters
@@ -236,14 +266,23 @@ class Oxy(BaseModel, ABC):
         return oxy_request
 
     async def _pre_log(self, oxy_request: OxyRequest):
-        """Log the tool call information."""
+        """Log the tool call information of sampled traces."""
+        if not logger.isEnabledFor(logging.INFO) or not is_trace_sampled(
+            oxy_request.current_trace_id, Config.get_log_sample_rate()
+        ):
+            return
         query = (
-            oxy_request.arguments.get("query", "...")
+            truncate_text(
+                oxy_request.arguments.get("query", "..."),
+                Config.get_log_max_observation_length(),
+            )
             if self.is_detailed_tool_call
             else "..."
         )
         logger.info(
-            f"{' >>> '.join(oxy_request.call_stack)}  : {query}",
+            "%s  : %s",
+            " >>> ".join(oxy_request.call_stack),
+            query,
             extra={
                 "trace_id": oxy_request.current_trace_id,
                 "node_id": oxy_request.node_id,
@@ -278,7 +317,7 @@ class Oxy(BaseModel, ABC):
                         "size": 1,
                     },
                 )
-            logging.info(f"ES search returned {len(es_response['hits']['hits'])} hits")
+            logger.info("ES search returned %d hits", len(es_response["hits"]["hits"]))
             if es_response["hits"]["hits"]:
                 current_node_order = es_response["hits"]["hits"][0]["_source"][
                     "update_time"
@@ -289,7 +328,12 @@ class Oxy(BaseModel, ABC):
                     ]
 
                     logger.info(
-                        f"{' <<< '.join(oxy_request.call_stack)}  Load from ES: {restart_node_output}",
+                        "%s  Load from ES: %s",
+                        " <<< ".join(oxy_request.call_stack),
+                        truncate_text(
+                            restart_node_output,
+                            Config.get_log_max_observation_length(),
+                        ),
                         extra={
                             "trace_id": oxy_request.current_trace_id,
                             "node_id": oxy_request.node_id,
@@ -314,7 +358,12 @@ class Oxy(BaseModel, ABC):
                     oxy_request.is_load_data_for_restart = False
                     restart_node_output = oxy_request.restart_node_output
                     logger.info(
-                        f"{' <<< '.join(oxy_request.call_stack)}  Wrote by user: {restart_node_output}",
+                        "%s  Wrote by user: %s",
+                        " <<< ".join(oxy_request.call_stack),
+                        truncate_text(
+                            restart_node_output,
+                            Config.get_log_max_observation_length(),
+                        ),
                         extra={
                             "trace_id": oxy_request.current_trace_id,
                             "node_id": oxy_request.node_id,
@@ -336,7 +385,8 @@ class Oxy(BaseModel, ABC):
                     oxy_request.is_load_data_for_restart = False
             else:
                 logger.warning(
-                    f"{' === '.join(oxy_request.call_stack)}  : load null from ES.",
+                    "%s  : load null from ES.",
+                    " === ".join(oxy_request.call_stack),
                     extra={
                         "trace_id": oxy_request.current_trace_id,
                         "node_id": oxy_request.node_id,
@@ -431,11 +481,23 @@ class Oxy(BaseModel, ABC):
         return await self.func_process_output(oxy_response)
 
     async def _post_log(self, oxy_response: OxyResponse):
-        """Log the execution result."""
-        obs = oxy_response.output if self.is_detailed_observation else "..."
+        """Log the execution result of sampled traces and of every failure."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         oxy_request = oxy_response.oxy_request
+        if oxy_response.state is not OxyState.FAILED and not is_trace_sampled(
+            oxy_request.current_trace_id, Config.get_log_sample_rate()
+        ):
+            return
+        obs = (
+            truncate_text(oxy_response.output, Config.get_log_max_observation_length())
+            if self.is_detailed_observation
+            else "..."
+        )
         logger.info(
-            f"{' <<< '.join(oxy_request.call_stack)}  : {obs}",
+            "%s  : %s",
+            " <<< ".join(oxy_request.call_stack),
+            obs,
             extra={
                 "trace_id": oxy_request.current_trace_id,
                 "node_id": oxy_request.node_id,
@@ -532,6 +594,19 @@ class Oxy(BaseModel, ABC):
                 }
             )
 
+    def _observe_metrics(self, oxy_response: OxyResponse, timer: PhaseTimer):
+        metrics = getattr(self.mas, "metrics", None) if self.mas else None
+        if metrics:
+            metrics.observe_oxy(self, oxy_response, timer.total)
+
+    def _record_timings(self, oxy_response: OxyResponse, timer: PhaseTimer):
+        """Store the phase timings, export the spans and observe the metrics."""
+        oxy_response.extra["timings"] = timer.to_dict()
+        tracer = getattr(self.mas, "tracer", None) if self.mas else None
+        if tracer:
+            tracer.export(self, oxy_response, timer)
+        self._observe_metrics(oxy_response, timer)
+
     async def execute(self, oxy_request: OxyRequest) -> OxyResponse:
         """Execute the complete lifecycle of an Oxy operation.
 
@@ -552,8 +627,13 @@ class Oxy(BaseModel, ABC):
         - Logging and data saving
         - Output formatting
         - Post-send message handling
+
+        The time spent in each phase, semaphore queueing included, is stored
+        in ``oxy_response.extra["timings"]``.
         """
-        async with self._semaphore:
+        timer = PhaseTimer()
+        async with self._get_semaphore(oxy_request):
+            timer.mark("semaphore_wait")
             # Pre-process
             oxy_request = await self._pre_process(oxy_request)
             await self._pre_log(oxy_request)
@@ -564,8 +644,12 @@ class Oxy(BaseModel, ABC):
                 if isinstance(v, (int, str, float, list, dict, tuple, set))
             }
             oxy_request.input_md5 = get_md5(to_json(key_to_md5))
+            timer.mark("pre_process")
             result = await self._request_interceptor(oxy_request)
+            timer.mark("request_interceptor")
             if isinstance(result, OxyResponse):
+                # Loaded for a restart: replaces the timings of the previous run
+                self._record_timings(result, timer)
                 return result
 
             event = asyncio.Event()
@@ -591,13 +675,30 @@ class Oxy(BaseModel, ABC):
                 )
             oxy_request = await self._format_input(oxy_request)
             await self._pre_send_message(oxy_request)
+            timer.mark("pre_send_message")
 
             oxy_request = await self._before_execute(oxy_request)
 
             # Execute the request with retry logic
+            retry_policy = self.retry_policy
+            max_attempts = retry_policy.get_max_attempts(self.retries)
             attempt = 0
-            while attempt < self.retries:
+            if not retry_policy.allow_request():
+                logger.warning(
+                    f"Circuit breaker of oxy {self.name} is open. Fail fast.",
+                    extra={
+                        "trace_id": oxy_request.current_trace_id,
+                        "node_id": oxy_request.node_id,
+                    },
+                )
+                oxy_response = OxyResponse(
+                    state=OxyState.FAILED,
+                    output=f"Error executing oxy {self.name}: circuit breaker is open",
+                )
+                max_attempts = 0  # Skip the attempts below
+            while attempt < max_attempts:
                 try:
+                    retry_policy.record_attempt()
                     if self.func_interceptor:
                         error_message = await self.func_interceptor(oxy_request)
                         if error_message:
@@ -610,6 +711,10 @@ class Oxy(BaseModel, ABC):
                         oxy_response = await self.func_execute(oxy_request)
                     else:
                         oxy_response = await self._execute(oxy_request)
+                    if oxy_response.state is OxyState.FAILED:
+                        retry_policy.record_failure()
+                    else:
+                        retry_policy.record_success()
                     break
                 except asyncio.CancelledError:
                     # if the task is cancelled, log and return a canceled response
@@ -626,13 +731,15 @@ class Oxy(BaseModel, ABC):
                     )
                     oxy_response.oxy_request = oxy_request
                     asyncio.create_task(self._post_save_data(oxy_response))
+                    timer.mark("execute")
+                    self._observe_metrics(oxy_response, timer)
                     raise
                 except Exception as e:
                     # Handle exceptions and retry logic
                     await self._handle_exception(e)
                     attempt += 1
                     logger.warning(
-                        f"Error executing oxy {self.name}: {str(e)}. Attempt {attempt} of {self.retries}.",
+                        f"Error executing oxy {self.name}: {str(e)}. Attempt {attempt} of {max_attempts}.",
                         extra={
                             "trace_id": oxy_request.current_trace_id,
                             "node_id": oxy_request.node_id,
@@ -645,28 +752,43 @@ class Oxy(BaseModel, ABC):
                             "node_id": oxy_request.node_id,
                         },
                     )
-                    if attempt < self.retries:
-                        await asyncio.sleep(self.delay)
+                    if retry_policy.should_retry(e, attempt, max_attempts):
+                        await asyncio.sleep(retry_policy.get_delay(attempt, self.delay))
                     else:
                         error_msg = traceback.format_exc()
                         logger.error(
-                            f"Max retries reached. Failed. {error_msg}",
+                            f"Retries stopped after attempt {attempt}. Failed. {error_msg}",
                             extra={
                                 "trace_id": oxy_request.current_trace_id,
                                 "node_id": oxy_request.node_id,
                             },
                         )
+                        retry_policy.record_failure()
                         oxy_response = OxyResponse(
                             state=OxyState.FAILED,
                             output=f"Error executing oxy {self.name}: {str(e)}",
                         )
-
+                        break
+
+            timer.mark("execute")
+            if (
+                oxy_response.oxy_request is not None
+                and oxy_response.oxy_request is not oxy_request
+            ):
+                # A response passed through from a sub-call (e.g. the summary LLM
+                # of ParallelAgent) is still saved as the record of that call
+                oxy_response = oxy_response.model_copy(
+                    update={"extra": dict(oxy_response.extra)}
+                )
             oxy_response.oxy_request = oxy_request
             oxy_response = await self._after_execute(oxy_response)
 
             # Post-process
             oxy_response = await self._post_process(oxy_response)
             await self._post_log(oxy_response)
+            timer.mark("post_process")
+            # Phases up to here are saved in the node record
+            oxy_response.extra["timings"] = timer.to_dict()
 
             if self.mas:
 
@@ -692,8 +814,11 @@ class Oxy(BaseModel, ABC):
                         "node_id": oxy_request.node_id,
                     },
                 )
+            timer.mark("post_save_data")
 
             oxy_response = await self._format_output(oxy_response)
             await self._post_send_message(oxy_response)
+            timer.mark("post_send_message")
 
+            self._record_timings(oxy_response, timer)
             return oxy_response
@@ -1,6 +1,30 @@
-from .parallel_flow import ParallelFlow
-from .plan_and_solve import PlanAndSolve
-from .reflexion import MathReflexion, Reflexion
-from .workflow import Workflow
+"""Flows, imported on first use."""
 
-__all__ = ["Workflow", "ParallelFlow", "PlanAndSolve", "Reflexion", "MathReflexion"]
+from typing import TYPE_CHECKING
+
+from ...utils.lazy_import import lazy_module
+
+if TYPE_CHECKING:
+    from .parallel_flow import ParallelFlow
+    from .plan_and_solve import PlanAndSolve
+    from .reflexion import MathReflexion, Reflexion
+    from .workflow import Workflow
+
+_LAZY_IMPORTS = {
+    "Workflow": ".workflow",
+    "ParallelFlow": ".parallel_flow",
+    "PlanAndSolve": ".plan_and_solve",
+    "Reflexion": ".reflexion",
+    "MathReflexion": ".reflexion",
+}
+
+__all__ = [
+    "Workflow",
+    "ParallelFlow",
+    "PlanAndSolve",
+    "Reflexion",
+    "MathReflexion",
+]
+
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
@@ -1,7 +1,22 @@
-from .function_hub import FunctionHub
-from .function_tool import FunctionTool
+"""Function tools, imported on first use."""
+
+from typing import TYPE_CHECKING
+
+from ...utils.lazy_import import lazy_module
+
+if TYPE_CHECKING:
+    from .function_hub import FunctionHub
+    from .function_tool import FunctionTool
+
+_LAZY_IMPORTS = {
+    "FunctionHub": ".function_hub",
+    "FunctionTool": ".function_tool",
+}
 
 __all__ = [
     "FunctionHub",
     "FunctionTool",
 ]
+
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
@@ -3,16 +3,96 @@
 This module provides the FunctionHub class, which serves as a central registry for
 Python functions that can be dynamically converted into tools within the OxyGent system.
 It supports both synchronous and asynchronous functions with automatic conversion.
+
+Synchronous functions run outside the event loop, so that blocking tools do not
+stall concurrent traces. The ``executor`` of a tool is one of:
+
+    - ``"thread"``: a bounded thread pool shared by all hubs, for blocking I/O
+    - ``"process"``: a bounded pool of ``spawn`` processes, for CPU-bound work.
+      The function must be defined at module level and its arguments and result
+      must be picklable.
+    - ``"loop"``: called directly on the event loop, for trivial functions
 """
 
 import asyncio
 import functools
+import importlib
+import inspect
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
 
 from pydantic import Field
 
+from ...config import Config
 from ..base_tool import BaseTool
 from .function_tool import FunctionTool
 
+EXECUTORS = ("thread", "process", "loop")
+
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_thread_pool() -> ThreadPoolExecutor:
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(
+            max_workers=Config.get_tool_function_max_threads(),
+            thread_name_prefix="function_tool",
+        )
+    return _thread_pool
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=Config.get_tool_function_max_processes() or None,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    global _process_pool
+    if _process_pool is pool:
+        _process_pool = None
+    pool.shutdown(wait=False)
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    """Shut down the pools, they are created again on the next call."""
+    global _thread_pool, _process_pool
+    for pool in (_thread_pool, _process_pool):
+        if pool is not None:
+            pool.shutdown(wait=wait)
+    _thread_pool = _process_pool = None
+
+
+def _call_by_reference(module_name: str, qualname: str, args: tuple, kwargs: dict):
+    """Look up a decorated function in a worker process and call it."""
+    func = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        func = getattr(func, attr)
+    return inspect.unwrap(func)(*args, **kwargs)
+
+
+def _check_picklable(name: str, kwargs: dict) -> None:
+    try:
+        pickle.dumps(kwargs)
+    except Exception:
+        for key, value in kwargs.items():
+            try:
+                pickle.dumps(value)
+            except Exception as e:
+                raise TypeError(
+                    f"Argument {key} of {name} cannot be sent to a process: {e}"
+                ) from e
+        raise
+
 
 class FunctionHub(BaseTool):
     """Central hub for registering and managing Python functions as tools.
@@ -23,11 +103,23 @@ class FunctionHub(BaseTool):
     Attributes:
         func_dict (dict): Dictionary mapping function names to their descriptions
             and execution functions. Format: {name: (description, async_func)}
+        executor (str): Where synchronous functions run unless set per tool, one
+            of ``"thread"``, ``"process"`` and ``"loop"``.
+        is_arguments_validated (bool): Whether the tools validate and coerce their
+            arguments against the parameter annotations.
     """
 
     func_dict: dict = Field(
         default_factory=dict, description="Registry of functions and their metadata"
     )
+    executor: str = Field(
+        default_factory=Config.get_tool_function_executor,
+        description="Default executor of synchronous functions",
+    )
+    is_arguments_validated: bool = Field(
+        default_factory=Config.get_tool_function_is_arguments_validated,
+        description="Validate and coerce tool arguments against the annotations",
+    )
 
     async def init(self):
         """Initialize the hub by creating FunctionTool instances for all registered
@@ -37,7 +129,7 @@ class FunctionHub(BaseTool):
         instances and registers them with the MAS (Multi-Agent System).
         """
         await super().init()
-        params = self.model_dump(exclude={"func_dict", "name", "desc"})
+        params = self.model_dump(exclude={"func_dict", "name", "desc", "executor"})
 
         # Create FunctionTool instances for each registered function
         for tool_name, (tool_desc, tool_func) in self.func_dict.items():
@@ -47,34 +139,80 @@ class FunctionHub(BaseTool):
             function_tool.set_mas(self.mas)
             self.mas.add_oxy(function_tool)
 
-    def tool(self, description):
+    def tool(self, description, executor: Optional[str] = None):
         """Decorator for registering functions as tools.
 
         This decorator automatically converts both synchronous and asynchronous
         functions into async functions and registers them in the function hub.
-        Synchronous functions are wrapped to run asynchronously.
+        Synchronous functions are wrapped to run in ``executor``.
 
         Args:
             description (str): Human-readable description of the tool's functionality.
+            executor (Optional[str]): ``"thread"``, ``"process"`` or ``"loop"``,
+                defaults to the ``executor`` of the hub at call time.
 
         Returns:
             Callable: Decorator function that registers and returns the async version
                 of the decorated function.
         """
+        if executor is not None and executor not in EXECUTORS:
+            raise ValueError(f"executor must be one of {EXECUTORS}, got {executor}")
 
         def decorator(func):
             # Check if function is already asynchronous
             if asyncio.iscoroutinefunction(func):
+                if executor not in (None, "loop"):
+                    raise ValueError(f"Async function {func.__name__} runs on the loop")
                 async_func = func
             else:
+                if executor == "process":
+                    self._check_process_function(func)
+
                 # Wrap synchronous function to make it asynchronous
                 @functools.wraps(func)
                 async def async_func(*args, **kwargs):
-                    # TODO: Use thread pool for blocking synchronous operations
-                    return func(*args, **kwargs)
+                    return await self._run_sync(func, executor, args, kwargs)
 
             # Register function in the hub's dictionary
             self.func_dict[func.__name__] = (description, async_func)
             return async_func  # Return the async version
 
         return decorator
+
+    @staticmethod
+    def _check_process_function(func) -> None:
+        if "<locals>" in func.__qualname__:
+            raise ValueError(
+                f"{func.__name__} must be defined at module level to run in a process"
+            )
+        for param in inspect.signature(func).parameters.values():
+            if getattr(param.annotation, "__name__", None) == "OxyRequest":
+                raise ValueError(f"{func.__name__} cannot take OxyRequest in a process")
+
+    async def _run_sync(self, func, executor: Optional[str], args, kwargs):
+        executor = executor or self.executor
+        if executor == "loop":
+            return func(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        if executor == "thread":
+            return await loop.run_in_executor(
+                get_thread_pool(), functools.partial(func, *args, **kwargs)
+            )
+        if executor != "process":
+            raise ValueError(f"executor must be one of {EXECUTORS}, got {executor}")
+        self._check_process_function(func)
+        _check_picklable(func.__name__, {"args": args, **kwargs})
+        pool = get_process_pool()
+        try:
+            return await loop.run_in_executor(
+                pool,
+                _call_by_reference,
+                func.__module__,
+                func.__qualname__,
+                args,
+                kwargs,
+            )
+        except BrokenProcessPool:
+            # A worker died, start a fresh pool on the next call
+            _discard_process_pool(pool)
+            raise
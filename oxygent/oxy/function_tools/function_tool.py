@@ -3,16 +3,22 @@
 This module provides the FunctionTool class, which wraps Python functions to make them
 executable within the OxyGent system. It automatically extracts input schemas from
 function signatures and handles execution with proper error handling.
+
+The signature is only inspected when the tool is created: it is compiled into a
+call plan of ``(name, is_oxy_request, default)`` entries that maps the arguments
+of a request to keyword arguments.
 """
 
 import logging
 from inspect import Parameter, signature
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
-from pydantic import Field
+from pydantic import Field, TypeAdapter
 from pydantic.fields import FieldInfo
 from pydantic_core import PydanticUndefined
+from typing_extensions import NotRequired, Required, TypedDict
 
+from ...config import Config
 from ...schemas import OxyRequest, OxyResponse, OxyState
 from ..base_tool import BaseTool
 
@@ -30,6 +36,8 @@ class FunctionTool(BaseTool):
             Defaults to True for security.
         func_execute (Optional[Callable]): The Python function to execute.
             Should be an async function or will be wrapped as async.
+        is_arguments_validated (bool): Whether arguments are validated and coerced
+            against the parameter annotations before the call.
     """
 
     is_permission_required: bool = Field(True, description="")
@@ -37,12 +45,22 @@ class FunctionTool(BaseTool):
     needs_oxy_request: bool = Field(
         False, description="Whether this tool needs oxy_request parameter"
     )
+    is_arguments_validated: bool = Field(
+        default_factory=Config.get_tool_function_is_arguments_validated,
+        description="Validate and coerce arguments against the annotations",
+    )
 
     def __init__(self, **kwargs):
         """Initialize the function tool and extract input schema from function
         signature."""
         super().__init__(**kwargs)
         self.input_schema = self._extract_input_schema(self.func_process)
+        self._call_plan = self._compile_call_plan(self.func_process)
+        self._arguments_adapter = (
+            self._build_arguments_adapter(self.func_process)
+            if self.is_arguments_validated
+            else None
+        )
         self._set_desc_for_llm()
 
     def _extract_input_schema(self, func):
@@ -92,39 +110,60 @@ class FunctionTool(BaseTool):
 
         return schema
 
+    @staticmethod
+    def _is_oxy_request(param: Parameter) -> bool:
+        annotation = param.annotation
+        if annotation is Parameter.empty:
+            return False
+        return getattr(annotation, "__name__", str(annotation)) == "OxyRequest"
+
+    def _compile_call_plan(self, func) -> tuple:
+        """``(name, is_oxy_request, default)`` of every parameter of ``func``.
+
+        The default is used when the argument is missing: the default of the
+        parameter or of its pydantic ``Field``, otherwise None.
+        """
+        plan = []
+        for name, param in signature(func).parameters.items():
+            if isinstance(param.default, FieldInfo):
+                default = param.default.default
+                if default is PydanticUndefined:
+                    default = None
+            elif param.default is not Parameter.empty:
+                default = param.default
+            else:
+                default = None
+            plan.append((name, self._is_oxy_request(param), default))
+        return tuple(plan)
+
+    def _build_arguments_adapter(self, func) -> TypeAdapter:
+        """TypeAdapter of a TypedDict with one key per argument of ``func``."""
+        fields = {}
+        for name, param in signature(func).parameters.items():
+            if self._is_oxy_request(param):
+                continue
+            annotation = (
+                Any if param.annotation is Parameter.empty else param.annotation
+            )
+            if isinstance(param.default, FieldInfo):
+                is_required = param.default.is_required()
+            else:
+                is_required = param.default is Parameter.empty
+            fields[name] = (Required if is_required else NotRequired)[annotation]
+        return TypeAdapter(TypedDict(f"{self.name}_arguments", fields))
+
     async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
         """Execute the wrapped function with provided arguments."""
         try:
+            arguments = oxy_request.arguments
+            if self._arguments_adapter is not None:
+                arguments = self._arguments_adapter.validate_python(arguments)
             func_kwargs = {}
-            sig = signature(self.func_process)
-
-            for param_name, param in sig.parameters.items():
-                param_type = param.annotation
-                
-                # Get type name, handling empty annotations
-                if param_type is Parameter.empty:
-                    type_name = None
-                else:
-                    type_name = getattr(param_type, "__name__", str(param_type))
-                    # Handle OxyRequest parameters
-                    if type_name == "OxyRequest":
-                        func_kwargs[param_name] = oxy_request
-                        continue
-
-                # Process parameter value based on availability in arguments
-                if param_name in oxy_request.arguments:
-                    func_kwargs[param_name] = oxy_request.arguments[param_name]
+            for name, is_oxy_request, default in self._call_plan:
+                if is_oxy_request:
+                    func_kwargs[name] = oxy_request
                 else:
-                    # Handle missing arguments - use parameter default if available
-                    if isinstance(param.default, FieldInfo):
-                        func_kwargs[param_name] = (
-                            param.default.default if param.default.default is not PydanticUndefined else None
-                        )
-                    elif param.default is not Parameter.empty:
-                        func_kwargs[param_name] = param.default
-                    else:
-                        # No default value available, pass None
-                        func_kwargs[param_name] = None
+                    func_kwargs[name] = arguments.get(name, default)
 
             result = await self.func_process(**func_kwargs)
             return OxyResponse(state=OxyState.COMPLETED, output=result)
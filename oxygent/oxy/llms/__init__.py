@@ -1,7 +1,22 @@
-from .http_llm import HttpLLM
-from .openai_llm import OpenAILLM
+"""LLMs, imported on first use: ``OpenAILLM`` loads the ``openai`` SDK."""
+
+from typing import TYPE_CHECKING
+
+from ...utils.lazy_import import lazy_module
+
+if TYPE_CHECKING:
+    from .http_llm import HttpLLM
+    from .openai_llm import OpenAILLM
+
+_LAZY_IMPORTS = {
+    "HttpLLM": ".http_llm",
+    "OpenAILLM": ".openai_llm",
+}
 
 __all__ = [
     "HttpLLM",
     "OpenAILLM",
 ]
+
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
@@ -162,12 +162,28 @@ class HttpLLM(RemoteLLM):
                     if data.get("candidates")
                     else ""
                 )
+                usage_data = data.get("usageMetadata") or {}
+                usage = {
+                    "prompt_tokens": usage_data.get("promptTokenCount", 0),
+                    "completion_tokens": usage_data.get("candidatesTokenCount", 0),
+                }
             elif use_openai:
                 response_message = data["choices"][0]["message"]
                 result = response_message.get("content") or response_message.get(
                     "reasoning_content"
                 )
+                usage_data = data.get("usage") or {}
+                usage = {
+                    "prompt_tokens": usage_data.get("prompt_tokens", 0),
+                    "completion_tokens": usage_data.get("completion_tokens", 0),
+                }
             else:  # ollama
                 result = data["message"]["content"]
+                usage = {
+                    "prompt_tokens": data.get("prompt_eval_count", 0),
+                    "completion_tokens": data.get("eval_count", 0),
+                }
 
-            return OxyResponse(state=OxyState.COMPLETED, output=result)
+            return OxyResponse(
+                state=OxyState.COMPLETED, output=result, extra={"usage": usage}
+            )
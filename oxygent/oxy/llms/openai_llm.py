@@ -109,6 +109,14 @@ class OpenAILLM(RemoteLLM):
                     )
             return OxyResponse(state=OxyState.COMPLETED, output=answer)
         else:
+            extra = {}
+            if completion.usage:
+                extra["usage"] = {
+                    "prompt_tokens": completion.usage.prompt_tokens,
+                    "completion_tokens": completion.usage.completion_tokens,
+                }
             return OxyResponse(
-                state=OxyState.COMPLETED, output=completion.choices[0].message.content
+                state=OxyState.COMPLETED,
+                output=completion.choices[0].message.content,
+                extra=extra,
             )
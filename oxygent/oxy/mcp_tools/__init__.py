@@ -1,7 +1,21 @@
-from .mcp_tool import MCPTool
-from .sse_mcp_client import SSEMCPClient
-from .stdio_mcp_client import StdioMCPClient
-from .streamable_mcp_client import StreamableMCPClient
+"""MCP tools, imported on first use: the clients load the ``mcp`` SDK."""
+
+from typing import TYPE_CHECKING
+
+from ...utils.lazy_import import lazy_module
+
+if TYPE_CHECKING:
+    from .mcp_tool import MCPTool
+    from .sse_mcp_client import SSEMCPClient
+    from .stdio_mcp_client import StdioMCPClient
+    from .streamable_mcp_client import StreamableMCPClient
+
+_LAZY_IMPORTS = {
+    "MCPTool": ".mcp_tool",
+    "StdioMCPClient": ".stdio_mcp_client",
+    "SSEMCPClient": ".sse_mcp_client",
+    "StreamableMCPClient": ".streamable_mcp_client",
+}
 
 __all__ = [
     "MCPTool",
@@ -9,3 +23,6 @@ __all__ = [
     "SSEMCPClient",
     "StreamableMCPClient",
 ]
+
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
@@ -6,18 +6,24 @@ and tool execution through the Model Context Protocol standard.
 """
 
 import asyncio
+import json
 import logging
+import os
 from contextlib import AsyncExitStack
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-import anyio
-from mcp import ClientSession
 from pydantic import Field
 
 from ...config import Config
 from ...schemas import OxyRequest, OxyResponse, OxyState
+from ...utils.common_utils import get_md5, to_json
 from ..base_tool import BaseTool
 from .mcp_tool import MCPTool
+from .session_pool import MCPSessionPool
+from .supervisor import UNSENT_ERRORS, MCPConnectionSupervisor, is_connection_error
+
+if TYPE_CHECKING:
+    from mcp import ClientSession
 
 logger = logging.getLogger(__name__)
 
@@ -29,8 +35,17 @@ class BaseMCPClient(BaseTool):
     It handles server lifecycle management, tool discovery, dynamic tool registration,
     and tool execution through the MCP protocol.
 
+    Subclasses implement the transport in :meth:`_session_context`.
+
     Attributes:
         included_tool_name_list: List of tool names discovered from the MCP server.
+        is_manifest_cached: Whether the discovered tools are saved under the cache
+            dir, so that the next start registers them without waiting for the
+            server and revalidates them in the background.
+        session_pool_size: Sessions kept open per client for calls with dynamic
+            headers or without keep-alive, 0 opens one per call.
+        ping_interval: Seconds between pings of the keep-alive session, a failed
+            ping reconnects in the background, see :class:`MCPConnectionSupervisor`.
     """
 
     included_tool_name_list: list = Field(default_factory=list)
@@ -40,6 +55,34 @@ class BaseMCPClient(BaseTool):
     is_dynamic_headers: bool = Field(False, description="is dynamic headers")
     is_inherit_headers: bool = Field(False, description="is inherit headers")
     is_keep_alive: bool = Field(default_factory=Config.get_tool_mcp_is_keep_alive)
+    is_manifest_cached: bool = Field(
+        default_factory=Config.get_tool_mcp_is_manifest_cached,
+        description="Start from the cached tool manifest, revalidate in background",
+    )
+    session_pool_size: int = Field(
+        default_factory=Config.get_tool_mcp_session_pool_size,
+        description="Pooled sessions for dynamic headers or no keep-alive, 0 = off",
+    )
+    session_idle_timeout: float = Field(
+        default_factory=Config.get_tool_mcp_session_idle_timeout,
+        description="Seconds before an idle pooled session is closed",
+    )
+    session_health_check_interval: float = Field(
+        default_factory=Config.get_tool_mcp_session_health_check_interval,
+        description="Idle seconds after which a pooled session is pinged on reuse",
+    )
+    ping_interval: float = Field(
+        default_factory=Config.get_tool_mcp_ping_interval,
+        description="Seconds between pings of the keep-alive session, 0 = off",
+    )
+    reconnect_max_delay: float = Field(
+        default_factory=Config.get_tool_mcp_reconnect_max_delay,
+        description="Upper bound of the backoff between reconnect attempts",
+    )
+    reconnect_grace_period: float = Field(
+        default_factory=Config.get_tool_mcp_reconnect_grace_period,
+        description="Seconds a call waits for a reconnect before failing",
+    )
 
     def __init__(self, **kwargs):
         """Initialize the MCP client with necessary resources.
@@ -48,26 +91,204 @@ class BaseMCPClient(BaseTool):
         resource management throughout the client lifecycle.
         """
         super().__init__(**kwargs)
-        self._session: ClientSession = None
+        self._session: "ClientSession" = None
         self._cleanup_lock: asyncio.Lock = asyncio.Lock()
         self._exit_stack: AsyncExitStack = AsyncExitStack()
         self._stdio_context: Any = Field(None)
+        self._connect_task: Optional[asyncio.Task] = None
+        self._supervisor: Optional[MCPConnectionSupervisor] = None
+        self._session_pool: Optional[MCPSessionPool] = (
+            MCPSessionPool(
+                self._session_context,
+                max_size=self.session_pool_size,
+                idle_timeout=self.session_idle_timeout,
+                health_check_interval=self.session_health_check_interval,
+            )
+            if self.session_pool_size > 0
+            else None
+        )
+
+    def _session_context(self, headers: dict):
+        """Async context manager yielding an initialized ``ClientSession``."""
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not implement a transport"
+        )
+
+    def _open_session(self, headers: dict):
+        """A pooled session if pooling is enabled, otherwise a new one."""
+        if self._session_pool:
+            return self._session_pool.session(headers)
+        return self._session_context(headers)
+
+    def _set_session(self, session) -> None:
+        self._session = session
+
+    async def _connect(self) -> None:
+        """Open the keep-alive session, reconnected by a supervisor when lost."""
+        supervisor = MCPConnectionSupervisor(
+            lambda: self._session_context(self.headers),
+            self._set_session,
+            name=self.name,
+            ping_interval=self.ping_interval,
+            reconnect_max_delay=self.reconnect_max_delay,
+            grace_period=self.reconnect_grace_period,
+        )
+        await supervisor.start()
+        self._supervisor = supervisor
+
+    async def _get_session(self) -> "ClientSession":
+        """The keep-alive session, waiting for a reconnect in progress."""
+        if not self._session and self._supervisor:
+            await self._supervisor.wait_connected()
+        if not self._session:
+            if self._supervisor:
+                raise RuntimeError(f"Server {self.name} is reconnecting")
+            raise RuntimeError(f"Server {self.name} not initialized")
+        return self._session
+
+    async def init(self, is_fetch_tools=True) -> None:
+        """Connect to the MCP server and register its tools.
+
+        A keep-alive session is only opened when neither dynamic headers are used
+        nor keep-alive is disabled, otherwise the tools are listed through a
+        temporary session. With a cached manifest the tools are registered at once
+        and the server is connected to in the background.
+        """
+        if is_fetch_tools and self.is_manifest_cached:
+            tools = self.load_manifest()
+            if tools is not None:
+                self.register_tools(tools)
+                self._connect_task = asyncio.create_task(self._revalidate(tools))
+                return
+        try:
+            if not self.is_dynamic_headers and self.is_keep_alive:
+                await self._connect()
+            if is_fetch_tools:
+                await self.list_tools()
+        except FileNotFoundError as e:
+            # Re-raise specific validation errors without wrapping
+            logger.error(f"Validation error for server {self.name}: {e}")
+            await self.cleanup()
+            raise
+        except Exception as e:
+            logger.error(f"Error initializing server {self.name}: {e}")
+            await self.cleanup()
+            raise Exception(f"Server {self.name} error") from e
+
+    async def _fetch_tools(self) -> list:
+        """Tool manifest of the server, through the keep-alive session if open."""
+        if self._session or self._supervisor:
+            session = await self._get_session()
+            return self.parse_tools(await session.list_tools())
+        async with self._open_session(self.headers) as session:
+            return self.parse_tools(await session.list_tools())
 
     async def list_tools(self) -> None:
         """Discover and register tools from the MCP server.
 
         Connects to the MCP server, retrieves the list of available tools
         """
-        if not self._session:
+        is_keep_alive = self.is_keep_alive and not self.is_dynamic_headers
+        if is_keep_alive and not (self._session or self._supervisor):
             raise RuntimeError(f"Server {self.name} not initialized")
+        tools = await self._fetch_tools()
+        self.register_tools(tools)
+        if self.is_manifest_cached:
+            self.save_manifest(tools)
+
+    async def _revalidate(self, cached_tools: list) -> None:
+        """Connect in the background and refresh the tools started from the cache."""
+        try:
+            if not self.is_dynamic_headers and self.is_keep_alive:
+                await self._connect()
+            tools = await self._fetch_tools()
+        except Exception as e:
+            logger.warning(f"Revalidating the tools of server {self.name} failed: {e}")
+            return
+        if tools == cached_tools:
+            return
+        removed = {tool["name"] for tool in cached_tools} - {
+            tool["name"] for tool in tools
+        }
+        if removed:
+            logger.warning(
+                f"Server {self.name} no longer provides the tools {sorted(removed)}"
+            )
+        self.register_tools(tools)
+        self.save_manifest(tools)
+
+    async def _wait_connected(self) -> None:
+        """Wait for the background connection of a client started from the cache."""
+        if self._session or self._supervisor or not self._connect_task:
+            return
+        if not self._connect_task.done():
+            await asyncio.shield(self._connect_task)
+        if not (self._session or self._supervisor):
+            # The background connection failed, try again on the request path.
+            # Concurrent requests join one attempt instead of each opening a
+            # supervisor of their own
+            if self._connect_task.done():
+                self._connect_task = asyncio.create_task(self._connect())
+            await asyncio.shield(self._connect_task)
+
+    # ------------------------------------------------------------------
+    # Tool manifest
+    # ------------------------------------------------------------------
+    def get_server_identity(self) -> dict:
+        """Parameters that identify the server, hashed into the manifest key."""
+        return {"class_name": self.class_name}
+
+    def get_manifest_path(self) -> str:
+        key = get_md5(
+            json.dumps(self.get_server_identity(), sort_keys=True, default=str)
+        )
+        return os.path.join(Config.get_cache_save_dir(), "mcp_manifests", f"{key}.json")
+
+    def load_manifest(self) -> Optional[list]:
+        """Cached tools of the server, ``None`` if there are none or unreadable."""
+        path = self.get_manifest_path()
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)["tools"]
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring the tool manifest {path} of {self.name}: {e}")
+            return None
+
+    def save_manifest(self, tools: list) -> None:
+        path = self.get_manifest_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(to_json({"server": self.name, "tools": tools}))
+        os.replace(tmp_path, path)
 
-        tools_response = await self._session.list_tools()
-        self.add_tools(tools_response)
+    @staticmethod
+    def parse_tools(tools_response) -> list:
+        """Name, description and input schema of the tools in a list_tools result."""
+        tools = []
+        for item in tools_response:
+            if isinstance(item, tuple) and item[0] == "tools":
+                for tool in item[1]:
+                    tools.append(
+                        {
+                            "name": tool.name,
+                            "description": tool.description,
+                            "input_schema": tool.inputSchema,
+                        }
+                    )
+        return tools
 
     def add_tools(self, tools_response) -> None:
+        """Register the tools of a list_tools result, see :meth:`register_tools`."""
+        self.register_tools(self.parse_tools(tools_response))
+
+    def register_tools(self, tools: list) -> None:
         """
         dynamically creates MCPTool instances for each discovered tool. These tools are
-        then registered with the MAS for use by agents.
+        then registered with the MAS for use by agents. Tools registered before are
+        updated in place.
         """
         params = self.model_dump(
             exclude={
@@ -83,27 +304,32 @@ class BaseMCPClient(BaseTool):
                 "input_schema",
             }
         )
-        for item in tools_response:
-            if isinstance(item, tuple) and item[0] == "tools":
-                for tool in item[1]:
-                    self.included_tool_name_list.append(tool.name)
-
-                    mcp_tool = MCPTool(
-                        name=tool.name,
-                        desc=tool.description,
-                        mcp_client=self,
-                        server_name=self.name,
-                        input_schema=tool.inputSchema,
-                        func_process_input=self.func_process_input,
-                        func_process_output=self.func_process_output,
-                        func_format_input=self.func_format_input,
-                        func_format_output=self.func_format_output,
-                        func_execute=self.func_execute,
-                        func_interceptor=self.func_interceptor,
-                        **params,
-                    )
-                    mcp_tool.set_mas(self.mas)
-                    self.mas.add_oxy(mcp_tool)
+        for tool in tools:
+            if tool["name"] in self.included_tool_name_list:
+                mcp_tool = self.mas.oxy_name_to_oxy.get(tool["name"])
+                if isinstance(mcp_tool, MCPTool):
+                    mcp_tool.desc = tool["description"]
+                    mcp_tool.input_schema = tool["input_schema"]
+                    mcp_tool._set_desc_for_llm()
+                continue
+            self.included_tool_name_list.append(tool["name"])
+
+            mcp_tool = MCPTool(
+                name=tool["name"],
+                desc=tool["description"],
+                mcp_client=self,
+                server_name=self.name,
+                input_schema=tool["input_schema"],
+                func_process_input=self.func_process_input,
+                func_process_output=self.func_process_output,
+                func_format_input=self.func_format_input,
+                func_format_output=self.func_format_output,
+                func_execute=self.func_execute,
+                func_interceptor=self.func_interceptor,
+                **params,
+            )
+            mcp_tool.set_mas(self.mas)
+            self.mas.add_oxy(mcp_tool)
 
     async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
         """Execute a tool call through the MCP server.
@@ -115,18 +341,19 @@ class BaseMCPClient(BaseTool):
         tool_name = oxy_request.callee
 
         if not self.is_dynamic_headers and self.is_keep_alive:
-            if not self._session:
-                raise RuntimeError(f"Server {self.name} not initialized")
-
+            await self._wait_connected()
+            session = await self._get_session()
             try:
-                mcp_response = await self._session.call_tool(
-                    tool_name, oxy_request.arguments
-                )
-            except anyio.ClosedResourceError:
-                await self.init(is_fetch_tools=False)  # TODO: refetch tools
-                mcp_response = await self._session.call_tool(
-                    tool_name, oxy_request.arguments
-                )
+                mcp_response = await session.call_tool(tool_name, oxy_request.arguments)
+            except Exception as e:
+                if not (self._supervisor and is_connection_error(e)):
+                    raise
+                self._supervisor.reconnect()
+                if not isinstance(e, UNSENT_ERRORS):
+                    # The call may have reached the server, do not run it twice
+                    raise
+                session = await self._get_session()
+                mcp_response = await session.call_tool(tool_name, oxy_request.arguments)
         else:
             if self.is_dynamic_headers:
                 _headers = (
@@ -153,6 +380,11 @@ class BaseMCPClient(BaseTool):
             output=results[0] if len(results) == 1 else results,
         )
 
+    async def call_tool(self, tool_name, arguments, headers=None):
+        """Call a tool through a pooled or temporary session with ``headers``."""
+        async with self._open_session(headers) as session:
+            return await session.call_tool(tool_name, arguments)
+
     async def cleanup(self) -> None:
         """Clean up MCP server resources and connections.
 
@@ -161,6 +393,13 @@ class BaseMCPClient(BaseTool):
         and other exceptions gracefully.
         """
         async with self._cleanup_lock:
+            if self._connect_task and not self._connect_task.done():
+                self._connect_task.cancel()
+            if self._session_pool:
+                await self._session_pool.close()
+            if self._supervisor:
+                await self._supervisor.close()
+                self._supervisor = None
             try:
                 await self._exit_stack.aclose()
             except asyncio.CancelledError:
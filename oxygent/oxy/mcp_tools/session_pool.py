@@ -0,0 +1,212 @@
+"""Pool of initialized MCP client sessions.
+
+MCP clients with dynamic headers or with keep-alive disabled used to open a
+connection (or spawn a stdio server) and run the ``initialize`` handshake for
+every tool call. :class:`MCPSessionPool` keeps those sessions open, keyed by the
+effective headers, and reuses them:
+
+    - at most ``max_size`` sessions per client, callers wait for a free one
+      when all are in use; an idle session of another key is closed to make
+      room
+    - sessions idle for longer than ``idle_timeout`` are closed
+    - a session idle for longer than ``health_check_interval`` is pinged
+      before reuse and replaced if the ping fails
+    - a session whose call raised is closed instead of returned to the pool
+
+Each session is opened and closed by a dedicated task, since the anyio task
+groups of the MCP transports must be exited by the task that entered them.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class PooledSession:
+    """One MCP session, held open by its own task until :meth:`close`."""
+
+    def __init__(self, key):
+        self.key = key
+        self.session = None
+        self.last_used = time.monotonic()
+        self._close_event = asyncio.Event()
+        self._task = None
+
+    async def open(self, session_context: Callable):
+        """Enter ``session_context()`` in a new task and wait for the session."""
+        ready = asyncio.get_running_loop().create_future()
+
+        async def hold():
+            try:
+                async with session_context() as session:
+                    ready.set_result(session)
+                    await self._close_event.wait()
+            except BaseException as e:
+                if not ready.done():
+                    ready.set_exception(e)
+                elif not isinstance(e, asyncio.CancelledError):
+                    logger.debug(f"MCP session closed with an error: {e}")
+
+        self._task = asyncio.create_task(hold())
+        try:
+            self.session = await ready
+        except asyncio.CancelledError:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            raise
+        return self
+
+    async def close(self):
+        self._close_event.set()
+        if self._task:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+class MCPSessionPool:
+    """Bounded pool of initialized sessions keyed by the connection headers."""
+
+    def __init__(
+        self,
+        session_factory: Callable,
+        max_size: int = 8,
+        idle_timeout: float = 60.0,
+        health_check_interval: float = 30.0,
+        health_check_timeout: float = 5.0,
+    ):
+        """
+        Args:
+            session_factory: ``session_factory(headers)`` returns an async context
+                manager yielding an initialized ``ClientSession``.
+        """
+        self.session_factory = session_factory
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self._idle: dict = {}
+        self._size = 0
+        self._condition = asyncio.Condition()
+        self._closing_tasks: set = set()
+        self.opened = 0
+        self.reused = 0
+        self.closed = 0
+
+    @staticmethod
+    def get_key(headers) -> tuple:
+        return tuple(sorted((headers or {}).items()))
+
+    def stats(self) -> dict:
+        idle = sum(len(entries) for entries in self._idle.values())
+        return {
+            "size": self._size,
+            "idle": idle,
+            "in_use": self._size - idle,
+            "opened": self.opened,
+            "reused": self.reused,
+            "closed": self.closed,
+        }
+
+    def _close_later(self, entry: PooledSession):
+        self._size -= 1
+        self.closed += 1
+        task = asyncio.create_task(entry.close())
+        self._closing_tasks.add(task)
+        task.add_done_callback(self._closing_tasks.discard)
+
+    def _evict_expired(self):
+        now = time.monotonic()
+        for key, entries in list(self._idle.items()):
+            for entry in [e for e in entries if now - e.last_used > self.idle_timeout]:
+                entries.remove(entry)
+                self._close_later(entry)
+            if not entries:
+                del self._idle[key]
+
+    def _evict_oldest_idle(self) -> bool:
+        entries = [entry for values in self._idle.values() for entry in values]
+        if not entries:
+            return False
+        oldest = min(entries, key=lambda entry: entry.last_used)
+        self._idle[oldest.key].remove(oldest)
+        if not self._idle[oldest.key]:
+            del self._idle[oldest.key]
+        self._close_later(oldest)
+        return True
+
+    async def _is_healthy(self, entry: PooledSession) -> bool:
+        if time.monotonic() - entry.last_used <= self.health_check_interval:
+            return True
+        try:
+            await asyncio.wait_for(entry.session.send_ping(), self.health_check_timeout)
+            return True
+        except Exception as e:
+            logger.warning(f"Dropping an MCP session that failed its ping: {e}")
+            return False
+
+    async def _acquire(self, headers) -> PooledSession:
+        key = self.get_key(headers)
+        while True:
+            async with self._condition:
+                self._evict_expired()
+                while True:
+                    if self._idle.get(key):
+                        entry = self._idle[key].pop()
+                        if not self._idle[key]:
+                            del self._idle[key]
+                        break
+                    if self._size < self.max_size or self._evict_oldest_idle():
+                        entry = None
+                        self._size += 1
+                        break
+                    await self._condition.wait()
+            if entry is None:
+                try:
+                    entry = await PooledSession(key).open(
+                        lambda: self.session_factory(dict(headers or {}))
+                    )
+                except BaseException:
+                    async with self._condition:
+                        self._size -= 1
+                        self._condition.notify()
+                    raise
+                self.opened += 1
+                return entry
+            if await self._is_healthy(entry):
+                self.reused += 1
+                return entry
+            async with self._condition:
+                self._close_later(entry)
+
+    async def _release(self, entry: PooledSession, is_broken: bool):
+        async with self._condition:
+            if is_broken:
+                self._close_later(entry)
+            else:
+                entry.last_used = time.monotonic()
+                self._idle.setdefault(entry.key, []).append(entry)
+            self._condition.notify()
+
+    @asynccontextmanager
+    async def session(self, headers=None):
+        """Borrow an initialized session for ``headers``."""
+        entry = await self._acquire(headers)
+        is_broken = True
+        try:
+            yield entry.session
+            is_broken = False
+        finally:
+            await self._release(entry, is_broken)
+
+    async def close(self):
+        """Close the idle sessions, and wait for the ones being closed."""
+        async with self._condition:
+            for entries in self._idle.values():
+                for entry in entries:
+                    self._close_later(entry)
+            self._idle.clear()
+        if self._closing_tasks:
+            await asyncio.gather(*self._closing_tasks, return_exceptions=True)
@@ -9,6 +9,7 @@ through stdin/stdout pipes.
 import logging
 import os
 import shutil
+from contextlib import asynccontextmanager
 from typing import Any
 
 from mcp import ClientSession, StdioServerParameters
@@ -16,6 +17,7 @@ from mcp.client.stdio import stdio_client
 from pydantic import Field
 
 from .base_mcp_client import BaseMCPClient
+from .worker_pool import MCPWorkerPool
 
 logger = logging.getLogger(__name__)
 
@@ -29,9 +31,21 @@ class StdioMCPClient(BaseMCPClient):
 
     Attributes:
         params: Configuration parameters including command, arguments, and environment variables.
+        workers: Number of server processes started in keep-alive mode. With more
+            than one, calls go to the least busy process, see :class:`MCPWorkerPool`.
+        max_workers: Upper bound of processes when scaling up under load, 0 keeps
+            the pool at ``workers``.
     """
 
     params: dict[str, Any] = Field(default_factory=dict)
+    workers: int = Field(1, description="Server processes in keep-alive mode")
+    max_workers: int = Field(0, description="Max server processes, 0 = workers")
+    worker_scale_up_load: int = Field(
+        2, description="Calls in flight on every worker before another is started"
+    )
+    worker_idle_timeout: float = Field(
+        60.0, description="Idle seconds before a worker above `workers` is stopped"
+    )
 
     async def _ensure_directories_exist(self, args: list[str]) -> None:
         """Ensure required directories exist before starting MCP server."""
@@ -49,12 +63,35 @@ class StdioMCPClient(BaseMCPClient):
             if not os.path.exists(mcp_tool_file):
                 raise FileNotFoundError(f"{mcp_tool_file} does not exist.")
 
-    async def init(self, is_fetch_tools=True) -> None:
-        """Initialize the stdio connection to the MCP server process.
+    async def _connect(self) -> None:
+        """Open the keep-alive session, or start the worker processes."""
+        if self.workers <= 1 and self.max_workers <= 1:
+            return await super()._connect()
+        worker_pool = MCPWorkerPool(
+            lambda: self._session_context(self.headers),
+            min_workers=self.workers,
+            max_workers=self.max_workers,
+            scale_up_load=self.worker_scale_up_load,
+            idle_timeout=self.worker_idle_timeout,
+        )
+        await worker_pool.start()
+        self._exit_stack.push_async_callback(worker_pool.close)
+        self._session = worker_pool
+
+    def get_server_identity(self) -> dict:
+        return {
+            "class_name": self.class_name,
+            "command": self.params.get("command"),
+            "args": self.params.get("args"),
+            "env": self.params.get("env"),
+        }
+
+    @asynccontextmanager
+    async def _session_context(self, headers: dict):
+        """Spawn the MCP server process and open a client session on its stdio.
 
         Spawns an external process (such as a Node.js script) that acts as an MCP server,
-        establishes stdio communication channels, creates a client session, and discovers
-        available tools from the server.
+        establishes stdio communication channels and initializes a client session.
 
         The method performs several validation steps:
         1. Resolves the command path (with special handling for 'npx')
@@ -62,35 +99,11 @@ class StdioMCPClient(BaseMCPClient):
         3. Sets up environment variables
         4. Establishes stdio transport and session
         """
-
-        try:
-            server_params = await self.get_server_params()
-            stdio_transport = await self._exit_stack.enter_async_context(
-                stdio_client(server_params)
-            )
-            read, write = stdio_transport
-            self._session = await self._exit_stack.enter_async_context(
-                ClientSession(read, write)
-            )
-            await self._session.initialize()
-            if is_fetch_tools:
-                await self.list_tools()
-        except FileNotFoundError as e:
-            # Re-raise specific validation errors without wrapping
-            logger.error(f"Validation error for server {self.name}: {e}")
-            await self.cleanup()
-            raise
-        except Exception as e:
-            logger.error(f"Error initializing server {self.name}: {e}")
-            await self.cleanup()
-            raise Exception(f"Server {self.name} error")
-
-    async def call_tool(self, tool_name, arguments, headers=None):
         server_params = await self.get_server_params()
         async with stdio_client(server_params) as streams:
             async with ClientSession(*streams) as session:
                 await session.initialize()
-                return await session.call_tool(tool_name, arguments)
+                yield session
 
     async def get_server_params(self):
         command = (
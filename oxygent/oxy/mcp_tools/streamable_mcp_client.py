@@ -1,6 +1,7 @@
 """Streamable-HTTP MCP client implementation."""
 
 import logging
+from contextlib import asynccontextmanager
 from typing import Any, List
 
 from mcp import ClientSession
@@ -21,48 +22,16 @@ class StreamableMCPClient(BaseMCPClient):
         default_factory=list, description="Client-side MCP middlewares"
     )
 
-    async def init(self, is_fetch_tools=True) -> None:
-        """Initialize the HTTP streaming connection to the MCP server."""
-        try:
-            if not self.is_dynamic_headers and self.is_keep_alive:
-                self._http_transport = await self._exit_stack.enter_async_context(
-                    streamablehttp_client(
-                        build_url(self.server_url), headers=self.headers
-                    )
-                )
-                read, write, _ = self._http_transport
+    def get_server_identity(self) -> dict:
+        return {
+            "class_name": self.class_name,
+            "server_url": str(self.server_url),
+            "headers": self.headers,
+        }
 
-                self._session = await self._exit_stack.enter_async_context(
-                    ClientSession(read, write)
-                )
-
-                for mw in self.middlewares:
-                    if hasattr(self._session, "add_middleware"):
-                        self._session.add_middleware(mw)
-                    else:
-                        logger.warning("middleware %s is ignored", mw)
-
-                await self._session.initialize()
-                if is_fetch_tools:
-                    await self.list_tools()
-            else:
-                async with streamablehttp_client(
-                    build_url(self.server_url), headers=self.headers
-                ) as (
-                    read,
-                    write,
-                    _,
-                ):
-                    async with ClientSession(read, write) as session:
-                        await session.initialize()
-                        tools_response = await session.list_tools()
-                        self.add_tools(tools_response)
-        except Exception as e:
-            logger.error("Error initializing server %s: %s", self.name, e)
-            await self.cleanup()
-            raise Exception(f"Server {self.name} error") from e
-
-    async def call_tool(self, tool_name, arguments, headers=None):
+    @asynccontextmanager
+    async def _session_context(self, headers: dict):
+        """Open a Streamable-HTTP connection and an initialized client session."""
         async with streamablehttp_client(
             build_url(self.server_url), headers=headers
         ) as (
@@ -71,5 +40,10 @@ class StreamableMCPClient(BaseMCPClient):
             _,
         ):
             async with ClientSession(read, write) as session:
+                for mw in self.middlewares:
+                    if hasattr(session, "add_middleware"):
+                        session.add_middleware(mw)
+                    else:
+                        logger.warning("middleware %s is ignored", mw)
                 await session.initialize()
-                return await session.call_tool(tool_name, arguments)
+                yield session
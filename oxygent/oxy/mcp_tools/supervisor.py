@@ -0,0 +1,154 @@
+"""Supervised keep-alive connection of an MCP client.
+
+:class:`MCPConnectionSupervisor` owns the keep-alive session of a client:
+
+    - the session is pinged every ``ping_interval`` seconds
+    - a failed ping or a closed connection starts a background reconnect with
+      exponential backoff, only one reconnect runs at a time
+    - calls made while reconnecting wait up to ``grace_period`` seconds for the
+      new session instead of failing at once
+"""
+
+import asyncio
+import itertools
+import logging
+import random
+from typing import Callable, Optional
+
+import anyio
+
+from .session_pool import PooledSession
+
+logger = logging.getLogger(__name__)
+
+# Raised before the request reached the server, safe to send again
+UNSENT_ERRORS = (anyio.ClosedResourceError, anyio.BrokenResourceError)
+
+
+def is_connection_error(error: BaseException) -> bool:
+    """Whether ``error`` means the connection to the server is gone."""
+    if isinstance(error, UNSENT_ERRORS + (anyio.EndOfStream,)):
+        return True
+    from mcp.shared.exceptions import McpError
+    from mcp.types import CONNECTION_CLOSED
+
+    return isinstance(error, McpError) and error.error.code == CONNECTION_CLOSED
+
+
+class MCPConnectionSupervisor:
+    """Keep one MCP session open, reconnecting it in the background."""
+
+    def __init__(
+        self,
+        session_factory: Callable,
+        on_session: Callable,
+        name: str = "",
+        ping_interval: float = 30.0,
+        ping_timeout: float = 10.0,
+        reconnect_initial_delay: float = 0.5,
+        reconnect_max_delay: float = 30.0,
+        grace_period: float = 10.0,
+    ):
+        """
+        Args:
+            session_factory: ``session_factory()`` returns an async context manager
+                yielding an initialized ``ClientSession``.
+            on_session: Called with the new session once connected, and with
+                ``None`` when the connection is lost.
+        """
+        self.session_factory = session_factory
+        self.on_session = on_session
+        self.name = name
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.reconnect_initial_delay = reconnect_initial_delay
+        self.reconnect_max_delay = reconnect_max_delay
+        self.grace_period = grace_period
+        self.reconnects = 0
+        self._connection: Optional[PooledSession] = None
+        self._connected = asyncio.Event()
+        self._is_closed = False
+        self._watch_task: Optional[asyncio.Task] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_reconnecting(self) -> bool:
+        return self._reconnect_task is not None and not self._reconnect_task.done()
+
+    async def _open(self):
+        self._connection = await PooledSession(self.name).open(self.session_factory)
+        self.on_session(self._connection.session)
+        self._connected.set()
+
+    async def _drop(self):
+        self._connected.clear()
+        self.on_session(None)
+        connection, self._connection = self._connection, None
+        if connection:
+            await connection.close()
+
+    async def start(self):
+        """Connect, raising if the server cannot be reached, and start pinging."""
+        await self._open()
+        if self.ping_interval > 0:
+            self._watch_task = asyncio.create_task(self._watch())
+
+    def reconnect(self) -> asyncio.Task:
+        """Reconnect in the background, joining the reconnect already running."""
+        if not self.is_reconnecting and not self._is_closed:
+            self._connected.clear()
+            self.on_session(None)
+            self._reconnect_task = asyncio.create_task(self._reconnect())
+        return self._reconnect_task
+
+    async def _reconnect(self):
+        await self._drop()
+        delay = self.reconnect_initial_delay
+        for attempt in itertools.count(1):
+            try:
+                await self._open()
+                self.reconnects += 1
+                logger.info(
+                    f"Reconnected to MCP server {self.name} (attempt {attempt})"
+                )
+                return
+            except Exception as e:
+                logger.warning(
+                    f"Reconnecting to MCP server {self.name} failed (attempt {attempt}),"
+                    f" retrying in {delay:.1f}s: {e}"
+                )
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+            delay = min(delay * 2, self.reconnect_max_delay)
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self.ping_interval)
+            if not self._connected.is_set():
+                continue
+            try:
+                await asyncio.wait_for(
+                    self._connection.session.send_ping(), self.ping_timeout
+                )
+            except Exception as e:
+                logger.warning(f"Ping to MCP server {self.name} failed: {e!r}")
+                self.reconnect()
+
+    async def wait_connected(self) -> bool:
+        """Wait up to ``grace_period`` for a running reconnect, True if connected."""
+        if self._connected.is_set():
+            return True
+        if not self.is_reconnecting:
+            return False
+        try:
+            await asyncio.wait_for(self._connected.wait(), self.grace_period)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def close(self):
+        self._is_closed = True
+        for task in (self._watch_task, self._reconnect_task):
+            if task and not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        await self._drop()
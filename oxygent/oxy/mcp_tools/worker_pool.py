@@ -0,0 +1,210 @@
+"""Pool of MCP server processes behind one client.
+
+A keep-alive :class:`StdioMCPClient` talks to one server process, so CPU-bound
+servers handle the calls of all agents one after the other. With ``workers`` set
+the client starts several processes and :class:`MCPWorkerPool` takes the place of
+the single ``ClientSession``:
+
+    - each call goes to the worker with the fewest calls in flight
+    - when every worker has ``scale_up_load`` calls in flight another one is
+      started, up to ``max_workers``; workers above ``min_workers`` that stayed
+      idle for ``idle_timeout`` seconds are stopped
+    - a worker whose process exited or whose pipe broke is replaced, calls that
+      could not be sent to it are retried once on another worker
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from typing import Callable, Optional
+
+from .session_pool import PooledSession
+from .supervisor import UNSENT_ERRORS, is_connection_error
+
+logger = logging.getLogger(__name__)
+
+
+class MCPWorker(PooledSession):
+    """One server process with its session."""
+
+    def __init__(self, worker_id: int):
+        super().__init__(worker_id)
+        self.in_flight = 0
+        self.calls = 0
+
+    @property
+    def is_alive(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+
+class MCPWorkerPool:
+    """Dispatch MCP requests to the least busy of several server processes.
+
+    Implements the parts of the ``ClientSession`` interface used by
+    :class:`BaseMCPClient`, so it can stand in for the keep-alive session.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable,
+        min_workers: int = 1,
+        max_workers: Optional[int] = None,
+        scale_up_load: int = 2,
+        idle_timeout: float = 60.0,
+    ):
+        """
+        Args:
+            session_factory: ``session_factory()`` returns an async context manager
+                that starts a server process and yields its initialized session.
+        """
+        self.session_factory = session_factory
+        self.min_workers = max(min_workers, 1)
+        self.max_workers = max(max_workers or self.min_workers, self.min_workers)
+        self.scale_up_load = max(scale_up_load, 1)
+        self.idle_timeout = idle_timeout
+        self.workers: list = []
+        self.started = 0
+        self.restarts = 0
+        self._ids = itertools.count()
+        self._starting = 0
+        self._spawn_error: Optional[BaseException] = None
+        self._is_closed = False
+        self._condition = asyncio.Condition()
+        self._tasks: set = set()
+
+    def stats(self) -> dict:
+        return {
+            "workers": len(self.workers),
+            "starting": self._starting,
+            "in_flight": [worker.in_flight for worker in self.workers],
+            "calls": [worker.calls for worker in self.workers],
+            "started": self.started,
+            "restarts": self.restarts,
+        }
+
+    def _track(self, coroutine):
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _spawn_later(self):
+        self._starting += 1
+        self._track(self._spawn())
+
+    async def _spawn(self):
+        worker = MCPWorker(next(self._ids))
+        try:
+            await worker.open(self.session_factory)
+        except Exception as e:
+            logger.warning(f"Starting MCP worker {worker.key} failed: {e}")
+            async with self._condition:
+                self._starting -= 1
+                self._spawn_error = e
+                self._condition.notify_all()
+            return
+        async with self._condition:
+            self._starting -= 1
+            if self._is_closed:
+                self._track(worker.close())
+                return
+            self._spawn_error = None
+            self.workers.append(worker)
+            self.started += 1
+            self._condition.notify_all()
+
+    def _stop(self, worker: MCPWorker):
+        self.workers.remove(worker)
+        self._track(worker.close())
+
+    def _maintain(self):
+        """Replace dead workers, stop idle surplus ones."""
+        for worker in [w for w in self.workers if not w.is_alive]:
+            logger.warning(f"MCP worker {worker.key} exited, restarting it")
+            self.restarts += 1
+            self._stop(worker)
+        now = time.monotonic()
+        idle = [
+            w
+            for w in self.workers
+            if not w.in_flight and now - w.last_used > self.idle_timeout
+        ]
+        surplus = len(self.workers) - self.min_workers
+        for worker in sorted(idle, key=lambda w: w.last_used)[: max(surplus, 0)]:
+            self._stop(worker)
+        for _ in range(self.min_workers - len(self.workers) - self._starting):
+            self._spawn_later()
+
+    async def start(self):
+        """Start ``min_workers`` processes, raise if none of them came up."""
+        async with self._condition:
+            for _ in range(self.min_workers):
+                self._spawn_later()
+        await asyncio.gather(*list(self._tasks))
+        if not self.workers:
+            raise self._spawn_error
+
+    async def _acquire(self) -> MCPWorker:
+        async with self._condition:
+            while True:
+                if self._is_closed:
+                    raise RuntimeError("MCP worker pool is closed")
+                if not self.workers and self._spawn_error and not self._starting:
+                    error, self._spawn_error = self._spawn_error, None
+                    raise error
+                self._maintain()
+                worker = min(self.workers, key=lambda w: w.in_flight, default=None)
+                is_busy = worker is None or worker.in_flight >= self.scale_up_load
+                if is_busy and len(self.workers) + self._starting < self.max_workers:
+                    self._spawn_later()
+                if worker is not None:
+                    worker.in_flight += 1
+                    worker.calls += 1
+                    return worker
+                await self._condition.wait()
+
+    async def _release(self, worker: MCPWorker, error: Optional[BaseException]):
+        async with self._condition:
+            worker.in_flight -= 1
+            worker.last_used = time.monotonic()
+            if error is not None and is_connection_error(error):
+                if worker in self.workers:
+                    logger.warning(f"MCP worker {worker.key} lost: {error!r}")
+                    self.restarts += 1
+                    self._stop(worker)
+                self._maintain()
+            self._condition.notify_all()
+
+    async def _run(self, call: Callable):
+        """Run ``call(session)`` on the least busy worker."""
+        for attempt in range(2):
+            worker = await self._acquire()
+            try:
+                result = await call(worker.session)
+            except BaseException as e:
+                await self._release(worker, e)
+                if attempt == 0 and isinstance(e, UNSENT_ERRORS):
+                    continue
+                raise
+            await self._release(worker, None)
+            return result
+
+    async def call_tool(self, name: str, arguments: Optional[dict] = None):
+        return await self._run(lambda session: session.call_tool(name, arguments))
+
+    async def list_tools(self):
+        return await self._run(lambda session: session.list_tools())
+
+    async def send_ping(self):
+        return await self._run(lambda session: session.send_ping())
+
+    async def close(self):
+        """Stop all workers, including the ones still starting."""
+        async with self._condition:
+            self._is_closed = True
+            for worker in list(self.workers):
+                self._stop(worker)
+            self._condition.notify_all()
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
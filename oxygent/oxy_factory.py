@@ -1,38 +1,26 @@
 """oxy_factory.py Factory for creating OxyGent operators.xs."""
 
-from .oxy import (
-    ChatAgent,
-    FunctionTool,
-    HttpLLM,
-    HttpTool,
-    MCPTool,
-    OpenAILLM,
-    ReActAgent,
-    SSEMCPClient,
-    StdioMCPClient,
-    Workflow,
-    WorkflowAgent,
-)
+from . import oxy
 
 
 class OxyFactory:
-    _creators = {
-        "ChatAgent": ChatAgent,
-        "ReActAgent": ReActAgent,
-        "WorkflowAgent": WorkflowAgent,
-        "HttpTool": HttpTool,
-        "HttpLLM": HttpLLM,
-        "OpenAILLM": OpenAILLM,
-        "MCPTool": MCPTool,
-        "StdioMCPClient": StdioMCPClient,
-        "SSEMCPClient": SSEMCPClient,
-        "FunctionTool": FunctionTool,
-        "Workflow": Workflow,
-    }
+    # Resolved from oxygent.oxy on use, so that only the created class is imported
+    _creators = (
+        "ChatAgent",
+        "ReActAgent",
+        "WorkflowAgent",
+        "HttpTool",
+        "HttpLLM",
+        "OpenAILLM",
+        "MCPTool",
+        "StdioMCPClient",
+        "SSEMCPClient",
+        "FunctionTool",
+        "Workflow",
+    )
 
     @staticmethod
     def create_oxy(operator_class_name, **kwargs):
-        try:
-            return OxyFactory._creators[operator_class_name](**kwargs)
-        except KeyError:
+        if operator_class_name not in OxyFactory._creators:
             raise ValueError(f"Unknown animal type: {operator_class_name}")
+        return getattr(oxy, operator_class_name)(**kwargs)
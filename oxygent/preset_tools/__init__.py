@@ -1,5 +1,7 @@
 import importlib
+import importlib.util
 import os
+import sys
 
 from oxygent.oxy import FunctionHub
 
@@ -17,12 +19,35 @@ tool_modules = [
     "image_gen_tools",
 ]
 
-__all__ = []
+# Every tool module holds a FunctionHub of the same name. The modules are
+# imported on first access (PEP 562), so a script using math_tools does not pay
+# for the dependencies of the other ones.
+__all__ = list(tool_modules)
 
 # Get the current package directory path
 package_dir = os.path.dirname(__file__)
 
-for module_name in tool_modules:
+
+def _register_lazy(module_name):
+    """Put the tool module in sys.modules, executed on first attribute access.
+
+    Importing a module binds it on its package, which would shadow the
+    FunctionHub of the same name. A module already in sys.modules is not
+    bound again, also not by a later ``from .math_tools import calc_pi``.
+    """
+    full_name = f"{__name__}.{module_name}"
+    if full_name in sys.modules:
+        return
+    spec = importlib.util.find_spec(full_name)
+    if spec is None:
+        return
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[full_name] = module
+    spec.loader.exec_module(module)
+
+
+def _load_tool(module_name):
     module_path = os.path.join(package_dir, f"{module_name}.py")
 
     # First check if the module file exists
@@ -30,33 +55,14 @@ for module_name in tool_modules:
         print(
             f"Warning: Failed to import tool '{module_name}': Module file does not exist, please check '{module_path}'"
         )
-        globals()[module_name] = None
-        continue
+        return None
 
     try:
-        # Dynamically import the module
+        # Runs the module registered by _register_lazy
         module = importlib.import_module(f".{module_name}", __package__)
-
-        # Filter out all non-private attributes that are instances of FunctionHub
-        function_hub_instances = [
-            attr
-            for attr in dir(module)
-            if not attr.startswith("_")  # Exclude private attributes
-            and isinstance(
-                getattr(module, attr), FunctionHub
-            )  # Only keep FunctionHub instances
-        ]
-
-        if function_hub_instances:
-            # Add eligible instances to the current scope and __all__
-            for attr_name in function_hub_instances:
-                attr_value = getattr(module, attr_name)
-                globals()[attr_name] = attr_value
-                __all__.append(attr_name)
-        else:
-            print(f"Warning: No FunctionHub instances found in module '{module_name}'")
-
+        function_hub = getattr(module, module_name, None)
     except ImportError as e:
+        sys.modules.pop(f"{__name__}.{module_name}", None)
         # Catch import errors and extract the missing package name
         error_msg = str(e)
         missing_package = None
@@ -74,5 +80,25 @@ for module_name in tool_modules:
         else:
             print(f"Warning: Failed to import tool '{module_name}': {error_msg}")
 
-        # Set the module entry to None to prevent errors in subsequent use
-        globals()[module_name] = None
+        # Return None to prevent errors in subsequent use
+        return None
+
+    if not isinstance(function_hub, FunctionHub):
+        print(f"Warning: No FunctionHub instances found in module '{module_name}'")
+        return None
+    return function_hub
+
+
+for _module_name in tool_modules:
+    _register_lazy(_module_name)
+
+
+def __getattr__(name):
+    if name in tool_modules:
+        value = globals()[name] = _load_tool(name)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(tool_modules))
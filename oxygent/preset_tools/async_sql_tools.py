@@ -0,0 +1,217 @@
+"""SQL tools on SQLAlchemy's async engine.
+
+Async counterpart of :mod:`oxygent.preset_tools.sql_tools`: queries run on the
+async driver of the database (``sqlite+aiosqlite://``, ``mysql+aiomysql://``,
+``postgresql+asyncpg://`` ...) instead of blocking the event loop, through a
+connection pool of ``pool_size`` connections.
+
+``run_sql`` streams the result in chunks of ``chunk_size`` rows and stops at
+``max_rows`` rows or ``max_output_length`` characters, telling the LLM that the
+result was truncated instead of loading everything into memory. ``list_tables``
+and ``describe_tables`` are cached for ``schema_cache_ttl`` seconds; the cache is
+cleared by DDL statements run through ``run_sql`` and by
+:meth:`AsyncSQLFunctionHub.invalidate_schema_cache`.
+
+The database URL is read from ``SQL_TOOLS_DB_URL`` unless ``db_url`` is set; the
+engine is created on first use, so the hub can be configured after import.
+"""
+
+import json
+import logging
+import os
+import re
+import time
+from typing import Any, Optional
+
+from pydantic import Field
+
+from oxygent.oxy import FunctionHub
+
+try:
+    from sqlalchemy import inspect
+    from sqlalchemy.engine import make_url
+    from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+    from sqlalchemy.sql.expression import text
+except ImportError:
+    raise ImportError(
+        "`sqlalchemy[asyncio]` not installed, please install it with an async driver."
+    )
+
+logger = logging.getLogger(__name__)
+
+_DDL_PATTERN = re.compile(r"^\s*(create|alter|drop|rename|truncate)\b", re.IGNORECASE)
+
+
+class AsyncSQLFunctionHub(FunctionHub):
+    db_url: str = Field(default_factory=lambda: os.getenv("SQL_TOOLS_DB_URL", ""))
+    pool_size: int = Field(5, description="Connections kept in the pool")
+    max_overflow: int = Field(10, description="Connections opened beyond pool_size")
+    max_rows: int = Field(1000, description="Rows returned by run_sql at most")
+    chunk_size: int = Field(200, description="Rows fetched per round trip")
+    max_output_length: int = Field(
+        20000, description="Characters of the run_sql result at most"
+    )
+    schema_cache_ttl: float = Field(
+        300.0, description="Seconds list_tables/describe_tables are cached, 0 = off"
+    )
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._engine: Optional[AsyncEngine] = None
+        self._schema_cache: dict = {}
+
+    def get_engine(self) -> AsyncEngine:
+        if self._engine is None:
+            if not self.db_url:
+                raise ValueError("Could not find the db_url from environ")
+            url = make_url(self.db_url)
+            is_memory_sqlite = url.get_backend_name() == "sqlite" and (
+                url.database in (None, "", ":memory:")
+            )
+            # In-memory SQLite uses a single static connection
+            pool_kwargs = (
+                {}
+                if is_memory_sqlite
+                else {"pool_size": self.pool_size, "max_overflow": self.max_overflow}
+            )
+            self._engine = create_async_engine(url, pool_pre_ping=True, **pool_kwargs)
+        return self._engine
+
+    async def dispose(self) -> None:
+        """Close the pooled connections, the engine is created again on use."""
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+        self._schema_cache.clear()
+
+    def invalidate_schema_cache(self, table_name: Optional[str] = None) -> None:
+        """Forget the cached schema of ``table_name``, or of all tables."""
+        if table_name is None:
+            self._schema_cache.clear()
+        else:
+            self._schema_cache.pop(("tables",), None)
+            self._schema_cache.pop(("columns", table_name), None)
+
+    async def inspect_schema(self, key: tuple, func) -> Any:
+        """``func(inspector)`` on a connection, cached for ``schema_cache_ttl``."""
+        cached = self._schema_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.schema_cache_ttl:
+            return cached[1]
+        async with self.get_engine().connect() as conn:
+            value = await conn.run_sync(lambda sync_conn: func(inspect(sync_conn)))
+        if self.schema_cache_ttl > 0:
+            self._schema_cache[key] = (time.monotonic(), value)
+        return value
+
+    async def fetch_rows(self, sql: str, limit: Optional[int] = None) -> dict:
+        """Stream the rows of ``sql`` until a row or size cap is reached.
+
+        Returns ``{"rows": [...], "is_truncated": bool}``.
+        """
+        # The rows asked for by ``limit`` are complete, the ones cut by the caps
+        # are truncated, which is only known once a row past the cap arrives
+        is_capped = not limit or 0 < self.max_rows < limit
+        max_rows = self.max_rows if is_capped else limit
+        rows, length, is_truncated, is_done = [], 2, False, False
+        try:
+            async with self.get_engine().connect() as conn:
+                result = await conn.stream(text(sql))
+                try:
+                    async for partition in result.partitions(self.chunk_size):
+                        for row in partition:
+                            if max_rows and len(rows) >= max_rows:
+                                is_truncated = is_done = True
+                                break
+                            item = row._asdict()
+                            length += len(
+                                json.dumps(item, ensure_ascii=False, default=str)
+                            )
+                            if length > self.max_output_length > 0:
+                                is_truncated = is_done = True
+                                break
+                            rows.append(item)
+                            if not is_capped and len(rows) >= max_rows:
+                                is_done = True
+                                break
+                        if is_done:
+                            break
+                finally:
+                    await result.close()
+        finally:
+            # Some databases commit DDL implicitly, even if the query failed after
+            if _DDL_PATTERN.match(sql):
+                self.invalidate_schema_cache()
+        return {"rows": rows, "is_truncated": is_truncated}
+
+
+async_sql_tools = AsyncSQLFunctionHub(name="async_sql_tools")
+
+
+@async_sql_tools.tool(
+    description="Use this function to get a list of table names in the database"
+)
+async def list_tables() -> str:
+    try:
+        table_names = await async_sql_tools.inspect_schema(
+            ("tables",), lambda inspector: inspector.get_table_names()
+        )
+        logger.debug(f"get the tables: {table_names}")
+        return json.dumps(table_names)
+    except Exception as e:
+        error_msg = f"Error getting tables: {e}"
+        logger.error(error_msg)
+        return json.dumps({"error": error_msg})
+
+
+@async_sql_tools.tool(
+    description=(
+        "run a sql query and return the result, large results are truncated: "
+        "add a LIMIT, filters or aggregations to see the rows you need"
+    )
+)
+async def run_sql(sql: str, limit: Optional[int] = None) -> str:
+    logger.debug(f"Running sql |\n{sql}")
+    try:
+        result = await async_sql_tools.fetch_rows(sql, limit)
+    except Exception as e:
+        error_msg = f"Error running query: {e}"
+        logger.error(error_msg)
+        return json.dumps({"error": error_msg})
+    rows = result["rows"]
+    if not result["is_truncated"]:
+        return json.dumps(rows, ensure_ascii=False, default=str)
+    return json.dumps(
+        {
+            "rows": rows,
+            "truncated": True,
+            "note": (
+                f"Only the first {len(rows)} rows are shown, the query returned more."
+                " Add a LIMIT, filters or aggregations to narrow it down."
+            ),
+        },
+        ensure_ascii=False,
+        default=str,
+    )
+
+
+@async_sql_tools.tool(description="describe the given table")
+async def describe_tables(table_name: str) -> str:
+    try:
+        logger.debug(f"Describing table: {table_name}")
+        table_schema = await async_sql_tools.inspect_schema(
+            ("columns", table_name),
+            lambda inspector: inspector.get_columns(table_name),
+        )
+        result = [
+            {
+                "name": column["name"],
+                "type": str(column["type"]),
+                "nullable": column["nullable"],
+            }
+            for column in table_schema
+        ]
+        return json.dumps(result)
+    except Exception as e:
+        error_msg = f"Error getting table schema: {e}"
+        logger.error(error_msg)
+        return json.dumps({"error": error_msg})
@@ -1,17 +1,34 @@
 import json
 from typing import Optional, Dict, Any
 from pydantic import Field
-import httpx
+from oxygent.config import Config
 from oxygent.oxy import FunctionHub
+from oxygent.utils.http_client import get_http_client, read_response
 import asyncio
 
 http_tools = FunctionHub(name="http_tools")
 
 
+async def _request(method: str, url: str, **kwargs) -> str:
+    # 复用连接池，按 tool.http_max_response_size 截断过大的响应
+    max_size = Config.get_tool_http_max_response_size()
+    async with get_http_client().stream(method, url, **kwargs) as response:
+        response.raise_for_status()
+        content, is_truncated = await read_response(response, max_size)
+        result = {
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "content": content,
+        }
+    if is_truncated:
+        result["truncated"] = True
+    return json.dumps(result, ensure_ascii=False)
+
+
 @http_tools.tool(
     description="Make a GET request to a specified URL with optional headers and parameters"
 )
-def http_get(
+async def http_get(
         url: str,
         headers: Optional[Dict[str, str]] = None,
         params: Optional[Dict[str, Any]] = None,
@@ -20,15 +37,7 @@ def http_get(
     发送HTTP GET请求
     """
     try:
-        # 使用同步客户端
-        with httpx.Client() as client:
-            response = client.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            return json.dumps({
-                "status_code": response.status_code,
-                "headers": dict(response.headers),
-                "content": response.text
-            }, ensure_ascii=False)
+        return await _request("GET", url, headers=headers, params=params)
     except Exception as e:
         return json.dumps({"error": str(e)}, ensure_ascii=False)
 
@@ -36,7 +45,7 @@ def http_get(
 @http_tools.tool(
     description="Make a POST request to a specified URL with optional headers and JSON data"
 )
-def http_post(
+async def http_post(
         url: str,
         data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
@@ -51,15 +60,7 @@ def http_post(
         if "Content-Type" not in headers:
             headers["Content-Type"] = "application/json"
 
-        # 使用同步客户端
-        with httpx.Client() as client:
-            response = client.post(url, json=data, headers=headers)
-            response.raise_for_status()
-            return json.dumps({
-                "status_code": response.status_code,
-                "headers": dict(response.headers),
-                "content": response.text
-            }, ensure_ascii=False)
+        return await _request("POST", url, json=data, headers=headers)
     except Exception as e:
         return json.dumps({"error": str(e)}, ensure_ascii=False)
 
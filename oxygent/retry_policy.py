@@ -0,0 +1,322 @@
+"""retry_policy.py Retry policy for Oxy executions.
+
+This module replaces the flat ``retries``/``delay`` loop with a policy object that
+combines:
+    - exponential backoff with jitter, so concurrent callers do not retry in lockstep
+    - retryable-exception classification
+    - a per-Oxy retry budget, capping retries to a fraction of recent traffic
+    - a circuit breaker that fails fast while a downstream is known to be unhealthy
+
+The configuration lives on :class:`RetryPolicy` (a pydantic model, so it can be
+passed around with the other Oxy fields), while the runtime state lives in the
+private :class:`RetryBudget` and :class:`CircuitBreaker` helpers.
+
+Typical usage example:
+    >>> llm = HttpLLM(
+    ...     name="default_llm",
+    ...     retries=4,
+    ...     retry_policy=RetryPolicy(max_delay=8, breaker_failure_threshold=5),
+    ... )
+"""
+
+import logging
+import random
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Optional, Tuple, Type
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_serializer
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class RetryBudget:
+    """Sliding-window retry budget.
+
+    Retries are allowed while the number of retries in the last ``window`` seconds
+    stays below ``min_retries_per_second * window + ratio * requests``. The minimum
+    keeps low-traffic oxys retryable, the ratio caps amplification under load.
+    """
+
+    def __init__(self, ratio=0.2, min_retries_per_second=1.0, window=10.0):
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window = window
+        self._requests = deque()
+        self._retries = deque()
+        self.exhausted_count = 0
+
+    def _prune(self, now):
+        threshold = now - self.window
+        while self._requests and self._requests[0] < threshold:
+            self._requests.popleft()
+        while self._retries and self._retries[0] < threshold:
+            self._retries.popleft()
+
+    def record_request(self):
+        now = time.monotonic()
+        self._prune(now)
+        self._requests.append(now)
+
+    def try_acquire(self) -> bool:
+        """Withdraw one retry from the budget, return False if exhausted."""
+        if self.ratio < 0:
+            return True
+        now = time.monotonic()
+        self._prune(now)
+        allowed = self.min_retries_per_second * self.window + self.ratio * len(
+            self._requests
+        )
+        if len(self._retries) >= allowed:
+            self.exhausted_count += 1
+            return False
+        self._retries.append(now)
+        return True
+
+    def get_stats(self) -> dict:
+        self._prune(time.monotonic())
+        return {
+            "requests_in_window": len(self._requests),
+            "retries_in_window": len(self._retries),
+            "budget_exhausted": self.exhausted_count,
+        }
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and rejects
+    calls for ``recovery_timeout`` seconds. It then lets ``half_open_max_calls``
+    trial calls through: one success closes it, one failure re-opens it.
+    """
+
+    def __init__(
+        self, name, failure_threshold=0, recovery_timeout=30.0, half_open_max_calls=1
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.changed_at = 0.0
+        self.half_open_calls = 0
+        self.opened_count = 0
+        self.short_circuited_count = 0
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.failure_threshold > 0
+
+    def _transition(self, state):
+        if state is self.state:
+            return
+        logger.warning(
+            f"Circuit breaker of oxy {self.name}: {self.state.value} -> {state.value}"
+        )
+        self.state = state
+        self.changed_at = time.monotonic()
+        if state is CircuitState.OPEN:
+            self.opened_count += 1
+        self.half_open_calls = 0
+
+    def allow_request(self) -> bool:
+        if not self.is_enabled:
+            return True
+        elapsed = time.monotonic() - self.changed_at
+        if self.state is CircuitState.OPEN:
+            if elapsed < self.recovery_timeout:
+                self.short_circuited_count += 1
+                return False
+            self._transition(CircuitState.HALF_OPEN)
+        if self.state is CircuitState.HALF_OPEN:
+            if self.half_open_calls >= self.half_open_max_calls:
+                # Trials that never reported back (cancelled, skipped) must not
+                # keep the breaker half-open forever
+                if elapsed < self.recovery_timeout:
+                    self.short_circuited_count += 1
+                    return False
+                self.changed_at = time.monotonic()
+                self.half_open_calls = 0
+            self.half_open_calls += 1
+        return True
+
+    def record_success(self):
+        self.consecutive_failures = 0
+        if self.state is not CircuitState.CLOSED:
+            self._transition(CircuitState.CLOSED)
+
+    def record_failure(self):
+        if not self.is_enabled:
+            return
+        self.consecutive_failures += 1
+        if self.state is CircuitState.HALF_OPEN or (
+            self.consecutive_failures >= self.failure_threshold
+        ):
+            self._transition(CircuitState.OPEN)
+
+    def get_stats(self) -> dict:
+        return {
+            "circuit_state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "circuit_opened": self.opened_count,
+            "short_circuited": self.short_circuited_count,
+        }
+
+
+class RetryPolicy(BaseModel):
+    """Retry configuration and runtime state for a single Oxy.
+
+    ``max_attempts`` and ``base_delay`` default to ``None`` so that the owning
+    Oxy's ``retries`` and ``delay`` keep working (also when changed at runtime
+    through :meth:`MAS.set_oxy_attr`).
+
+    Attributes:
+        max_attempts: Total number of attempts, falls back to ``Oxy.retries``.
+        base_delay: Backoff of the first retry, falls back to ``Oxy.delay``.
+        max_delay: Upper bound of a single backoff in seconds.
+        multiplier: Exponential growth factor of the backoff.
+        jitter: ``"full"``, ``"equal"`` or ``"none"``.
+        retryable_exceptions: Exception types that may be retried.
+        non_retryable_exceptions: Exception types that fail immediately.
+        func_is_retryable: Optional callable overriding the classification.
+        budget_ratio: Max retries as a fraction of requests, negative disables.
+        budget_min_retries_per_second: Retries always allowed regardless of ratio.
+        budget_window: Sliding window of the budget in seconds.
+        breaker_failure_threshold: Consecutive failures that open the breaker,
+            ``0`` disables it.
+        breaker_recovery_timeout: Seconds the breaker stays open.
+        breaker_half_open_max_calls: Trial calls let through while half-open.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    max_attempts: Optional[int] = Field(None, description="Total attempts")
+    base_delay: Optional[float] = Field(None, description="First backoff in seconds")
+    max_delay: float = Field(30.0, description="Maximum backoff in seconds")
+    multiplier: float = Field(2.0, description="Backoff growth factor")
+    jitter: str = Field("full", description="full, equal or none")
+
+    retryable_exceptions: Tuple[Type[BaseException], ...] = Field(
+        (Exception,), description="Exception types to retry"
+    )
+    non_retryable_exceptions: Tuple[Type[BaseException], ...] = Field(
+        (NotImplementedError, PermissionError),
+        description="Exception types never retried",
+    )
+    func_is_retryable: Optional[Callable] = Field(
+        None, exclude=True, description="Custom classification function"
+    )
+
+    budget_ratio: float = Field(0.2, description="Retries / requests ratio")
+    budget_min_retries_per_second: float = Field(1.0, description="Retry floor")
+    budget_window: float = Field(10.0, description="Budget window in seconds")
+
+    breaker_failure_threshold: int = Field(0, description="0 disables the breaker")
+    breaker_recovery_timeout: float = Field(30.0, description="Open duration")
+    breaker_half_open_max_calls: int = Field(1, description="Half-open trials")
+
+    _budget: RetryBudget = PrivateAttr()
+    _breaker: CircuitBreaker = PrivateAttr()
+    _attempt_count: int = PrivateAttr(0)
+    _retry_count: int = PrivateAttr(0)
+    _non_retryable_count: int = PrivateAttr(0)
+
+    @field_serializer(
+        "retryable_exceptions", "non_retryable_exceptions", when_used="json"
+    )
+    def _serialize_exceptions(self, exceptions):
+        return [f"{e.__module__}.{e.__qualname__}" for e in exceptions]
+
+    def model_post_init(self, __context):
+        self._budget = RetryBudget(
+            ratio=self.budget_ratio,
+            min_retries_per_second=self.budget_min_retries_per_second,
+            window=self.budget_window,
+        )
+        self._breaker = CircuitBreaker(
+            "",
+            failure_threshold=self.breaker_failure_threshold,
+            recovery_timeout=self.breaker_recovery_timeout,
+            half_open_max_calls=self.breaker_half_open_max_calls,
+        )
+
+    def bind(self, name: str):
+        """Attach the owning oxy name, used in breaker logs."""
+        self._breaker.name = name
+
+    @property
+    def circuit_state(self) -> CircuitState:
+        return self._breaker.state
+
+    def get_max_attempts(self, default: int) -> int:
+        return self.max_attempts if self.max_attempts is not None else default
+
+    def get_delay(self, attempt: int, default_base_delay: float = 1.0) -> float:
+        """Return the backoff before retry number ``attempt`` (1-based)."""
+        base_delay = (
+            self.base_delay if self.base_delay is not None else default_base_delay
+        )
+        delay = min(self.max_delay, base_delay * self.multiplier ** (attempt - 1))
+        if self.jitter == "full":
+            return random.uniform(0, delay)
+        if self.jitter == "equal":
+            return delay / 2 + random.uniform(0, delay / 2)
+        return delay
+
+    def is_retryable(self, e: BaseException) -> bool:
+        if self.func_is_retryable:
+            return bool(self.func_is_retryable(e))
+        if isinstance(e, self.non_retryable_exceptions):
+            return False
+        if isinstance(e, httpx.HTTPStatusError):
+            return e.response.status_code in RETRYABLE_STATUS_CODES
+        return isinstance(e, self.retryable_exceptions)
+
+    def allow_request(self) -> bool:
+        """Check the breaker and account the request in the budget."""
+        if not self._breaker.allow_request():
+            return False
+        self._budget.record_request()
+        return True
+
+    def record_attempt(self):
+        self._attempt_count += 1
+
+    def should_retry(self, e: BaseException, attempt: int, max_attempts: int) -> bool:
+        """Decide whether a failed ``attempt`` may be followed by another one."""
+        if attempt >= max_attempts:
+            return False
+        if not self.is_retryable(e):
+            self._non_retryable_count += 1
+            return False
+        if not self._budget.try_acquire():
+            return False
+        self._retry_count += 1
+        return True
+
+    def record_success(self):
+        self._breaker.record_success()
+
+    def record_failure(self):
+        self._breaker.record_failure()
+
+    def get_stats(self) -> dict:
+        """Return counters and breaker state for metrics exposure."""
+        return {
+            "attempts": self._attempt_count,
+            "retries": self._retry_count,
+            "non_retryable": self._non_retryable_count,
+            **self._budget.get_stats(),
+            **self._breaker.get_stats(),
+        }
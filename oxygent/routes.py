@@ -5,6 +5,7 @@ FastAPI routing layer for the OxyGent MAS service.
 This module exposes several HTTP endpoints that support:
     * Health checks and root redirection
     * Retrieval of node‐level execution details stored in Elasticsearch
+    * Latency profiles (critical path, flame graphs) of stored traces
     * Proxying user requests to an LLM provider through the OxyGent agent stack
     * Lightweight persistence for scripted calls (save / list / load)
 
@@ -31,10 +32,11 @@ from fastapi.responses import RedirectResponse
 from pydantic import BaseModel
 
 from .config import Config
-from .databases.db_es import JesEs, LocalEs
+from .databases import db_es
 from .db_factory import DBFactory
 from .oxy_factory import OxyFactory
 from .schemas import OxyRequest, WebResponse
+from .trace_analyzer import analyze_trace
 from .utils.data_utils import add_post_and_child_node_ids
 
 logger = logging.getLogger(__name__)
@@ -102,9 +104,9 @@ async def get_node_info(item_id: str):
         hosts = jes_config["hosts"]
         user = jes_config["user"]
         password = jes_config["password"]
-        es_client = db_factory.get_instance(JesEs, hosts, user, password)
+        es_client = db_factory.get_instance(db_es.JesEs, hosts, user, password)
     else:
-        es_client = db_factory.get_instance(LocalEs)
+        es_client = db_factory.get_instance(db_es.LocalEs)
     es_response = await es_client.search(
         Config.get_app_name() + "_node", {"query": {"term": {"_id": item_id}}}
     )
@@ -182,18 +184,17 @@ async def get_node_info(item_id: str):
         return WebResponse(code=500, message="遇到问题").to_dict()
 
 
-# Define the data model for the LLM call request
-@router.get("/view")
-async def get_task_info(item_id: str):
+async def _get_trace_nodes(item_id: str):
+    """Return the trace id of ``item_id`` (a node or trace id) and its nodes."""
     db_factory = DBFactory()
     if Config.get_es_config():
         jes_config = Config.get_es_config()
         hosts = jes_config["hosts"]
         user = jes_config["user"]
         password = jes_config["password"]
-        es_client = db_factory.get_instance(JesEs, hosts, user, password)
+        es_client = db_factory.get_instance(db_es.JesEs, hosts, user, password)
     else:
-        es_client = db_factory.get_instance(LocalEs)
+        es_client = db_factory.get_instance(db_es.LocalEs)
 
     # es_client.exists(Config.get_app_name() + "_node", doc_id=item_id)
 
@@ -228,6 +229,13 @@ async def get_task_info(item_id: str):
         ):
             data["_source"]["pre_node_ids"] = []
         nodes.append(data["_source"])
+    return trace_id, nodes
+
+
+# Define the data model for the LLM call request
+@router.get("/view")
+async def get_task_info(item_id: str):
+    trace_id, nodes = await _get_trace_nodes(item_id)
     for index, node in enumerate(nodes):
         node["index"] = index
     add_post_and_child_node_ids(nodes)
@@ -235,6 +243,30 @@ async def get_task_info(item_id: str):
     return WebResponse(data=task_data).to_dict()
 
 
+@router.get("/trace_profile")
+async def get_trace_profile(item_id: str, format: str = "summary"):
+    """Latency profile of a trace: critical path, self time and parallelism.
+
+    Args:
+        item_id: A node identifier or a trace identifier.
+        format: ``summary`` for the analysis wrapped in a ``WebResponse``,
+            ``chrome`` or ``speedscope`` for a raw JSON file that can be opened
+            in Perfetto / ``chrome://tracing`` or https://www.speedscope.app.
+
+    Returns:
+        dict: The analysis (see :class:`oxygent.trace_analyzer.TraceAnalyzer`).
+    """
+    if format not in ("summary", "chrome", "speedscope"):
+        return WebResponse(code=400, message=f"illegal format: {format}").to_dict()
+    trace_id, nodes = await _get_trace_nodes(item_id)
+    if not nodes:
+        return WebResponse(code=400, message="illegal item_id").to_dict()
+    profile = analyze_trace(nodes, format)
+    if format != "summary":
+        return profile
+    return WebResponse(data=profile).to_dict()
+
+
 class Item(BaseModel):
     class_attr: dict
     arguments: dict
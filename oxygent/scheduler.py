@@ -0,0 +1,241 @@
+"""scheduler.py Weighted fair scheduling of oxy concurrency slots.
+
+By default every oxy guards its concurrency with a FIFO ``asyncio.Semaphore``, so a
+single tenant flooding the MAS (a batch job, a hammered ``/chat``) can occupy every
+slot of a shared LLM. The :class:`FairScheduler` replaces those semaphores for the
+configured categories with :class:`WeightedFairSemaphore` instances, which grant
+free slots to waiting tenants by start-time fair queuing:
+
+    - every tenant owns a virtual finish tag, advanced by ``1 / weight`` per grant
+    - a free slot goes to the waiting tenant with the smallest tag
+    - within a tenant, waiters with a higher ``priority`` are served first
+
+The tenant and priority of a call are carried by :class:`~oxygent.schemas.OxyRequest`
+and inherited by all its sub-calls. The web service drops both from client
+payloads: the tenant of an HTTP request comes from :meth:`FairScheduler.resolve_tenant`
+unless ``MAS.func_filter`` sets it.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Optional
+
+from .config import Config
+
+DEFAULT_TENANT = "default"
+
+
+class TenantStats:
+    """Queue depth and wait-time counters of one tenant on one semaphore."""
+
+    __slots__ = ("waiting", "granted", "total_wait", "max_wait")
+
+    def __init__(self):
+        self.waiting = 0
+        self.granted = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "queue_depth": self.waiting,
+            "granted": self.granted,
+            "avg_wait": self.total_wait / self.granted if self.granted else 0.0,
+            "max_wait": self.max_wait,
+        }
+
+
+class WeightedFairSemaphore:
+    """Semaphore that grants slots by weighted fair queuing instead of FIFO."""
+
+    def __init__(self, value: int, scheduler: "FairScheduler"):
+        self._value = value
+        self._scheduler = scheduler
+        self._queues: dict[str, list] = {}
+        self._tags: dict[str, float] = {}
+        self._vtime = 0.0
+        self._waiting = 0
+        self._seq = itertools.count()
+        self.tenant_stats: dict[str, TenantStats] = {}
+
+    @property
+    def queue_depth(self) -> int:
+        return self._waiting
+
+    def locked(self) -> bool:
+        return self._value <= 0
+
+    def _get_stats(self, tenant) -> TenantStats:
+        stats = self.tenant_stats.get(tenant)
+        if stats is None:
+            stats = self.tenant_stats[tenant] = TenantStats()
+        return stats
+
+    def _next_tag(self, tenant) -> float:
+        return max(self._vtime, self._tags.get(tenant, 0.0))
+
+    def _grant(self, tenant, wait_time):
+        self._value -= 1
+        start = self._next_tag(tenant)
+        self._tags[tenant] = start + 1.0 / self._scheduler.get_weight(tenant)
+        self._vtime = start
+        stats = self._get_stats(tenant)
+        stats.granted += 1
+        stats.total_wait += wait_time
+        if wait_time > stats.max_wait:
+            stats.max_wait = wait_time
+
+    async def acquire(self, tenant: str = DEFAULT_TENANT, priority: int = 0):
+        if self._value > 0 and not self._waiting:
+            self._grant(tenant, 0.0)
+            return True
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._queues.setdefault(tenant, []),
+            (-priority, next(self._seq), time.monotonic(), future),
+        )
+        self._waiting += 1
+        self._get_stats(tenant).waiting += 1
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted right before the cancellation: hand the slot on
+                self.release()
+            else:
+                future.cancel()
+                self._waiting -= 1
+                self._get_stats(tenant).waiting -= 1
+            raise
+        return True
+
+    def release(self):
+        self._value += 1
+        self._wake_up_next()
+
+    def _pick_tenant(self) -> Optional[str]:
+        picked, picked_tag = None, None
+        for tenant, queue in self._queues.items():
+            # Drop waiters cancelled while queuing
+            while queue and queue[0][3].done():
+                heapq.heappop(queue)
+            if not queue:
+                continue
+            tag = self._next_tag(tenant)
+            if picked_tag is None or tag < picked_tag:
+                picked, picked_tag = tenant, tag
+        return picked
+
+    def _wake_up_next(self):
+        while self._value > 0 and self._waiting:
+            tenant = self._pick_tenant()
+            if tenant is None:
+                break
+            _, _, enqueue_time, future = heapq.heappop(self._queues[tenant])
+            self._waiting -= 1
+            self._get_stats(tenant).waiting -= 1
+            self._grant(tenant, time.monotonic() - enqueue_time)
+            future.set_result(True)
+        # Forget idle tenants so that the bookkeeping stays bounded
+        for tenant in [t for t, q in self._queues.items() if not q]:
+            del self._queues[tenant]
+            if self._tags.get(tenant, 0.0) <= self._vtime:
+                self._tags.pop(tenant, None)
+
+    def get_stats(self) -> dict:
+        return {tenant: stats.to_dict() for tenant, stats in self.tenant_stats.items()}
+
+
+class _Slot:
+    """Async context manager holding one slot of a WeightedFairSemaphore."""
+
+    __slots__ = ("semaphore", "tenant", "priority")
+
+    def __init__(self, semaphore, tenant, priority):
+        self.semaphore = semaphore
+        self.tenant = tenant
+        self.priority = priority
+
+    async def __aenter__(self):
+        await self.semaphore.acquire(self.tenant, self.priority)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.semaphore.release()
+
+
+class FairScheduler:
+    """MAS-level scheduler sharing tenant weights across all scheduled oxys.
+
+    Args:
+        tenant_weights: Mapping tenant -> weight, a weight-4 tenant gets four
+            times the slots of a weight-1 tenant while both are backlogged.
+        default_weight: Weight of tenants missing from ``tenant_weights``.
+        tenant_key: Key looked up in ``group_data`` to derive the tenant.
+        tenant_header: HTTP header used when ``group_data`` has no tenant.
+        categories: Oxy categories whose slots are scheduled fairly.
+    """
+
+    def __init__(
+        self,
+        tenant_weights: dict = None,
+        default_weight: float = 1.0,
+        tenant_key: str = "tenant",
+        tenant_header: str = "x-tenant-id",
+        categories: tuple = ("llm", "tool"),
+    ):
+        self.tenant_weights = tenant_weights or {}
+        self.default_weight = default_weight
+        self.tenant_key = tenant_key
+        self.tenant_header = tenant_header
+        self.categories = set(categories)
+        self.semaphores: dict[str, WeightedFairSemaphore] = {}
+
+    @classmethod
+    def from_config(cls) -> Optional["FairScheduler"]:
+        """Build the scheduler from ``Config``, ``None`` if it is disabled."""
+        scheduler_config = Config.get_scheduler_config()
+        if not scheduler_config.get("is_enabled"):
+            return None
+        return cls(
+            tenant_weights=scheduler_config.get("tenant_weights", {}),
+            default_weight=scheduler_config.get("default_weight", 1.0),
+            tenant_key=scheduler_config.get("tenant_key", "tenant"),
+            tenant_header=scheduler_config.get("tenant_header", "x-tenant-id"),
+            categories=tuple(scheduler_config.get("categories", ("llm", "tool"))),
+        )
+
+    def get_weight(self, tenant) -> float:
+        return max(float(self.tenant_weights.get(tenant, self.default_weight)), 1e-6)
+
+    def is_scheduled(self, oxy) -> bool:
+        return oxy.category in self.categories
+
+    def get_semaphore(self, name: str, value: int) -> WeightedFairSemaphore:
+        semaphore = self.semaphores.get(name)
+        if semaphore is None:
+            semaphore = self.semaphores[name] = WeightedFairSemaphore(value, self)
+        return semaphore
+
+    def slot(self, oxy, oxy_request) -> _Slot:
+        """Return an async context manager acquiring a slot of ``oxy``."""
+        return _Slot(
+            self.get_semaphore(oxy.name, oxy.semaphore),
+            oxy_request.tenant or DEFAULT_TENANT,
+            oxy_request.priority,
+        )
+
+    def resolve_tenant(self, group_data: dict, headers: dict) -> str:
+        """Derive the tenant of a user request from group_data or headers."""
+        tenant = group_data.get(self.tenant_key)
+        if not tenant and headers:
+            tenant = headers.get(self.tenant_header)
+        return str(tenant) if tenant else DEFAULT_TENANT
+
+    def get_stats(self) -> dict:
+        """Per-oxy, per-tenant queue depth and wait-time statistics."""
+        return {
+            name: semaphore.get_stats() for name, semaphore in self.semaphores.items()
+        }
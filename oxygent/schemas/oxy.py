@@ -52,6 +52,8 @@ class OxyRequest(BaseModel):
         Call-specific parameters (user input, tool args, etc.).
     shared_data : dict
         Scratch space shared with descendants in the same trace.
+    tenant / priority : str / int
+        Scheduling class of the request, inherited by every sub-call.
     """
 
     # Static
@@ -97,6 +99,11 @@ class OxyRequest(BaseModel):
     is_save_history: bool = Field(True, description="whether history is saved")
     is_async_storage: bool = Field(True, description="whether async storage is used")
 
+    tenant: Optional[str] = Field(
+        "default", description="tenant used by the fair scheduler"
+    )
+    priority: int = Field(0, description="priority within the tenant, higher first")
+
     parallel_id: Optional[str] = Field("", description="")
     parallel_dict: Optional[dict] = Field(default_factory=dict, description="")
 
@@ -175,45 +182,34 @@ class OxyRequest(BaseModel):
         return new_instance
 
     async def retry_execute(self, oxy, oxy_request=None) -> "OxyResponse":
-        """Execute an oxy with automatic retries.
+        """Execute an oxy, turning an escaped exception into a FAILED response.
 
         Retries
         -------
-        Controlled by `oxy.retries` and `oxy.delay`.
+        `oxy.execute` already retries according to `oxy.retry_policy`, so an
+        exception reaching this method is not retried again: that would charge
+        one failure to the retry budget twice.
 
         Returns:
-            OxyResponse: Completed or FAILED after exhausting retries.
+            OxyResponse: The oxy's response, or FAILED if it raised.
         """
         if oxy_request is None:
             oxy_request = self
-        attempt = 0
-        while attempt < oxy.retries:
-            try:
-                return await oxy.execute(oxy_request)
-            except Exception as e:
-                attempt += 1
-                logger.warning(
-                    f"Error executing oxy: {e}. Attempt {attempt} of {oxy.retries}.",
-                    extra={
-                        "trace_id": oxy_request.current_trace_id,
-                        "node_id": oxy_request.node_id,
-                    },
-                )
-                if attempt < oxy.retries:
-                    await asyncio.sleep(oxy.delay)
-                else:
-                    error_msg = traceback.format_exc()
-                    logger.warning(
-                        f"Max retries reached. Failing. {error_msg}",
-                        extra={
-                            "trace_id": oxy_request.current_trace_id,
-                            "node_id": oxy_request.node_id,
-                        },
-                    )
-                    return OxyResponse(
-                        state=OxyState.FAILED,
-                        output=f"Error executing tool {oxy.name}: {str(e)}",
-                    )
+        try:
+            return await oxy.execute(oxy_request)
+        except Exception as e:
+            error_msg = traceback.format_exc()
+            logger.warning(
+                f"Error executing oxy: {e}. Failing. {error_msg}",
+                extra={
+                    "trace_id": oxy_request.current_trace_id,
+                    "node_id": oxy_request.node_id,
+                },
+            )
+            return OxyResponse(
+                state=OxyState.FAILED,
+                output=f"Error executing tool {oxy.name}: {str(e)}",
+            )
 
     async def call(self, **kwargs) -> "OxyResponse":
         """Invoke another oxy or tool.
@@ -0,0 +1,459 @@
+"""trace_analyzer.py Latency analysis of a trace from its node records.
+
+Every oxy call stores a node record with ``father_node_id`` (the caller node),
+``pre_node_ids`` (the sibling nodes it waited for), ``parallel_id`` (siblings
+started together), ``create_time`` and ``update_time``. :class:`TraceAnalyzer`
+rebuilds the call DAG from these records and computes:
+
+    - the critical path: the chain of calls the trace actually waited for,
+      with the time each node contributes to it
+    - self time vs child time per node and per callee, child time being the
+      union of the children intervals so that parallel calls are not counted
+      twice
+    - the efficiency of every group of parallel calls
+    - Chrome trace (``chrome://tracing``, Perfetto) and speedscope exports
+
+Node durations prefer ``extra["timings"]["total"]`` measured by the oxy itself
+and fall back to ``update_time - create_time``. ``create_time`` is written after
+the phases in :data:`PRE_SAVE_PHASES`, so those are left out of the interval.
+
+Typical usage::
+
+    profile = TraceAnalyzer(nodes).summary()
+"""
+
+import itertools
+import json
+from collections import defaultdict
+from datetime import datetime
+from typing import Optional
+
+from .utils.data_utils import add_post_and_child_node_ids
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+# Phases of Oxy.execute that run before the node record gets its create_time
+PRE_SAVE_PHASES = ("semaphore_wait", "pre_process", "request_interceptor")
+
+
+def parse_time(value) -> Optional[float]:
+    """Parse a node record time (``yyyy-MM-dd HH:mm:ss.SSSSSSSSS``) to seconds."""
+    if not value:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return datetime.strptime(value[:26], "%Y-%m-%d %H:%M:%S.%f").timestamp()
+    except ValueError:
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            return None
+
+
+def _load_extra(node: dict) -> dict:
+    extra = node.get("extra") or {}
+    if isinstance(extra, str):
+        try:
+            extra = json.loads(extra)
+        except json.JSONDecodeError:
+            return {}
+    return extra if isinstance(extra, dict) else {}
+
+
+def union_length(intervals: list) -> float:
+    """Total length covered by ``(start, end)`` intervals."""
+    total = 0.0
+    current_start = current_end = None
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        total += current_end - current_start
+    return total
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+class TraceAnalyzer:
+    """Critical path, self time and parallelism of one trace.
+
+    Args:
+        nodes: Node records of one trace, as stored in the ``*_node`` index.
+            Records without ``create_time`` are ignored.
+    """
+
+    def __init__(self, nodes: list[dict]):
+        nodes = [dict(node) for node in nodes]
+        for node in nodes:
+            node["pre_node_ids"] = [i for i in node.get("pre_node_ids") or [] if i]
+            node.setdefault("father_node_id", "")
+        add_post_and_child_node_ids(nodes)
+
+        self.nodes: dict[str, dict] = {}
+        for node in nodes:
+            start = parse_time(node.get("create_time"))
+            if start is None:
+                continue
+            timings = _load_extra(node).get("timings") or {}
+            if timings.get("total") is not None:
+                end = start + float(timings["total"])
+                end -= sum(float(timings.get(p) or 0) for p in PRE_SAVE_PHASES)
+            else:
+                end = parse_time(node.get("update_time")) or start
+            node["timings"] = timings
+            node["start"], node["end"] = start, max(start, end)
+            self.nodes[node["node_id"]] = node
+
+        self.roots = sorted(
+            (n for n in self.nodes.values() if n["father_node_id"] not in self.nodes),
+            key=lambda n: n["start"],
+        )
+        for root in self.roots:
+            self._clamp_children(root)
+        if self.roots:
+            self.start = min(root["start"] for root in self.roots)
+            self.end = max(root["end"] for root in self.roots)
+        else:
+            self.start = self.end = 0.0
+
+        for node in self.nodes.values():
+            child_time = union_length(
+                [(child["start"], child["end"]) for child in self.children(node)]
+            )
+            node["duration"] = node["end"] - node["start"]
+            node["child_time"] = child_time
+            node["self_time"] = max(0.0, node["duration"] - child_time)
+            node["critical_time"] = 0.0
+        self.critical_node_ids = self._compute_critical_path()
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    @property
+    def trace_id(self) -> str:
+        return next((n.get("trace_id", "") for n in self.nodes.values()), "")
+
+    def children(self, node: dict) -> list[dict]:
+        return [
+            self.nodes[child_id]
+            for child_id in node["child_node_ids"]
+            if child_id in self.nodes
+        ]
+
+    def _clamp_children(self, node: dict):
+        """Keep children inside their caller, records are written asynchronously."""
+        stack = [node]
+        while stack:
+            father = stack.pop()
+            for child in self.children(father):
+                child["start"] = min(
+                    max(child["start"], father["start"]), father["end"]
+                )
+                child["end"] = max(min(child["end"], father["end"]), child["start"])
+                stack.append(child)
+
+    # ------------------------------------------------------------------
+    # Critical path
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _last_finished(candidates: list, until: Optional[float], visited: set):
+        last = None
+        for candidate in candidates:
+            if candidate["node_id"] in visited:
+                continue
+            if until is not None and candidate["end"] > until:
+                continue
+            if last is None or candidate["end"] > last["end"]:
+                last = candidate
+        return last
+
+    def _walk_critical_path(
+        self, node: dict, visited: set, until: Optional[float] = None
+    ):
+        """Walk back from the end of ``node`` through the calls it waited for.
+
+        The child finishing last is on the critical path; before it, the
+        sibling it depended on (``pre_node_ids``) or else the child finishing
+        last before it started. Gaps between them are the node's own time.
+        ``until`` cuts the node where its successor on the path started.
+        """
+        visited.add(node["node_id"])
+        children = self.children(node)
+        until = node["end"] if until is None else min(node["end"], until)
+        until = max(until, node["start"])
+        current = self._last_finished(children, until, visited)
+        while current is not None:
+            node["critical_time"] += until - min(current["end"], until)
+            self._walk_critical_path(current, visited, until)
+            until = max(min(current["start"], until), node["start"])
+            predecessors = [
+                self.nodes[i] for i in current["pre_node_ids"] if i in self.nodes
+            ]
+            # Dependencies are known, their times may overlap by the delay of
+            # the asynchronous record writes
+            current = self._last_finished(
+                predecessors, None, visited
+            ) or self._last_finished(children, until, visited)
+        node["critical_time"] += until - node["start"]
+
+    def _compute_critical_path(self) -> list:
+        visited = set()
+        for root in self.roots:
+            self._walk_critical_path(root, visited)
+        on_path = [n for n in self.nodes.values() if n["node_id"] in visited]
+        return [n["node_id"] for n in sorted(on_path, key=lambda n: n["start"])]
+
+    def _node_summary(self, node: dict) -> dict:
+        return {
+            "node_id": node["node_id"],
+            "callee": node.get("callee", ""),
+            "caller": node.get("caller", ""),
+            "node_type": node.get("node_type", ""),
+            "state": node.get("state", ""),
+            "start_ms": _ms(node["start"] - self.start),
+            "duration_ms": _ms(node["duration"]),
+            "self_ms": _ms(node["self_time"]),
+            "child_ms": _ms(node["child_time"]),
+            "critical_ms": _ms(node["critical_time"]),
+            "timings": node["timings"],
+        }
+
+    def critical_path(self) -> list[dict]:
+        """Nodes on the critical path in start order.
+
+        ``critical_ms`` is the time a node itself adds to the critical path;
+        the values sum up to the trace duration.
+        """
+        return [self._node_summary(self.nodes[i]) for i in self.critical_node_ids]
+
+    # ------------------------------------------------------------------
+    # Self time and parallelism
+    # ------------------------------------------------------------------
+    def callee_stats(self) -> list[dict]:
+        """Calls, total, self, child and critical time per callee."""
+        stats = {}
+        for node in self.nodes.values():
+            callee = node.get("callee", "")
+            item = stats.setdefault(
+                callee,
+                {
+                    "callee": callee,
+                    "node_type": node.get("node_type", ""),
+                    "calls": 0,
+                    "total": 0.0,
+                    "self": 0.0,
+                    "child": 0.0,
+                    "critical": 0.0,
+                    "max": 0.0,
+                },
+            )
+            item["calls"] += 1
+            item["total"] += node["duration"]
+            item["self"] += node["self_time"]
+            item["child"] += node["child_time"]
+            item["critical"] += node["critical_time"]
+            item["max"] = max(item["max"], node["duration"])
+        return [
+            {
+                "callee": item["callee"],
+                "node_type": item["node_type"],
+                "calls": item["calls"],
+                "total_ms": _ms(item["total"]),
+                "self_ms": _ms(item["self"]),
+                "child_ms": _ms(item["child"]),
+                "critical_ms": _ms(item["critical"]),
+                "max_ms": _ms(item["max"]),
+            }
+            for item in sorted(stats.values(), key=lambda x: x["self"], reverse=True)
+        ]
+
+    def _parallel_groups(self) -> list[list[dict]]:
+        groups = defaultdict(list)
+        for node in self.nodes.values():
+            if node.get("parallel_id"):
+                groups[(node["father_node_id"], node["parallel_id"])].append(node)
+        return [group for group in groups.values() if len(group) > 1]
+
+    def parallelism(self) -> dict:
+        """Efficiency of each group of parallel calls and of the whole trace.
+
+        For a group, ``speedup`` is the summed duration over the wall time of
+        the group and ``efficiency`` the speedup over the group size: 1.0 when
+        all members run fully overlapped and equally long.
+        """
+        groups = []
+        for group in self._parallel_groups():
+            span = max(n["end"] for n in group) - min(n["start"] for n in group)
+            work = sum(n["duration"] for n in group)
+            father = self.nodes.get(group[0]["father_node_id"], {})
+            groups.append(
+                {
+                    "parallel_id": group[0]["parallel_id"],
+                    "caller": father.get("callee", group[0].get("caller", "")),
+                    "size": len(group),
+                    "callees": [n.get("callee", "") for n in group],
+                    "span_ms": _ms(span),
+                    "work_ms": _ms(work),
+                    "speedup": round(work / span, 3) if span else float(len(group)),
+                    "efficiency": round(work / span / len(group), 3) if span else 1.0,
+                }
+            )
+        self_time = sum(n["self_time"] for n in self.nodes.values())
+        return {
+            # Mean number of calls doing their own work at the same time
+            "average_parallelism": (
+                round(self_time / self.duration, 3) if self.duration else 0.0
+            ),
+            "groups": sorted(groups, key=lambda g: g["span_ms"], reverse=True),
+        }
+
+    def summary(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "node_count": len(self.nodes),
+            "duration_ms": _ms(self.duration),
+            "critical_path": self.critical_path(),
+            "callees": self.callee_stats(),
+            "parallelism": self.parallelism(),
+        }
+
+    # ------------------------------------------------------------------
+    # Exports
+    # ------------------------------------------------------------------
+    def _assign_lanes(self) -> dict:
+        """Map node ids to lanes in which calls nest without overlapping.
+
+        A call runs in its caller's lane, except the 2nd and later members of
+        a parallel group, which open a lane each.
+        """
+        group_sizes = defaultdict(int)
+        for node in self.nodes.values():
+            group_sizes[(node["father_node_id"], node.get("parallel_id"))] += 1
+        next_lane = itertools.count(1)
+        lanes = {}
+        stack = [(root, next(next_lane)) for root in reversed(self.roots)]
+        while stack:
+            node, lane = stack.pop()
+            lanes[node["node_id"]] = lane
+            opened = set()
+            for child in sorted(self.children(node), key=lambda n: n["start"]):
+                group = (child["father_node_id"], child.get("parallel_id"))
+                if group_sizes[group] > 1 and group in opened:
+                    stack.append((child, next(next_lane)))
+                else:
+                    opened.add(group)
+                    stack.append((child, lane))
+        return lanes
+
+    def to_chrome_trace(self) -> dict:
+        """Chrome trace event format, readable by Perfetto and speedscope."""
+        trace_id = self.trace_id
+        events = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": 1,
+                "args": {"name": f"trace {trace_id}"},
+            }
+        ]
+        for node_id, lane in self._assign_lanes().items():
+            node = self.nodes[node_id]
+            events.append(
+                {
+                    "name": node.get("callee", ""),
+                    "cat": node.get("node_type", ""),
+                    "ph": "X",
+                    "ts": round((node["start"] - self.start) * 1e6, 3),
+                    "dur": round(node["duration"] * 1e6, 3),
+                    "pid": 1,
+                    "tid": lane,
+                    "args": {
+                        "node_id": node_id,
+                        "caller": node.get("caller", ""),
+                        "state": node.get("state", ""),
+                        "self_ms": _ms(node["self_time"]),
+                        "critical_ms": _ms(node["critical_time"]),
+                        **{f"timings.{k}": v for k, v in node["timings"].items()},
+                    },
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def to_speedscope(self) -> dict:
+        """Speedscope file with one evented profile per lane."""
+        frames, frame_index = [], {}
+        intervals_by_lane = defaultdict(list)
+        for node_id, lane in self._assign_lanes().items():
+            node = self.nodes[node_id]
+            name = node.get("callee", "")
+            if name not in frame_index:
+                frame_index[name] = len(frames)
+                frames.append({"name": name})
+            intervals_by_lane[lane].append(
+                (
+                    (node["start"] - self.start) * 1000,
+                    (node["end"] - self.start) * 1000,
+                    frame_index[name],
+                )
+            )
+
+        profiles = []
+        end_value = round(self.duration * 1000, 3)
+        for lane in sorted(intervals_by_lane):
+            events, stack = [], []
+            for start, end, frame in sorted(
+                intervals_by_lane[lane], key=lambda x: (x[0], -x[1])
+            ):
+                while stack and stack[-1][0] <= start:
+                    close_at, closed_frame = stack.pop()
+                    events.append({"type": "C", "frame": closed_frame, "at": close_at})
+                if stack:
+                    # Evented profiles must nest
+                    end = min(end, stack[-1][0])
+                events.append({"type": "O", "frame": frame, "at": round(start, 3)})
+                stack.append((round(end, 3), frame))
+            while stack:
+                close_at, closed_frame = stack.pop()
+                events.append({"type": "C", "frame": closed_frame, "at": close_at})
+            profiles.append(
+                {
+                    "type": "evented",
+                    "name": f"lane {lane}",
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": end_value,
+                    "events": events,
+                }
+            )
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": f"trace {self.trace_id}",
+            "exporter": "oxygent",
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+
+def analyze_trace(nodes: list[dict], output_format: str = "summary") -> dict:
+    """Analyze the node records of one trace.
+
+    Args:
+        nodes: Node records of one trace.
+        output_format: ``summary``, ``chrome`` or ``speedscope``.
+    """
+    analyzer = TraceAnalyzer(nodes)
+    if output_format == "chrome":
+        return analyzer.to_chrome_trace()
+    if output_format == "speedscope":
+        return analyzer.to_speedscope()
+    if output_format == "summary":
+        return analyzer.summary()
+    raise ValueError(f"Unknown trace profile format: {output_format}")
@@ -0,0 +1,213 @@
+"""tracing.py Per-phase timings and spans of the Oxy execution lifecycle.
+
+``Oxy.execute`` measures every phase of a call with a :class:`PhaseTimer` and
+stores the result in ``OxyResponse.extra["timings"]``, which also lands in the
+node record. When a :class:`Tracer` is configured on the MAS, each call is
+exported as an OpenTelemetry-compatible span with one child span per phase:
+
+    - trace id: md5 of ``current_trace_id`` (32 hex chars)
+    - span id: first 16 hex chars of the md5 of ``node_id``
+    - parent span id: derived the same way from ``father_node_id``
+
+Spans are plain dicts following the OTLP/JSON field names, so exporters do not
+need the OpenTelemetry SDK. Subclass :class:`SpanExporter` to ship them
+elsewhere.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from .config import Config
+from .schemas import OxyState
+from .utils.common_utils import get_md5
+
+logger = logging.getLogger(__name__)
+
+
+class PhaseTimer:
+    """Monotonic stopwatch splitting one oxy call into consecutive phases."""
+
+    __slots__ = ("start_time_ns", "_start", "_last", "phases")
+
+    def __init__(self):
+        self.start_time_ns = time.time_ns()
+        self._start = self._last = time.perf_counter()
+        self.phases: list[tuple[str, float, float]] = []
+
+    def mark(self, phase: str):
+        """Close the phase running since the previous mark."""
+        now = time.perf_counter()
+        self.phases.append((phase, self._last - self._start, now - self._last))
+        self._last = now
+
+    @property
+    def total(self) -> float:
+        return self._last - self._start
+
+    def to_dict(self) -> dict:
+        """Seconds spent per phase, plus the total so far."""
+        timings = {}
+        for phase, _, duration in self.phases:
+            timings[phase] = round(timings.get(phase, 0.0) + duration, 6)
+        timings["total"] = round(self.total, 6)
+        return timings
+
+
+def to_trace_id(current_trace_id: str) -> str:
+    return get_md5(current_trace_id)
+
+
+def to_span_id(node_id: str) -> str:
+    return get_md5(node_id)[:16]
+
+
+class SpanExporter:
+    """Base class of span exporters."""
+
+    def export(self, spans: list[dict]):
+        raise NotImplementedError("This method is not yet implemented")
+
+    def shutdown(self):
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keep the most recent spans in memory, for tests and offline analysis."""
+
+    def __init__(self, max_spans: int = 10000):
+        self.spans: deque = deque(maxlen=max_spans)
+
+    def export(self, spans: list[dict]):
+        self.spans.extend(spans)
+
+    def get_finished_spans(self, trace_id: Optional[str] = None) -> list[dict]:
+        """Return the kept spans, optionally of one ``current_trace_id``."""
+        if trace_id is None:
+            return list(self.spans)
+        otel_trace_id = to_trace_id(trace_id)
+        return [span for span in self.spans if span["trace_id"] == otel_trace_id]
+
+    def clear(self):
+        self.spans.clear()
+
+
+class FileSpanExporter(SpanExporter):
+    """Append spans to a JSON lines file, one span per line."""
+
+    def __init__(self, file_path: str, flush_every: int = 64):
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        self.file_path = file_path
+        self.flush_every = flush_every
+        self._file = open(file_path, "a", encoding="utf-8")
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def export(self, spans: list[dict]):
+        with self._lock:
+            if self._file.closed:
+                return
+            for span in spans:
+                self._file.write(json.dumps(span, ensure_ascii=False) + "\n")
+            self._pending += len(spans)
+            if self._pending >= self.flush_every:
+                self._file.flush()
+                self._pending = 0
+
+    def shutdown(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class Tracer:
+    """Turn the phase timings of oxy calls into spans and hand them to an exporter."""
+
+    def __init__(self, exporter: SpanExporter, service_name: Optional[str] = None):
+        self.exporter = exporter
+        self.service_name = service_name or Config.get_app_name()
+
+    @classmethod
+    def from_config(cls) -> Optional["Tracer"]:
+        """Build the tracer from ``Config``, ``None`` if it is disabled."""
+        tracing_config = Config.get_tracing_config()
+        if not tracing_config.get("is_enabled"):
+            return None
+        exporter_name = tracing_config.get("exporter", "memory")
+        if exporter_name == "file":
+            file_path = tracing_config.get("file_path") or os.path.join(
+                Config.get_cache_save_dir(), "spans.jsonl"
+            )
+            exporter = FileSpanExporter(file_path)
+        elif exporter_name == "memory":
+            exporter = InMemorySpanExporter(tracing_config.get("max_spans", 10000))
+        else:
+            raise ValueError(f"Unknown span exporter: {exporter_name}")
+        return cls(exporter)
+
+    def build_spans(self, oxy, oxy_response, timer: PhaseTimer) -> list[dict]:
+        oxy_request = oxy_response.oxy_request
+        trace_id = to_trace_id(oxy_request.current_trace_id)
+        span_id = to_span_id(oxy_request.node_id)
+        start_ns = timer.start_time_ns
+        resource = {"service.name": self.service_name}
+        span = {
+            "trace_id": trace_id,
+            "span_id": span_id,
+            "parent_span_id": (
+                to_span_id(oxy_request.father_node_id)
+                if oxy_request.father_node_id
+                else ""
+            ),
+            "name": oxy.name,
+            "kind": "SPAN_KIND_INTERNAL",
+            "start_time_unix_nano": start_ns,
+            "end_time_unix_nano": start_ns + int(timer.total * 1e9),
+            "attributes": {
+                "oxy.name": oxy.name,
+                "oxy.category": oxy.category,
+                "oxy.caller": oxy_request.caller,
+                "oxy.node_id": oxy_request.node_id,
+                "oxy.trace_id": oxy_request.current_trace_id,
+                "oxy.state": oxy_response.state.name,
+            },
+            "status": {
+                "code": (
+                    "STATUS_CODE_ERROR"
+                    if oxy_response.state is OxyState.FAILED
+                    else "STATUS_CODE_OK"
+                )
+            },
+            "resource": resource,
+        }
+        spans = [span]
+        for phase, offset, duration in timer.phases:
+            phase_start_ns = start_ns + int(offset * 1e9)
+            spans.append(
+                {
+                    "trace_id": trace_id,
+                    "span_id": get_md5(f"{oxy_request.node_id}:{phase}")[:16],
+                    "parent_span_id": span_id,
+                    "name": f"{oxy.name}.{phase}",
+                    "kind": "SPAN_KIND_INTERNAL",
+                    "start_time_unix_nano": phase_start_ns,
+                    "end_time_unix_nano": phase_start_ns + int(duration * 1e9),
+                    "attributes": {"oxy.phase": phase},
+                    "status": {"code": "STATUS_CODE_UNSET"},
+                    "resource": resource,
+                }
+            )
+        return spans
+
+    def export(self, oxy, oxy_response, timer: PhaseTimer):
+        try:
+            self.exporter.export(self.build_spans(oxy, oxy_response, timer))
+        except Exception as e:
+            logger.warning(f"Failed to export spans of oxy {oxy.name}: {e}")
+
+    def shutdown(self):
+        self.exporter.shutdown()
@@ -0,0 +1,70 @@
+"""Shared pooled HTTP client.
+
+Creating an ``httpx.AsyncClient`` per request pays for a new connection, TLS
+handshake and connection pool on every call. :func:`get_http_client` returns one
+client per event loop, configured by the ``tool.http_*`` settings, whose pool is
+reused by all HTTP tools. :func:`read_response` reads a streamed response up to a
+size cap.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import weakref
+
+import httpx
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]"
+_clients = weakref.WeakKeyDictionary()
+
+
+def _is_http2() -> bool:
+    if not Config.get_tool_http_is_http2():
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP/2 needs the h2 package (pip install httpx[http2])")
+        return False
+    return True
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """The pooled client of the running event loop, created on first use."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=Config.get_tool_http_max_connections(),
+                max_keepalive_connections=Config.get_tool_http_max_keepalive(),
+                keepalive_expiry=Config.get_tool_http_keepalive_expiry(),
+            ),
+            http2=_is_http2(),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the pooled client of the running event loop."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def read_response(response: httpx.Response, max_size: int) -> tuple:
+    """``(text, is_truncated)`` of a streamed response, read up to ``max_size``
+    bytes; 0 reads everything."""
+    chunks, size, is_truncated = [], 0, False
+    async for chunk in response.aiter_bytes():
+        if max_size and size + len(chunk) > max_size:
+            chunks.append(chunk[: max_size - size])
+            is_truncated = True
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+    content = b"".join(chunks)
+    return content.decode(response.encoding or "utf-8", errors="replace"), is_truncated
@@ -0,0 +1,35 @@
+"""lazy_import.py Attributes of a package imported on first access (PEP 562).
+
+Typical usage, at the end of a package ``__init__.py``::
+
+    __getattr__, __dir__ = lazy_module(__name__, {"ChatAgent": ".chat_agent"})
+"""
+
+import importlib
+import sys
+
+
+def lazy_module(module_name: str, lazy_imports: dict):
+    """Return the module-level ``__getattr__`` and ``__dir__`` of a package.
+
+    Args:
+        module_name: ``__name__`` of the package.
+        lazy_imports: Mapping attribute name -> module, relative to the package,
+            that defines an attribute of the same name. The attribute is
+            imported on first access and then stored on the package.
+    """
+    module = sys.modules[module_name]
+
+    def __getattr__(name):
+        if name in lazy_imports:
+            value = getattr(
+                importlib.import_module(lazy_imports[name], module_name), name
+            )
+            setattr(module, name, value)
+            return value
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted(set(vars(module)) | set(lazy_imports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,81 @@
+"""
+Unit tests for the AdmissionController (bounded queue, timeouts, CoDel shedding)
+"""
+
+import asyncio
+
+import pytest
+
+from oxygent.admission import AdmissionController, AdmissionRejected
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tests
+# ──────────────────────────────────────────────────────────────────────────────
+@pytest.mark.asyncio
+async def test_admits_up_to_max_in_flight_then_queues():
+    controller = AdmissionController(max_in_flight=1, max_queue_size=1)
+    admitted_at = await controller.acquire()
+    waiter = asyncio.create_task(controller.acquire())
+    await asyncio.sleep(0)
+    assert controller.queue_depth == 1
+
+    controller.release(admitted_at)
+    controller.release(await waiter)
+    stats = controller.get_stats()
+    assert stats["admitted"] == 2
+    assert stats["in_flight"] == 0
+    assert stats["queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_queue_full_is_shed_with_retry_after():
+    controller = AdmissionController(max_in_flight=1, max_queue_size=0, retry_after=3)
+    await controller.acquire()
+    with pytest.raises(AdmissionRejected) as exc_info:
+        await controller.acquire()
+    assert exc_info.value.reason == "queue_full"
+    assert exc_info.value.retry_after >= 3
+    assert controller.get_stats()["rejected"]["queue_full"] == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_wait_is_bounded():
+    controller = AdmissionController(max_in_flight=1, max_queue_wait=0.01)
+    await controller.acquire()
+    with pytest.raises(AdmissionRejected) as exc_info:
+        await controller.acquire()
+    assert exc_info.value.reason == "queue_timeout"
+    assert controller.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_codel_sheds_standing_queue():
+    controller = AdmissionController(
+        max_in_flight=1, codel_target=0.01, codel_interval=0.0
+    )
+    admitted_at = await controller.acquire()
+    waiters = [asyncio.create_task(controller.acquire()) for _ in range(2)]
+    await asyncio.sleep(0.05)
+
+    # The first dequeue reveals the standing queue, the next one is shed
+    controller.release(admitted_at)
+    controller.release(await waiters[0])
+    with pytest.raises(AdmissionRejected) as exc_info:
+        await waiters[1]
+    assert exc_info.value.reason == "codel"
+    assert controller.get_stats()["overloaded"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_frees_its_place():
+    controller = AdmissionController(max_in_flight=1)
+    admitted_at = await controller.acquire()
+    waiter = asyncio.create_task(controller.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert controller.queue_depth == 0
+    controller.release(admitted_at)
+    assert controller.in_flight == 0
@@ -2,11 +2,14 @@
 Unit tests for BaseMCPClient
 """
 
+import asyncio
 import types
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock
 
 import pytest
 
+from oxygent.config import Config
 from oxygent.oxy.mcp_tools.base_mcp_client import BaseMCPClient
 from oxygent.oxy.mcp_tools.mcp_tool import MCPTool
 from oxygent.schemas import OxyRequest, OxyState
@@ -115,3 +118,120 @@ async def test_cleanup_resets_session(client):
     await client.cleanup()
     assert client._session is None
     assert client._stdio_context is None
+
+
+class CachedMCPClient(BaseMCPClient):
+    """Client whose transport yields a MockSession once ``connected`` is set."""
+
+    server: str = "mock"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._connected = asyncio.Event()
+        self._mock_session = MockSession()
+        self._connect_count = 0
+        self._error = None
+
+    def get_server_identity(self) -> dict:
+        return {"class_name": self.class_name, "server": self.server}
+
+    @asynccontextmanager
+    async def _session_context(self, headers):
+        if self._error:
+            raise self._error
+        await self._connected.wait()
+        self._connect_count += 1
+        yield self._mock_session
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    saved_dir = Config.get_cache_save_dir()
+    Config.set_cache_save_dir(str(tmp_path))
+    yield tmp_path
+    Config.set_cache_save_dir(saved_dir)
+
+
+def _cached_client(mas_env):
+    c = CachedMCPClient(name="cached_server", is_manifest_cached=True)
+    c.set_mas(mas_env)
+    return c
+
+
+@pytest.mark.asyncio
+async def test_manifest_saved_after_listing_tools(mas_env, cache_dir):
+    c = _cached_client(mas_env)
+    c._connected.set()
+    await c.init()
+    assert c.load_manifest() == [
+        {"name": "dummy_tool", "description": "dummy_tool-desc", "input_schema": {}}
+    ]
+    assert c.get_manifest_path().startswith(str(cache_dir))
+
+
+@pytest.mark.asyncio
+async def test_init_from_manifest_revalidates_in_background(cache_dir):
+    first = _cached_client(DummyMAS())
+    first._connected.set()
+    await first.init()
+
+    mas_env = DummyMAS()
+    c = _cached_client(mas_env)
+    c._mock_session.list_tools.return_value = [
+        ("tools", [MockMCPToolInfo("dummy_tool"), MockMCPToolInfo("new_tool")])
+    ]
+    # Registered from the cache while the server is still unreachable
+    await asyncio.wait_for(c.init(), 1)
+    assert c.included_tool_name_list == ["dummy_tool"]
+    assert isinstance(mas_env.oxy_name_to_oxy["dummy_tool"], MCPTool)
+    assert c._session is None
+
+    c._connected.set()
+    await c._connect_task
+    assert c.included_tool_name_list == ["dummy_tool", "new_tool"]
+    assert [tool["name"] for tool in c.load_manifest()] == ["dummy_tool", "new_tool"]
+    assert c._connect_count == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_waits_for_background_connection(cache_dir, oxy_request):
+    first = _cached_client(DummyMAS())
+    first._connected.set()
+    await first.init()
+
+    c = _cached_client(DummyMAS())
+    await c.init()
+    oxy_request.callee = "dummy_tool"
+    call = asyncio.create_task(c._execute(oxy_request))
+    await asyncio.sleep(0.01)
+    assert not call.done()
+    c._connected.set()
+    resp = await call
+    assert resp.output == "hello-world"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_reconnect(cache_dir, mas_env):
+    first = _cached_client(DummyMAS())
+    first._connected.set()
+    await first.init()
+
+    c = _cached_client(mas_env)
+    c._error = ConnectionError("server down")
+    await c.init()
+    await c._connect_task
+    assert c._supervisor is None
+
+    c._error = None
+    requests = []
+    for _ in range(5):
+        request = OxyRequest(arguments={}, callee="dummy_tool")
+        request.mas = mas_env
+        requests.append(request)
+    calls = [asyncio.create_task(c._execute(r)) for r in requests]
+    await asyncio.sleep(0.01)
+    c._connected.set()
+    responses = await asyncio.gather(*calls)
+    assert all(resp.output == "hello-world" for resp in responses)
+    assert c._connect_count == 1
+    await c.cleanup()
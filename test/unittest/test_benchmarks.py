@@ -0,0 +1,69 @@
+"""
+Unit tests for the benchmark fake LLM and topologies
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from benchmarks.fake_llm import FakeLLM
+from benchmarks.runner import BusyClock, percentile
+from benchmarks.topologies import TOPOLOGIES
+from oxygent.schemas import OxyRequest
+
+
+def _request(messages):
+    return OxyRequest(arguments={"messages": messages})
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tests
+# ──────────────────────────────────────────────────────────────────────────────
+@pytest.mark.asyncio
+async def test_fake_llm_follows_script():
+    llm = FakeLLM(name="llm", tool_calls=[("t0", {"text": "a"}), ("t1", {})])
+    messages = [{"role": "user", "content": "q"}]
+
+    first = await llm._execute(_request(messages))
+    assert json.loads(first.output)["tool_name"] == "t0"
+    assert first.extra["usage"]["prompt_tokens"] == 0
+
+    messages.append({"role": "assistant", "content": first.output})
+    second = await llm._execute(_request(messages))
+    assert json.loads(second.output)["tool_name"] == "t1"
+
+    messages.append({"role": "assistant", "content": second.output})
+    third = await llm._execute(_request(messages))
+    assert third.output == llm.answer
+
+
+@pytest.mark.parametrize("name", sorted(TOPOLOGIES))
+def test_topologies_have_one_master(name):
+    topology = TOPOLOGIES[name](n_tools=2)
+    masters = [o for o in topology.oxy_space if getattr(o, "is_master", False)]
+    assert len(masters) == 1
+    names = [o.name for o in topology.oxy_space]
+    assert len(names) == len(set(names))
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 50) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_busy_clock_counts_concurrent_calls_once():
+    class Store:
+        async def write(self):
+            await asyncio.sleep(0.05)
+
+    store = Store()
+    clock = BusyClock()
+    clock.instrument(store)
+    await asyncio.gather(*(store.write() for _ in range(10)))
+    calls, seconds = clock.snapshot()
+    assert calls == 10
+    assert 0.05 <= seconds < 0.2
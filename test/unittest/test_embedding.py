@@ -2,8 +2,11 @@
 Unit tests for EmbeddingCache & get_embedding
 """
 
+import asyncio
 import base64
 import json
+import os
+import pickle
 from unittest.mock import AsyncMock, patch
 
 import numpy as np
@@ -59,6 +62,73 @@ def test_save_and_load(cache):
     assert (c2.data[md5] == vec).all()
 
 
+def test_save_appends_without_rewriting(cache):
+    """Rows are appended to the memory-mapped matrix, old rows stay in place"""
+    cache.set("a", np.array([1.0, 0.0]))
+    cache.set("b", np.array([0.0, 1.0]))  # save_batch=2 flushes here
+    assert not cache.pending
+    size = os.path.getsize(cache.file)
+
+    cache.set("c", np.array([0.5, 0.5]))
+    cache.save()
+    assert os.path.getsize(cache.file) == size + 2 * 4
+
+    matrix = np.load(cache.file, mmap_mode="r")
+    assert matrix.shape == (3, 2) and matrix.dtype == np.float32
+    with open(cache.index_file) as f:
+        assert f.read().split() == [cache.get_md5(k) for k in "abc"]
+
+    c2 = ec.EmbeddingCache()
+    vec = c2.data[c2.get_md5("c")]
+    assert isinstance(vec, np.memmap)  # zero-copy view of the file
+    assert (vec == np.array([0.5, 0.5])).all()
+
+
+def test_concurrent_caches_share_the_file(cache):
+    """Each cache picks up the rows appended by the other before appending"""
+    other = ec.EmbeddingCache()
+    cache.set("mine", np.array([1.0, 1.0]))
+    other.set("theirs", np.array([2.0, 2.0]))
+    other.set("mine", np.array([1.0, 1.0]))
+    cache.save()
+    other.save()
+
+    fresh = ec.EmbeddingCache()
+    assert len(fresh.rows) == 2
+    assert (fresh.data[fresh.get_md5("mine")] == 1.0).all()
+    assert (fresh.data[fresh.get_md5("theirs")] == 2.0).all()
+
+
+def test_cut_index_line_is_ignored(cache):
+    """A key whose append was cut short is dropped and overwritten"""
+    cache.set("a", np.array([1.0, 0.0]))
+    cache.save()
+    with open(cache.index_file, "a") as f:
+        f.write("0123")
+
+    c2 = ec.EmbeddingCache()
+    assert list(c2.data) == [c2.get_md5("a")]
+    c2.set("b", np.array([0.0, 1.0]))
+    c2.save()
+    assert len(ec.EmbeddingCache().rows) == 2
+
+
+def test_float16_and_legacy_pickle(tmp_path, monkeypatch):
+    """A cache.pkl of older versions is imported into the matrix"""
+    monkeypatch.setattr(
+        "oxygent.embedding_cache.Config.get_cache_save_dir", lambda: str(tmp_path)
+    )
+    md5 = ec.EmbeddingCache.get_md5("old")
+    with open(tmp_path / "cache.pkl", "wb") as f:
+        pickle.dump({md5: np.array([0.25, 0.75])}, f)
+
+    c = ec.EmbeddingCache(dtype="float16")
+    assert c.is_in("old")
+    assert np.load(c.file, mmap_mode="r").dtype == np.float16
+    with pytest.raises(ValueError):
+        c.set("wrong", np.array([1.0, 2.0, 3.0]))
+
+
 @pytest.mark.asyncio
 async def test_get_batch_mixed(monkeypatch, cache):
     """get batch with some keys cached, others not"""
@@ -96,8 +166,8 @@ async def test_get_embedding_success(monkeypatch):
         lambda: "http://fake_url",
     )
 
-    with patch("oxygent.embedding_cache.httpx.AsyncClient") as client_cls:
-        client = client_cls.return_value.__aenter__.return_value
+    with patch("oxygent.embedding_cache.get_http_client") as get_client:
+        client = get_client.return_value
         client.post = AsyncMock(return_value=FakeResponse())
 
         result = await ec.get_embedding(["hello"])
@@ -110,3 +180,100 @@ async def test_get_embedding_invalid_input():
     """Passing non-list raises error (prints message and returns None)"""
     result = await ec.get_embedding("not_a_list")
     assert result is None
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tests for EmbeddingBatcher
+# ──────────────────────────────────────────────────────────────────────────────
+class FakeService:
+    """Embedding service recording the texts of every request"""
+
+    def __init__(self, delay=0.0):
+        self.requests = []
+        self.delay = delay
+        self.running = self.max_running = 0
+
+    async def embed(self, texts):
+        self.requests.append(list(texts))
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+        return np.array([[len(text), 1.0] for text in texts])
+
+
+@pytest.mark.asyncio
+async def test_batcher_merges_concurrent_calls():
+    """Calls within the batch window share one request, duplicates sent once"""
+    service = FakeService()
+    batcher = ec.EmbeddingBatcher(service.embed, max_batch_size=10, batch_window=0.01)
+
+    first, second, third = await asyncio.gather(
+        batcher.embed(["a"]), batcher.embed(["bb", "a"]), batcher.embed(["ccc"])
+    )
+    assert service.requests == [["a", "bb", "ccc"]]
+    assert first.tolist() == [[1, 1]]
+    assert second.tolist() == [[2, 1], [1, 1]]
+    assert third.tolist() == [[3, 1]]
+
+
+@pytest.mark.asyncio
+async def test_batcher_splits_and_limits_concurrency():
+    """Large inputs are split into batches, only max_concurrency in flight"""
+    service = FakeService(delay=0.01)
+    batcher = ec.EmbeddingBatcher(
+        service.embed, max_batch_size=4, batch_window=0, max_concurrency=2
+    )
+
+    texts = ["x" * i for i in range(1, 11)]
+    vectors = await batcher.embed(texts)
+    assert [len(r) for r in service.requests] == [4, 4, 2]
+    assert service.max_running == 2
+    assert vectors[:, 0].tolist() == list(range(1, 11))
+
+
+@pytest.mark.asyncio
+async def test_batcher_propagates_errors():
+    """A failed request fails every caller of the batch"""
+
+    async def broken(texts):
+        return None
+
+    batcher = ec.EmbeddingBatcher(broken, batch_window=0)
+    results = await asyncio.gather(
+        batcher.embed(["a"]), batcher.embed(["b"]), return_exceptions=True
+    )
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_batcher_cancelled_caller_does_not_cancel_others():
+    """Cancelling one caller leaves the shared request to the other callers"""
+    service = FakeService(delay=0.02)
+    batcher = ec.EmbeddingBatcher(service.embed, batch_window=0)
+
+    first = asyncio.create_task(batcher.embed(["x"]))
+    second = asyncio.create_task(batcher.embed(["x"]))
+    await asyncio.sleep(0.005)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert (await second).tolist() == [[1, 1]]
+    assert service.requests == [["x"]]
+
+
+@pytest.mark.asyncio
+async def test_cache_embeds_misses_in_batches(monkeypatch, cache):
+    """get() of many keys sends only the uncached ones, in batches"""
+    service = FakeService()
+    monkeypatch.setattr(ec, "get_embedding", service.embed)
+    monkeypatch.setattr(
+        ec, "embedding_batcher", ec.EmbeddingBatcher(max_batch_size=3, batch_window=0)
+    )
+    cache.set("cached", np.array([9.0, 9.0]))
+
+    keys = ["cached"] + [f"text{i}" for i in range(7)] + ["text0"]
+    vectors = await cache.get(keys)
+    assert sorted(map(len, service.requests)) == [1, 3, 3]
+    assert vectors.shape == (9, 2)
+    assert (vectors[0] == 9.0).all() and (vectors[1] == vectors[8]).all()
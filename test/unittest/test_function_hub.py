@@ -3,10 +3,13 @@ Unit tests for FunctionHub
 """
 
 import asyncio
+import os
+import threading
+import time
 
 import pytest
 
-from oxygent.oxy.function_tools.function_hub import FunctionHub
+from oxygent.oxy.function_tools.function_hub import FunctionHub, shutdown_executors
 from oxygent.oxy.function_tools.function_tool import FunctionTool
 from oxygent.schemas import OxyResponse, OxyState
 
@@ -22,6 +25,15 @@ class DummyMAS:
         self.oxy_name_to_oxy[oxy.name] = oxy
 
 
+# Module level, so that worker processes can import it
+process_hub = FunctionHub(name="process_hub", executor="process")
+
+
+@process_hub.tool("pid of the worker")
+def worker_pid(offset: int = 0):
+    return os.getpid() + offset
+
+
 # ────────────────────────────────────────────────────────────────────────────
 # Fixtures
 # ────────────────────────────────────────────────────────────────────────────
@@ -92,3 +104,67 @@ def test_sync_function_wrapped_async(func_hub):
 
     result = asyncio.run(async_inc(41))
     assert result == 42
+
+
+@pytest.mark.asyncio
+async def test_thread_executor_keeps_loop_responsive(func_hub):
+    @func_hub.tool("blocking sleep", executor="thread")
+    def blocking():
+        time.sleep(0.2)
+        return threading.current_thread().name
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    thread_name = await blocking()
+    task.cancel()
+
+    assert thread_name.startswith("function_tool")
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_loop_executor_and_hub_default(func_hub):
+    func_hub.executor = "loop"
+
+    @func_hub.tool("thread name")
+    def current():
+        return threading.current_thread().name
+
+    assert await current() == threading.current_thread().name
+    func_hub.executor = "thread"
+    assert await current() != threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_process_executor_runs_in_worker_process():
+    try:
+        pid = await worker_pid(offset=1)
+        assert pid - 1 != os.getpid()
+        with pytest.raises(TypeError, match="Argument offset"):
+            await worker_pid(offset=threading.Lock())
+    finally:
+        shutdown_executors()
+
+
+def test_executor_validation(func_hub):
+    with pytest.raises(ValueError):
+        func_hub.tool("bad", executor="gpu")
+
+    with pytest.raises(ValueError, match="module level"):
+
+        @func_hub.tool("nested", executor="process")
+        def nested():
+            return 1
+
+    with pytest.raises(ValueError):
+
+        @func_hub.tool("async in thread", executor="thread")
+        async def coroutine():
+            return 1
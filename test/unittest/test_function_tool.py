@@ -71,3 +71,56 @@ async def test_execute_failure(error_tool):
     resp = await error_tool._execute(req)
     assert resp.state is OxyState.FAILED
     assert "boom" in resp.output
+
+
+async def scale(
+    oxy_request: OxyRequest,
+    value: int = Field(description="value"),
+    factor: int = Field(default=2, description="factor"),
+    unit: str = "m",
+):
+    return f"{value * factor}{unit}@{oxy_request.current_trace_id}"
+
+
+def test_call_plan_is_compiled_once():
+    tool = FunctionTool(name="scale_tool", desc="scale", func_process=scale)
+    assert tool._call_plan == (
+        ("oxy_request", True, None),
+        ("value", False, None),
+        ("factor", False, 2),
+        ("unit", False, "m"),
+    )
+    assert tool.needs_oxy_request
+
+
+@pytest.mark.asyncio
+async def test_execute_does_not_inspect_signature(monkeypatch):
+    import oxygent.oxy.function_tools.function_tool as function_tool
+
+    tool = FunctionTool(name="scale_tool", desc="scale", func_process=scale)
+    monkeypatch.setattr(function_tool, "signature", None)
+    req = OxyRequest(arguments={"value": 3}, current_trace_id="t1")
+
+    resp = await tool._execute(req)
+    assert resp.output == "6m@t1"
+
+
+@pytest.mark.asyncio
+async def test_validated_arguments_are_coerced():
+    tool = FunctionTool(
+        name="scale_tool",
+        desc="scale",
+        func_process=scale,
+        is_arguments_validated=True,
+    )
+    req = OxyRequest(arguments={"value": "3", "factor": "4"}, current_trace_id="t2")
+    resp = await tool._execute(req)
+    assert resp.output == "12m@t2"
+
+    resp = await tool._execute(OxyRequest(arguments={"value": "three"}))
+    assert resp.state is OxyState.FAILED
+    assert "value" in resp.output
+
+    resp = await tool._execute(OxyRequest(arguments={"factor": 4}))
+    assert resp.state is OxyState.FAILED
+    assert "value" in resp.output
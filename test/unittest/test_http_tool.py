@@ -0,0 +1,107 @@
+"""
+Unit tests for HttpTool
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from oxygent.oxy.api_tools.http_tool import HttpTool
+from oxygent.schemas import OxyRequest, OxyState
+from oxygent.utils import http_client
+
+
+@pytest.fixture
+def requests_seen():
+    """Route the pooled client of the test loop to a mock server."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.url.path == "/big":
+            return httpx.Response(200, content=b"x" * 5000)
+        if request.url.path == "/cached":
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, text="fresh body", headers={"ETag": '"v1"'})
+        return httpx.Response(
+            200,
+            json={
+                "method": request.method,
+                "query": dict(request.url.params),
+                "body": request.content.decode(),
+            },
+        )
+
+    async def install():
+        loop = asyncio.get_running_loop()
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        http_client._clients[loop] = client
+
+    return seen, install
+
+
+def make_request(**arguments):
+    return OxyRequest(arguments=arguments)
+
+
+@pytest.mark.asyncio
+async def test_pooled_client_is_shared():
+    client = http_client.get_http_client()
+    assert http_client.get_http_client() is client
+    await http_client.close_http_client()
+    assert client.is_closed
+    assert http_client.get_http_client() is not client
+    await http_client.close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_get_sends_query_and_post_sends_body(requests_seen):
+    seen, install = requests_seen
+    await install()
+
+    get_tool = HttpTool(name="get", url="http://api/echo", default_params={"a": 1})
+    response = await get_tool._execute(make_request(b="2"))
+    assert json.loads(response.output)["query"] == {"a": "1", "b": "2"}
+
+    post_tool = HttpTool(name="post", method="post", url="http://api/echo")
+    response = await post_tool._execute(make_request(name="x"))
+    output = json.loads(response.output)
+    assert output["method"] == "POST"
+    assert json.loads(output["body"]) == {"name": "x"}
+
+    form_tool = HttpTool(
+        name="form", method="PUT", url="http://api/echo", body_format="form"
+    )
+    response = await form_tool._execute(make_request(name="x"))
+    assert json.loads(response.output)["body"] == "name=x"
+    await http_client.close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_response_size_is_capped(requests_seen):
+    _, install = requests_seen
+    await install()
+
+    tool = HttpTool(name="big", url="http://api/big", max_response_size=1000)
+    response = await tool._execute(make_request())
+    assert response.state is OxyState.COMPLETED
+    assert response.output.startswith("x" * 1000 + "\n... (truncated at 1000 bytes)")
+    await http_client.close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_conditional_requests_reuse_cached_body(requests_seen):
+    seen, install = requests_seen
+    await install()
+
+    tool = HttpTool(name="cached", url="http://api/cached", is_conditional_cached=True)
+    first = await tool._execute(make_request(q="1"))
+    second = await tool._execute(make_request(q="1"))
+
+    assert first.output == second.output == "fresh body"
+    assert "if-none-match" not in seen[0].headers
+    assert seen[1].headers["if-none-match"] == '"v1"'
+    await http_client.close_http_client()
@@ -0,0 +1,51 @@
+"""
+Unit tests for the lazy imports of oxygent and the import-time benchmark
+"""
+
+import pytest
+
+import oxygent
+from benchmarks.import_time import SCENARIOS, parse_importtime, run_scenario
+from oxygent import oxy, preset_tools
+from oxygent.oxy.function_tools.function_hub import FunctionHub
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tests
+# ──────────────────────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("scenario", ["import", "chat_agent", "preset_tool"])
+def test_scenario_does_not_load_heavy_modules(scenario):
+    result = run_scenario(SCENARIOS[scenario], repeat=1)
+    assert result["heavy"] == []
+    assert result["median_ms"] > 0
+
+
+def test_lazy_attributes_resolve():
+    for name in oxy.__all__:
+        assert getattr(oxy, name).__name__ == name
+    assert "ChatAgent" in dir(oxy)
+    assert oxygent.MAS.__name__ == "MAS"
+    assert oxygent.OxyFactory.create_oxy("ChatAgent", name="chat").name == "chat"
+    with pytest.raises(AttributeError):
+        oxy.NotAnOxy
+    with pytest.raises(ValueError):
+        oxygent.OxyFactory.create_oxy("NotAnOxy")
+
+
+def test_preset_tools_keep_function_hub_after_submodule_import():
+    from oxygent.preset_tools.string_tools import extract_emails  # noqa: F401
+
+    assert isinstance(preset_tools.string_tools, FunctionHub)
+    assert preset_tools.string_tools.name == "string_tools"
+
+
+def test_parse_importtime():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        300 | oxygent\n"
+        "import time:        80 |         80 |   oxygent.config\n"
+    )
+    assert parse_importtime(stderr) == [
+        (120, 300, "oxygent"),
+        (80, 80, "oxygent.config"),
+    ]
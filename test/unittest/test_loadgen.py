@@ -0,0 +1,167 @@
+"""
+Unit tests for the load generator and its HDR histogram
+"""
+
+import asyncio
+import json
+import random
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from benchmarks.hdr_histogram import HdrHistogram
+from benchmarks.loadgen import PayloadFactory, main, run_load
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# HdrHistogram
+# ──────────────────────────────────────────────────────────────────────────────
+def test_hdr_histogram_relative_error():
+    histogram = HdrHistogram(significant_figures=3)
+    values = [random.randint(1, 60_000_000) for _ in range(5000)]
+    for value in values:
+        histogram.record(value)
+    ordered = sorted(values)
+    for q in (50, 90, 99, 99.9):
+        exact = ordered[max(0, int(len(ordered) * q / 100 + 0.999999) - 1)]
+        assert abs(histogram.percentile(q) - exact) <= exact * 1e-3
+    assert histogram.percentile(100) == max(values)
+    assert histogram.summary()["min"] == min(values)
+
+
+def test_hdr_histogram_percentile_rank_is_not_rounded_up():
+    histogram = HdrHistogram()
+    for value in range(1, 5001):
+        histogram.record(value)
+    assert histogram.percentile(99.9) == 4995
+
+
+def test_hdr_histogram_merge_and_round_trip():
+    a, b = HdrHistogram(), HdrHistogram()
+    for value in range(1, 1001):
+        (a if value % 2 else b).record(value)
+    a.merge(b)
+    assert a.total_count == 1000
+    assert a.percentile(50) == 500
+
+    restored = HdrHistogram.from_dict(json.loads(json.dumps(a.to_dict())))
+    assert restored.total_count == 1000
+    assert restored.percentile(99) == a.percentile(99)
+    assert (restored.min_value, restored.max_value) == (1, 1000)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Load generator against an in-process app
+# ──────────────────────────────────────────────────────────────────────────────
+def _create_app(received: list):
+    app = FastAPI()
+
+    @app.post("/chat")
+    async def chat(request: Request):
+        payload = await request.json()
+        received.append(payload)
+        if payload["query"] == "reject":
+            return JSONResponse(status_code=429, content={"code": 429})
+        return {"code": 200, "data": {"output": "ok"}}
+
+    @app.post("/async/chat")
+    async def async_chat(request: Request):
+        received.append(await request.json())
+        return {"code": 200, "data": {"output": "accepted"}}
+
+    @app.post("/sse/chat")
+    async def sse_chat(request: Request):
+        received.append(await request.json())
+
+        async def event_stream():
+            yield 'data: {"type": "tool_call", "content": {}}\n\n'
+            await asyncio.sleep(0.01)
+            yield 'data: {"type": "answer", "content": "ok"}\n\n'
+            yield "event: close\ndata: done\n\n"
+
+        return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+    return app
+
+
+def _transport(received: list):
+    return httpx.ASGITransport(app=_create_app(received))
+
+
+@pytest.mark.asyncio
+async def test_closed_loop_chains_turns():
+    received = []
+    report = await run_load(
+        "http://test",
+        endpoint="chat",
+        concurrency=2,
+        duration=0.2,
+        turns=3,
+        payload_factory=PayloadFactory(
+            attachments=["http://files/a.pdf"],
+            attachment_ratio=1.0,
+            group_data={"tenant": "t1"},
+        ),
+        transport=_transport(received),
+    )
+    assert report["mode"] == "closed_loop"
+    assert report["requests"] == len(received) > 0
+    assert report["error_rate"] == 0.0
+    assert report["latency_ms"]["latency"]["count"] == report["requests"]
+    trace_ids = {payload["current_trace_id"] for payload in received}
+    for payload in received:
+        assert payload["group_data"]["tenant"] == "t1"
+        assert payload["attachments"] == ["http://files/a.pdf"]
+        if "from_trace_id" in payload:
+            assert payload["from_trace_id"] in trace_ids
+    assert any("from_trace_id" in payload for payload in received)
+
+
+@pytest.mark.asyncio
+async def test_open_loop_sse_measures_first_event_and_answer():
+    received = []
+    report = await run_load(
+        "http://test",
+        endpoint="sse",
+        rps=50,
+        duration=0.2,
+        transport=_transport(received),
+    )
+    assert report["mode"] == "open_loop"
+    assert report["requests"] == 10
+    assert report["ok"] == 10
+    latency = report["latency_ms"]
+    assert latency["time_to_first_event"]["count"] == 10
+    assert latency["time_to_answer"]["p50"] >= latency["time_to_first_event"]["p50"]
+    assert latency["time_to_answer"]["p50"] >= 10
+
+
+@pytest.mark.asyncio
+async def test_errors_are_counted_by_status():
+    received = []
+    report = await run_load(
+        "http://test",
+        endpoint="chat",
+        concurrency=1,
+        duration=0.1,
+        turns=3,
+        payload_factory=PayloadFactory(queries=["reject"]),
+        transport=_transport(received),
+    )
+    # A failed turn ends its session
+    assert all("from_trace_id" not in payload for payload in received)
+    assert report["errors"] == {"429": report["requests"]}
+    assert report["error_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_run_load_requires_one_mode():
+    with pytest.raises(ValueError):
+        await run_load("http://test", rps=1, concurrency=1)
+
+
+def test_cli_requires_one_mode():
+    with pytest.raises(SystemExit):
+        main(["--url", "http://test"])
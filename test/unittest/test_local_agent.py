@@ -11,6 +11,7 @@ import pytest
 from oxygent.oxy.agents.local_agent import LocalAgent
 from oxygent.oxy.base_tool import BaseTool
 from oxygent.oxy.function_tools.function_tool import FunctionTool
+from oxygent.retry_policy import RetryPolicy
 from oxygent.schemas import OxyRequest, OxyResponse, OxyState
 
 
@@ -141,3 +142,13 @@ async def test_full_execute_cycle(dummy_local_agent, oxy_request):
     resp = await dummy_local_agent.execute(copy.deepcopy(oxy_request))
     assert resp.state == OxyState.COMPLETED
     assert resp.output == "hello"
+
+
+def test_deepcopy_keeps_retry_classifier(dummy_local_agent):
+    def is_retryable(e):
+        return isinstance(e, KeyError)
+
+    dummy_local_agent.retry_policy = RetryPolicy(func_is_retryable=is_retryable)
+    dup = copy.deepcopy(dummy_local_agent)
+    assert dup.retry_policy.func_is_retryable is is_retryable
+    assert dup.retry_policy is not dummy_local_agent.retry_policy
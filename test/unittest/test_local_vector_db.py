@@ -0,0 +1,141 @@
+"""
+Unit tests for LocalVectorDB
+"""
+
+import hashlib
+import os
+
+import numpy as np
+import pytest
+
+import oxygent.embedding_cache as ec
+from oxygent.databases.db_vector.local_vector_db import LocalVectorDB
+
+
+def fake_vector(text):
+    seed = int(hashlib.md5(text.encode()).hexdigest()[:8], 16)
+    return np.random.default_rng(seed).normal(size=16)
+
+
+async def fake_embed(texts):
+    return np.array([fake_vector(text) for text in texts])
+
+
+TOOLS = [
+    ("app", "agent_a", "weather", "get the weather of a city"),
+    ("app", "agent_a", "time", "get the current time"),
+    ("app", "agent_b", "search", "search the web"),
+    ("app", "agent_b", "weather", "get the weather of a city"),
+]
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "oxygent.embedding_cache.Config.get_cache_save_dir", lambda: str(tmp_path)
+    )
+    monkeypatch.setattr(ec, "get_embedding", fake_embed)
+    return LocalVectorDB({"persist_dir": str(tmp_path / "vectors")}, fake_embed)
+
+
+@pytest.mark.asyncio
+async def test_tool_retrieval_filters_by_app_and_agent(db):
+    await db.create_vearch_table_by_tool_list(TOOLS)
+
+    tools = await db.tool_retrieval("get the current time", "app", "agent_a", 2, -1)
+    assert tools == ["time", "weather"]
+    assert await db.tool_retrieval("search the web", "app", "agent_b", 1) == ["search"]
+    assert await db.tool_retrieval("search the web", "other_app", "agent_b") == []
+
+    hits = await db.search(
+        db.tool_space_name, fake_vector("search the web"), 10, {"agent_name": "agent_b"}
+    )
+    assert [hit["tool_name"] for hit in hits][0] == "search"
+    assert {hit["agent_name"] for hit in hits} == {"agent_b"}
+    assert hits[0]["_score"] == pytest.approx(1.0, abs=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_spaces_persist_and_apps_are_replaced(db, tmp_path):
+    await db.create_vearch_table_by_tool_list(TOOLS)
+    await db.create_vearch_table_by_tool_list(
+        [("other", "agent", "search", "search the web")]
+    )
+    await db.create_vearch_table_by_tool_list(
+        [("app", "agent_a", "time", "get the current time")]
+    )
+
+    reloaded = LocalVectorDB({"persist_dir": str(tmp_path / "vectors")}, fake_embed)
+    space = reloaded._get_space(reloaded.tool_space_name)
+    assert isinstance(space.vectors, np.memmap)
+    assert sorted((d["app_name"], d["tool_name"]) for d in space.docs) == [
+        ("app", "time"),
+        ("other", "search"),
+    ]
+    assert await reloaded.tool_retrieval("search the web", "other", "agent") == [
+        "search"
+    ]
+
+    assert await reloaded.delete_by_appname("other") == 1
+    assert await reloaded.drop_space(reloaded.tool_space_name)
+    assert not await reloaded.check_space_exist(reloaded.tool_space_name)
+
+
+@pytest.mark.asyncio
+async def test_query_search_returns_requested_fields(db):
+    await db.insert("docs", [{"text": "a"}, {"text": "b"}], await fake_embed("ab"))
+
+    df = await db.query_search("docs", "b", 1, fields=["text"])
+    assert list(df.columns) == ["_id", "text", "_score"]
+    assert df["text"].tolist() == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_ivf_index_finds_nearest_vectors(tmp_path):
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(20, 32))
+    vectors = centers[rng.integers(0, 20, 4000)] + rng.normal(0, 0.1, (4000, 32))
+    docs = [{"app_name": "app", "agent_name": f"agent_{i % 2}"} for i in range(4000)]
+
+    db = LocalVectorDB(
+        {"persist_dir": str(tmp_path), "index_type": "ivf", "ivf_min_size": 1000}
+    )
+    ids = await db.insert("big", docs, vectors)
+    space = db._get_space("big")
+    assert space.ivf is not None
+
+    for i in range(0, 4000, 400):
+        hits = await db.search("big", vectors[i], 3, {"app_name": "app"})
+        assert hits[0]["_id"] == ids[i]
+        hits = await db.search("big", vectors[i], 3, docs[i])
+        assert hits[0]["_id"] == ids[i]
+
+    reloaded = LocalVectorDB(
+        {"persist_dir": str(tmp_path), "index_type": "ivf", "ivf_min_size": 1000}
+    )
+    assert (reloaded._get_space("big").ivf.rows == space.ivf.rows).all()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_tools_are_not_rewritten(db, monkeypatch):
+    await db.create_vearch_table_by_tool_list(TOOLS)
+    docs_file = os.path.join(db._space_dir(db.tool_space_name), "docs.json")
+    mtime = os.stat(docs_file).st_mtime_ns
+
+    embedded = []
+
+    async def recording_embed(texts):
+        embedded.extend(texts)
+        return await fake_embed(texts)
+
+    monkeypatch.setattr(ec, "get_embedding", recording_embed)
+    await db.create_vearch_table_by_tool_list(list(reversed(TOOLS)))
+    assert os.stat(docs_file).st_mtime_ns == mtime
+
+    changed = TOOLS[:2] + [("app", "agent_b", "search", "search the news")]
+    await db.create_vearch_table_by_tool_list(changed)
+    assert embedded == ["search the news"]
+    space = db._get_space(db.tool_space_name)
+    assert sorted(doc["tool_desc"] for doc in space.docs) == sorted(
+        tool[3] for tool in changed
+    )
@@ -0,0 +1,141 @@
+"""
+Unit tests for the queue-based logging pipeline
+"""
+
+import json
+import logging
+import queue
+import sys
+
+import pytest
+
+from oxygent.config import Config
+from oxygent.log_setup import (
+    IDAwareFormatter,
+    JsonFormatter,
+    LogQueueHandler,
+    get_log_stats,
+    is_trace_sampled,
+    setup_logging,
+    shutdown_logging,
+    truncate_text,
+)
+
+
+def _record(msg="value %s", args=("x",), **extra):
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.fixture
+def fresh_root(tmp_path):
+    """Run setup_logging on an empty root logger, restore it afterwards.
+
+    The handlers pytest attaches for the test call are removed first.
+    """
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    saved_config = dict(Config.get_log_config())
+    Config.set_log_path(str(tmp_path / "app.log"))
+    # Not set_log_level_terminal, it would also change the handlers of pytest
+    Config.set_module_config("log", "level_terminal", "CRITICAL")
+    yield tmp_path
+    shutdown_logging()
+    for handler in root.handlers:
+        handler.close()
+        for inner in getattr(getattr(handler, "listener", None), "handlers", ()):
+            inner.close()
+    root.handlers, root.level = saved_handlers, saved_level
+    Config.set_log_config(saved_config)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tests
+# ──────────────────────────────────────────────────────────────────────────────
+def test_queue_handler_drops_when_full():
+    handler = LogQueueHandler(queue.Queue(1))
+    handler.handle(_record())
+    handler.handle(_record())
+    handler.handle(_record())
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == {"INFO": 2}
+
+
+def test_queue_handler_prepares_in_caller_thread():
+    handler = LogQueueHandler(queue.Queue())
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = _record()
+        record.exc_info = sys.exc_info()
+    prepared = handler.prepare(record)
+    assert prepared.msg == "value x" and prepared.args is None
+    assert prepared.exc_info is None and "ValueError: boom" in prepared.exc_text
+    # The original record is left alone for other handlers
+    assert record.args == ("x",)
+
+
+def test_id_aware_formatter_does_not_mutate_record():
+    formatter = IDAwareFormatter("%(levelname)s%(trace_id)s%(node_id)s %(message)s")
+    record = _record(trace_id="t1", node_id="n1")
+    assert formatter.format(record) == "INFO - t1 - n1 - value x"
+    assert formatter.format(record) == "INFO - t1 - n1 - value x"
+    assert record.trace_id == "t1"
+    assert formatter.format(_record()) == "INFO value x"
+
+
+def test_truncate_text():
+    assert truncate_text("abcdef", 4) == "abcd... (2 more chars)"
+    assert truncate_text("abcdef", 6) == "abcdef"
+    assert truncate_text("abcdef", 0) == "abcdef"
+    assert truncate_text({"a": 1}, 3) == "{'a... (5 more chars)"
+
+
+def test_is_trace_sampled():
+    trace_ids = [f"trace-{i}" for i in range(2000)]
+    assert all(is_trace_sampled(trace_id, 1.0) for trace_id in trace_ids)
+    assert not any(is_trace_sampled(trace_id, 0.0) for trace_id in trace_ids)
+    sampled = [trace_id for trace_id in trace_ids if is_trace_sampled(trace_id, 0.1)]
+    assert 100 < len(sampled) < 300
+    # Stable per trace, and a trace kept at a rate is kept at any higher rate
+    assert all(is_trace_sampled(trace_id, 0.1) for trace_id in sampled)
+    assert all(is_trace_sampled(trace_id, 0.5) for trace_id in sampled)
+
+
+def test_json_formatter():
+    entry = json.loads(JsonFormatter().format(_record(trace_id="t1")))
+    assert entry["message"] == "value x"
+    assert entry["trace_id"] == "t1" and entry["node_id"] == ""
+    assert entry["level"] == "INFO"
+
+
+def test_setup_logging_writes_through_queue(fresh_root):
+    Config.set_log_file_format("json")
+    logging.getLogger().handlers = []
+    logger = setup_logging()
+    assert setup_logging() is logger  # idempotent
+    logging.getLogger("oxygent.test").info(
+        "hello %s", "world", extra={"trace_id": "t1"}
+    )
+    stats = get_log_stats()
+    assert stats["queue_size"] == Config.get_log_queue_size()
+    shutdown_logging()
+
+    lines = (fresh_root / "app.log").read_text(encoding="utf-8").splitlines()
+    entry = json.loads(lines[-1])
+    assert entry["message"] == "hello world"
+    assert entry["trace_id"] == "t1"
+
+
+def test_setup_logging_rotates_by_size(fresh_root):
+    Config.set_log_max_bytes(200)
+    Config.set_log_backup_count(2)
+    Config.set_log_is_async(False)
+    logging.getLogger().handlers = []
+    setup_logging()
+    for i in range(20):
+        logging.getLogger("oxygent.test").info("line %d", i)
+    assert get_log_stats() == {}
+    assert (fresh_root / "app.log.1").exists()
+    assert not (fresh_root / "app.log.3").exists()
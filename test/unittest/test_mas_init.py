@@ -0,0 +1,121 @@
+"""
+Unit tests for the dependency-aware initialization of the MAS
+"""
+
+import asyncio
+
+import pytest
+
+from benchmarks.fake_llm import FakeLLM
+from oxygent import MAS, Config
+from oxygent.oxy import ChatAgent
+from oxygent.oxy.base_tool import BaseTool
+from oxygent.schemas import OxyRequest, OxyResponse, OxyState
+
+FINISHED = []
+
+
+class SlowTool(BaseTool):
+    delay: float = 0.0
+
+    async def init(self):
+        await super().init()
+        await asyncio.sleep(self.delay)
+        FINISHED.append(self.name)
+
+    async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
+        return OxyResponse(state=OxyState.COMPLETED, output="")
+
+
+class RecordingAgent(ChatAgent):
+    async def init(self):
+        await super().init()
+        FINISHED.append(self.name)
+
+
+@pytest.fixture
+def finished():
+    FINISHED.clear()
+    return FINISHED
+
+
+def _mas(*oxys):
+    mas = MAS()
+    mas.add_oxy_list(list(oxys))
+    return mas
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tests
+# ──────────────────────────────────────────────────────────────────────────────
+def test_init_graph():
+    mas = _mas(
+        FakeLLM(name="llm"),
+        SlowTool(name="tool_a"),
+        SlowTool(name="tool_b"),
+        ChatAgent(name="agent_a", llm_model="llm", tools=["tool_a"]),
+        ChatAgent(name="agent_b", llm_model="llm", tools=["not_created_yet"]),
+    )
+    graph = mas.get_init_graph()
+    assert graph["tool_a"] == set()
+    assert graph["agent_a"] == {"llm", "tool_a"}
+    # Tools created while initializing e.g. a FunctionHub: wait for all tools
+    assert graph["agent_b"] == {"llm", "tool_a", "tool_b"}
+
+
+@pytest.mark.asyncio
+async def test_slow_tool_only_delays_its_agents(finished):
+    mas = _mas(
+        FakeLLM(name="llm"),
+        SlowTool(name="slow", delay=0.2),
+        SlowTool(name="fast"),
+        RecordingAgent(name="fast_agent", llm_model="llm", tools=["fast"]),
+        RecordingAgent(name="slow_agent", llm_model="llm", tools=["slow"]),
+    )
+    await mas.init_all_oxy()
+    assert finished.index("fast_agent") < finished.index("slow")
+    assert finished.index("slow") < finished.index("slow_agent")
+    components = mas.startup_timings["components"]
+    assert components["slow"]["seconds"] >= 0.2
+    assert components["slow"]["category"] == "tool"
+
+
+@pytest.mark.asyncio
+async def test_sequential_init_follows_dependencies(finished):
+    Config.set_tool_is_concurrent_init(False)
+    try:
+        mas = _mas(
+            RecordingAgent(name="agent", llm_model="llm", tools=["tool"]),
+            SlowTool(name="tool", delay=0.01),
+            FakeLLM(name="llm"),
+        )
+        await mas.init_all_oxy()
+    finally:
+        Config.set_tool_is_concurrent_init(True)
+    assert finished == ["tool", "agent"]
+
+
+@pytest.mark.asyncio
+async def test_init_timeout_names_the_component(finished):
+    mas = _mas(
+        FakeLLM(name="llm"),
+        SlowTool(name="hanging", delay=5, init_timeout=0.05),
+        RecordingAgent(name="agent", llm_model="llm", tools=["hanging"]),
+    )
+    with pytest.raises(TimeoutError, match=r"\[hanging\]"):
+        await mas.init_all_oxy()
+    assert finished == []
+
+
+def test_init_graph_rejects_cycles():
+    class CyclicTool(SlowTool):
+        depends_on: str = ""
+
+        def get_init_dependencies(self) -> list:
+            return [self.depends_on]
+
+    mas = _mas(
+        CyclicTool(name="a", depends_on="b"), CyclicTool(name="b", depends_on="a")
+    )
+    with pytest.raises(ValueError, match="Circular"):
+        mas.get_init_graph()
@@ -0,0 +1,155 @@
+"""
+Unit tests for MCPSessionPool
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from oxygent.oxy.mcp_tools.session_pool import MCPSessionPool
+
+
+class FakeSession:
+    def __init__(self, headers):
+        self.headers = headers
+        self.is_closed = False
+        self.is_ping_failing = False
+
+    async def send_ping(self):
+        if self.is_ping_failing:
+            raise ConnectionError("gone")
+
+
+class FakeFactory:
+    def __init__(self):
+        self.sessions = []
+
+    @asynccontextmanager
+    async def __call__(self, headers):
+        session = FakeSession(headers)
+        self.sessions.append(session)
+        try:
+            yield session
+        finally:
+            session.is_closed = True
+
+
+@pytest.fixture
+def factory():
+    return FakeFactory()
+
+
+@pytest.mark.asyncio
+async def test_reuses_sessions_per_headers(factory):
+    pool = MCPSessionPool(factory, max_size=4)
+    for _ in range(3):
+        async with pool.session({"token": "a"}) as session:
+            assert session.headers == {"token": "a"}
+    async with pool.session({"token": "b"}) as session:
+        assert session.headers == {"token": "b"}
+
+    assert len(factory.sessions) == 2
+    assert pool.stats()["reused"] == 2
+    await pool.close()
+    assert all(session.is_closed for session in factory.sessions)
+    assert pool.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_waits_for_a_free_session_at_max_size(factory):
+    pool = MCPSessionPool(factory, max_size=1)
+    release = asyncio.Event()
+    borrowed = []
+
+    async def borrow():
+        async with pool.session({}) as session:
+            borrowed.append(session)
+            await release.wait()
+
+    tasks = [asyncio.create_task(borrow()) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    assert len(borrowed) == 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert borrowed == [factory.sessions[0]] * 2
+    assert len(factory.sessions) == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_evicts_idle_session_of_another_key_when_full(factory):
+    pool = MCPSessionPool(factory, max_size=1)
+    async with pool.session({"token": "a"}):
+        pass
+    async with pool.session({"token": "b"}):
+        pass
+    await pool.close()
+
+    assert [s.headers for s in factory.sessions] == [{"token": "a"}, {"token": "b"}]
+    assert factory.sessions[0].is_closed
+    assert pool.stats()["opened"] == 2
+
+
+@pytest.mark.asyncio
+async def test_closes_expired_idle_sessions(factory):
+    pool = MCPSessionPool(factory, idle_timeout=0.01)
+    async with pool.session({}):
+        pass
+    await asyncio.sleep(0.02)
+    async with pool.session({}) as session:
+        assert session is factory.sessions[1]
+    await pool.close()
+
+    assert factory.sessions[0].is_closed
+    assert pool.stats()["closed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_replaces_session_failing_health_check(factory):
+    pool = MCPSessionPool(factory, health_check_interval=0)
+    async with pool.session({}):
+        pass
+    factory.sessions[0].is_ping_failing = True
+    async with pool.session({}) as session:
+        assert session is factory.sessions[1]
+    async with pool.session({}) as session:
+        assert session is factory.sessions[1]
+    await pool.close()
+
+    assert factory.sessions[0].is_closed
+    assert pool.stats()["reused"] == 1
+
+
+@pytest.mark.asyncio
+async def test_discards_session_after_error(factory):
+    pool = MCPSessionPool(factory)
+    with pytest.raises(RuntimeError):
+        async with pool.session({}):
+            raise RuntimeError("boom")
+    async with pool.session({}) as session:
+        assert session is factory.sessions[1]
+    await pool.close()
+
+    assert factory.sessions[0].is_closed
+    assert pool.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_open_frees_the_slot():
+    attempts = []
+
+    @asynccontextmanager
+    async def failing_factory(headers):
+        attempts.append(headers)
+        raise ConnectionError("refused")
+        yield
+
+    pool = MCPSessionPool(failing_factory, max_size=1)
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            async with pool.session({}):
+                pass
+    assert len(attempts) == 2
+    assert pool.stats()["size"] == 0
@@ -0,0 +1,163 @@
+"""
+Unit tests for MCPConnectionSupervisor
+"""
+
+import asyncio
+import types
+from contextlib import asynccontextmanager
+
+import anyio
+import pytest
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, ErrorData
+
+from oxygent.oxy.mcp_tools.base_mcp_client import BaseMCPClient
+from oxygent.oxy.mcp_tools.supervisor import MCPConnectionSupervisor
+from oxygent.schemas import OxyRequest
+
+
+class FakeSession:
+    def __init__(self, number):
+        self.number = number
+        self.is_closed = False
+        self.is_ping_failing = False
+        self.call_errors = []
+
+    async def send_ping(self):
+        if self.is_ping_failing:
+            raise anyio.ClosedResourceError()
+
+    async def call_tool(self, name, arguments=None):
+        if self.call_errors:
+            raise self.call_errors.pop(0)
+        content = types.SimpleNamespace(text=f"{name}@{self.number}")
+        return types.SimpleNamespace(content=[content])
+
+
+class FakeServer:
+    def __init__(self):
+        self.sessions = []
+        self.failures = 0
+
+    @asynccontextmanager
+    async def connect(self):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("server restarting")
+        session = FakeSession(len(self.sessions))
+        self.sessions.append(session)
+        try:
+            yield session
+        finally:
+            session.is_closed = True
+
+
+class SupervisedMCPClient(BaseMCPClient):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._server = FakeServer()
+
+    def _session_context(self, headers: dict):
+        return self._server.connect()
+
+
+def make_supervisor(server, **kwargs):
+    current = []
+    supervisor = MCPConnectionSupervisor(
+        server.connect,
+        lambda session: current.insert(0, session),
+        name="fake",
+        reconnect_initial_delay=0.001,
+        **kwargs,
+    )
+    return supervisor, current
+
+
+@pytest.mark.asyncio
+async def test_single_reconnect_in_flight():
+    server = FakeServer()
+    supervisor, current = make_supervisor(server, ping_interval=0)
+    await supervisor.start()
+
+    first, second = supervisor.reconnect(), supervisor.reconnect()
+    assert first is second
+    assert current[0] is None
+    await first
+
+    assert len(server.sessions) == 2
+    assert server.sessions[0].is_closed
+    assert current[0] is server.sessions[1]
+    await supervisor.close()
+    assert server.sessions[1].is_closed
+
+
+@pytest.mark.asyncio
+async def test_reconnect_backs_off_until_server_is_back():
+    server = FakeServer()
+    supervisor, current = make_supervisor(server, ping_interval=0)
+    await supervisor.start()
+    server.failures = 3
+
+    await supervisor.reconnect()
+    assert current[0] is server.sessions[1]
+    assert supervisor.reconnects == 1
+    await supervisor.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_ping_triggers_reconnect():
+    server = FakeServer()
+    supervisor, current = make_supervisor(server, ping_interval=0.01)
+    await supervisor.start()
+    server.sessions[0].is_ping_failing = True
+
+    while supervisor.reconnects == 0:
+        await asyncio.sleep(0.01)
+    assert current[0] is server.sessions[1]
+    await supervisor.close()
+
+
+@pytest.mark.asyncio
+async def test_wait_connected_gives_up_after_grace_period():
+    server = FakeServer()
+    supervisor, _ = make_supervisor(server, ping_interval=0, grace_period=0.01)
+    await supervisor.start()
+    server.failures = 10**6
+
+    supervisor.reconnect()
+    assert not await supervisor.wait_connected()
+    await supervisor.close()
+
+
+@pytest.mark.asyncio
+async def test_execute_retries_unsent_call_after_reconnect():
+    client = SupervisedMCPClient(name="fake_server", ping_interval=0)
+    await client.init(is_fetch_tools=False)
+    client._server.sessions[0].call_errors.append(anyio.ClosedResourceError())
+
+    oxy_request = OxyRequest(arguments={})
+    oxy_request.callee = "echo"
+    response = await client._execute(oxy_request)
+
+    assert response.output == "echo@1"
+    assert client._supervisor.reconnects == 1
+    await client.cleanup()
+    assert client._server.sessions[1].is_closed
+
+
+@pytest.mark.asyncio
+async def test_execute_does_not_repeat_call_lost_in_flight():
+    client = SupervisedMCPClient(name="fake_server", ping_interval=0)
+    await client.init(is_fetch_tools=False)
+    client._server.sessions[0].call_errors.append(
+        McpError(ErrorData(code=CONNECTION_CLOSED, message="Connection closed"))
+    )
+
+    oxy_request = OxyRequest(arguments={})
+    oxy_request.callee = "echo"
+    with pytest.raises(McpError):
+        await client._execute(oxy_request)
+    response = await client._execute(oxy_request)
+
+    assert response.output == "echo@1"
+    await client.cleanup()
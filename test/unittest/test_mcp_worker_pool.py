@@ -0,0 +1,148 @@
+"""
+Unit tests for MCPWorkerPool
+"""
+
+import asyncio
+import itertools
+from contextlib import asynccontextmanager
+
+import anyio
+import pytest
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, ErrorData
+
+from oxygent.oxy.mcp_tools.worker_pool import MCPWorkerPool
+
+
+class FakeWorkerSession:
+    def __init__(self, pid):
+        self.pid = pid
+        self.is_closed = False
+        self.release = None
+        self.fail_with = None
+
+    async def call_tool(self, name, arguments=None):
+        if self.fail_with:
+            raise self.fail_with
+        if self.release:
+            await self.release.wait()
+        return self.pid
+
+
+class FakeServer:
+    """Session factory starting one fake server process per call."""
+
+    def __init__(self):
+        self.sessions = []
+        self.pids = itertools.count()
+        self.is_failing = False
+
+    @asynccontextmanager
+    async def __call__(self):
+        if self.is_failing:
+            raise FileNotFoundError("server.py does not exist")
+        session = FakeWorkerSession(next(self.pids))
+        self.sessions.append(session)
+        try:
+            yield session
+        finally:
+            session.is_closed = True
+
+
+async def wait_for_workers(pool, count):
+    while len(pool.workers) != count or pool.stats()["starting"]:
+        await asyncio.sleep(0.001)
+
+
+@pytest.fixture
+def server():
+    return FakeServer()
+
+
+@pytest.mark.asyncio
+async def test_dispatches_to_least_busy_worker(server):
+    pool = MCPWorkerPool(server, min_workers=3)
+    await pool.start()
+    release = asyncio.Event()
+    for session in server.sessions:
+        session.release = release
+
+    calls = [asyncio.create_task(pool.call_tool("burn")) for _ in range(6)]
+    await asyncio.sleep(0.01)
+    assert pool.stats()["in_flight"] == [2, 2, 2]
+
+    release.set()
+    assert sorted(await asyncio.gather(*calls)) == [0, 0, 1, 1, 2, 2]
+    await pool.close()
+    assert all(session.is_closed for session in server.sessions)
+
+
+@pytest.mark.asyncio
+async def test_scales_up_by_load_and_down_when_idle(server):
+    pool = MCPWorkerPool(
+        server, min_workers=1, max_workers=3, scale_up_load=1, idle_timeout=0.01
+    )
+    await pool.start()
+    release = asyncio.Event()
+    server.sessions[0].release = release
+
+    calls = [asyncio.create_task(pool.call_tool("burn")) for _ in range(3)]
+    await wait_for_workers(pool, 3)
+    release.set()
+    await asyncio.gather(*calls)
+    assert pool.stats()["started"] == 3
+
+    await asyncio.sleep(0.02)
+    await pool.call_tool("burn")
+    assert len(pool.workers) == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_replaces_lost_worker(server):
+    pool = MCPWorkerPool(server, min_workers=2)
+    await pool.start()
+    server.sessions[0].fail_with = McpError(
+        ErrorData(code=CONNECTION_CLOSED, message="Connection closed")
+    )
+
+    with pytest.raises(McpError):
+        await pool.call_tool("crash")
+    await wait_for_workers(pool, 2)
+    assert server.sessions[0].is_closed
+    assert pool.stats()["restarts"] == 1
+    assert {worker.session.pid for worker in pool.workers} == {1, 2}
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_retries_unsent_call_on_another_worker(server):
+    pool = MCPWorkerPool(server, min_workers=2)
+    await pool.start()
+    server.sessions[0].fail_with = anyio.ClosedResourceError()
+
+    assert await pool.call_tool("burn") == 1
+    assert pool.stats()["restarts"] == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_tool_errors_keep_the_worker(server):
+    pool = MCPWorkerPool(server, min_workers=1)
+    await pool.start()
+    server.sessions[0].fail_with = ValueError("bad arguments")
+
+    with pytest.raises(ValueError):
+        await pool.call_tool("burn")
+    assert pool.workers[0].session is server.sessions[0]
+    assert pool.stats()["restarts"] == 0
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_start_raises_when_no_worker_comes_up(server):
+    server.is_failing = True
+    pool = MCPWorkerPool(server, min_workers=2)
+    with pytest.raises(FileNotFoundError):
+        await pool.start()
+    await pool.close()
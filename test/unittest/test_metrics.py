@@ -0,0 +1,110 @@
+"""
+Unit tests for the Prometheus-style MetricsRegistry
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from oxygent.metrics import Histogram, MetricsRegistry
+from oxygent.oxy.base_oxy import Oxy
+from oxygent.scheduler import FairScheduler
+from oxygent.schemas import OxyRequest, OxyResponse, OxyState
+
+
+class DummyOxy(Oxy):
+    async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
+        return OxyResponse(state=OxyState.COMPLETED, output="ok")
+
+
+class DummyClient:
+    async def search(self, index_name, body):
+        return {"hits": {"hits": []}}
+
+    async def update(self, index_name, doc_id, body):
+        raise ConnectionError("es down")
+
+    async def close(self):
+        pass
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tests
+# ──────────────────────────────────────────────────────────────────────────────
+def test_histogram_buckets():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 5.0):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.count == 4
+
+
+def test_render_oxy_calls_and_tokens():
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    oxy = DummyOxy(name="llm", category="llm")
+    response = OxyResponse(
+        state=OxyState.COMPLETED,
+        output="ok",
+        extra={"usage": {"prompt_tokens": 10, "completion_tokens": 3}},
+    )
+    registry.observe_oxy(oxy, response, 0.5)
+    registry.observe_oxy(oxy, OxyResponse(state=OxyState.FAILED, output=""), 2.0)
+    # An agent passing the LLM response through does not count the tokens again
+    registry.observe_oxy(DummyOxy(name="agent", category="agent"), response, 0.6)
+
+    text = registry.render()
+    assert "# TYPE oxygent_oxy_calls_total counter" in text
+    assert 'oxygent_oxy_calls_total{oxy="llm",category="llm",state="FAILED"} 1' in text
+    assert (
+        'oxygent_oxy_latency_seconds_bucket{oxy="llm",category="llm",le="1.0"} 1'
+        in text
+    )
+    assert (
+        'oxygent_oxy_latency_seconds_bucket{oxy="llm",category="llm",le="+Inf"} 2'
+        in text
+    )
+    assert 'oxygent_llm_tokens_total{oxy="llm",kind="prompt"} 10' in text
+    assert 'oxy="agent",kind="prompt"' not in text
+    assert "oxygent_sse_connections 0" in text
+
+
+@pytest.mark.asyncio
+async def test_render_scheduler_waits():
+    scheduler = FairScheduler()
+    semaphore = scheduler.get_semaphore("llm", 1)
+    await semaphore.acquire("acme")
+    semaphore.release()
+    mas = SimpleNamespace(
+        background_tasks=set(),
+        active_tasks={},
+        oxy_name_to_oxy={},
+        scheduler=scheduler,
+        admission=None,
+    )
+    text = MetricsRegistry().render(mas)
+    assert "# TYPE oxygent_scheduler_wait_seconds_avg gauge" in text
+    assert 'oxygent_scheduler_wait_seconds_max{oxy="llm",tenant="acme"} 0' in text
+
+
+@pytest.mark.asyncio
+async def test_instrument_client_times_calls():
+    registry = MetricsRegistry()
+    client = registry.instrument_client(DummyClient(), "es")
+    registry.instrument_client(client, "es")  # idempotent
+
+    assert await client.search("index", {}) == {"hits": {"hits": []}}
+    with pytest.raises(ConnectionError):
+        await client.update("index", "id", {})
+
+    assert registry.db_calls == {
+        ("es", "search", "ok"): 1,
+        ("es", "update", "error"): 1,
+    }
+    assert ("es", "close") not in registry.db_latency
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    oxy = DummyOxy(name='bad"name', category="tool")
+    registry.observe_oxy(oxy, OxyResponse(state=OxyState.COMPLETED, output=""), 0.1)
+    assert 'oxy="bad\\"name"' in registry.render()
@@ -0,0 +1,70 @@
+"""
+Unit tests for the OpenAI / Ollama / Gemini compatible mock LLM server
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from benchmarks.mock_llm_server import MockLLMConfig, create_app, parse_tool_calls
+
+MESSAGES = [{"role": "user", "content": "What time is it?"}]
+
+
+@pytest.fixture
+def client():
+    config = MockLLMConfig(tool_calls=[("time_tool", {})], answer="It is noon.")
+    return TestClient(create_app(config))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tests
+# ──────────────────────────────────────────────────────────────────────────────
+def test_openai_follows_react_script(client):
+    response = client.post("/chat/completions", json={"messages": MESSAGES})
+    content = response.json()["choices"][0]["message"]["content"]
+    assert json.loads(content)["tool_name"] == "time_tool"
+
+    messages = MESSAGES + [{"role": "assistant", "content": content}]
+    response = client.post("/v1/chat/completions", json={"messages": messages})
+    data = response.json()
+    assert data["choices"][0]["message"]["content"] == "It is noon."
+    assert data["usage"]["completion_tokens"] == 3
+
+
+def test_openai_stream(client):
+    messages = MESSAGES + [{"role": "assistant", "content": '{"tool_name": "x"}'}]
+    response = client.post(
+        "/chat/completions", json={"messages": messages, "stream": True}
+    )
+    lines = [line[6:] for line in response.text.splitlines() if line]
+    assert lines[-1] == "[DONE]"
+    deltas = [json.loads(line)["choices"][0]["delta"]["content"] for line in lines[:-1]]
+    assert "".join(deltas) == "It is noon."
+
+
+def test_ollama_and_gemini(client):
+    messages = MESSAGES + [{"role": "assistant", "content": '{"tool_name": "x"}'}]
+    ollama = client.post("/api/chat", json={"messages": messages}).json()
+    assert ollama["message"]["content"] == "It is noon."
+    assert ollama["eval_count"] == 3
+
+    gemini = client.post(
+        "/models/mock:generateContent",
+        json={"contents": [{"role": "user", "parts": [{"text": "hi"}]}]},
+    ).json()
+    text = gemini["candidates"][0]["content"]["parts"][0]["text"]
+    assert json.loads(text)["tool_name"] == "time_tool"
+
+
+def test_rate_limit_injection():
+    client = TestClient(create_app(MockLLMConfig(rate_limit_rate=1.0, retry_after=7)))
+    response = client.post("/chat/completions", json={"messages": MESSAGES})
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "7"
+    assert client.get("/stats").json()["rate_limited"] == 1
+
+
+def test_parse_tool_calls():
+    assert parse_tool_calls('a; b:{"x": 1}') == [("a", {}), ("b", {"x": 1})]
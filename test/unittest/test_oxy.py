@@ -10,9 +10,11 @@ Because Oxy is abstract, we define a DummyOxy subclass for testing.
 """
 
 import asyncio
+import logging
 
 import pytest
 
+from oxygent.config import Config
 from oxygent.oxy.base_oxy import Oxy
 from oxygent.schemas import OxyRequest, OxyResponse, OxyState
 
@@ -67,3 +69,69 @@ class TestBaseOxy:
         assert response.state == OxyState.COMPLETED
         assert response.output == "dummy_output"
         assert response.oxy_request == oxy_request
+
+    @pytest.mark.asyncio
+    async def test_execute_does_not_rebind_passed_through_response(self):
+        """A sub-call response returned as is keeps its own request."""
+        sub_request = OxyRequest(arguments={}, node_id="sub_node")
+        sub_response = OxyResponse(
+            state=OxyState.COMPLETED,
+            output="sub_output",
+            extra={"usage": {"prompt_tokens": 1}},
+            oxy_request=sub_request,
+        )
+
+        class PassThroughOxy(Oxy):
+            async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
+                return sub_response
+
+        oxy = PassThroughOxy(name="pass_through", category="agent")
+        oxy_request = OxyRequest(arguments={}, node_id="node")
+        response = await oxy.execute(oxy_request)
+        assert response.output == "sub_output"
+        assert response.oxy_request.node_id == "node"
+        assert sub_response.oxy_request is sub_request
+        assert "timings" not in sub_response.extra
+
+    @pytest.fixture
+    def log_config(self):
+        saved_config = dict(Config.get_log_config())
+        yield
+        Config.set_log_config(saved_config)
+
+    @pytest.mark.asyncio
+    async def test_lifecycle_log_truncates_observation(
+        self, dummy_oxy, caplog, log_config
+    ):
+        """Queries and observations are cut to max_observation_length."""
+        caplog.set_level(logging.INFO, logger="oxygent.oxy.base_oxy")
+        Config.set_log_max_observation_length(5)
+        await dummy_oxy.execute(
+            OxyRequest(arguments={"query": "a long query"}, caller="test")
+        )
+        assert "a lon... (7 more chars)" in caplog.text
+        assert "dummy... (7 more chars)" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_lifecycle_log_keeps_failures_of_unsampled_traces(
+        self, caplog, log_config
+    ):
+        """With sample_rate 0 only failed calls are logged."""
+
+        class FailingOxy(Oxy):
+            async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
+                raise ValueError("broken")
+
+        caplog.set_level(logging.INFO, logger="oxygent.oxy.base_oxy")
+        Config.set_log_sample_rate(0.0)
+        await DummyOxy(name="dummy", category="tool").execute(
+            OxyRequest(arguments={"query": "q"}, caller="test")
+        )
+        assert not any(r.levelno == logging.INFO for r in caplog.records)
+        await FailingOxy(name="failing", category="tool", retries=1).execute(
+            OxyRequest(arguments={"query": "q"}, caller="test")
+        )
+        messages = [r.getMessage() for r in caplog.records if r.levelno == logging.INFO]
+        assert len(messages) == 1
+        assert messages[0].startswith("user <<< failing  : ")
+        assert "broken" in messages[0]
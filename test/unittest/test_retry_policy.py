@@ -0,0 +1,131 @@
+"""
+Unit tests for RetryPolicy (backoff, classification, budget, circuit breaker)
+"""
+
+import json
+
+import httpx
+import pytest
+
+from oxygent.oxy.base_oxy import Oxy
+from oxygent.retry_policy import CircuitState, RetryPolicy
+from oxygent.schemas import OxyRequest, OxyResponse, OxyState
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Dummy Oxy
+# ──────────────────────────────────────────────────────────────────────────────
+class FlakyOxy(Oxy):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._calls = 0
+        self._error = ConnectionError("downstream unavailable")
+
+    async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
+        self._calls += 1
+        raise self._error
+
+
+def _status_error(status_code):
+    request = httpx.Request("POST", "http://llm/chat/completions")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tests
+# ──────────────────────────────────────────────────────────────────────────────
+def test_backoff_grows_exponentially_and_is_capped():
+    policy = RetryPolicy(base_delay=1.0, multiplier=2.0, max_delay=5.0, jitter="none")
+    assert [policy.get_delay(i) for i in range(1, 5)] == [1.0, 2.0, 4.0, 5.0]
+
+
+def test_full_jitter_stays_in_range():
+    policy = RetryPolicy(multiplier=2.0, max_delay=10.0)
+    delays = [policy.get_delay(3, default_base_delay=1.0) for _ in range(200)]
+    assert all(0 <= d <= 4.0 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_classification():
+    policy = RetryPolicy()
+    assert policy.is_retryable(ConnectionError())
+    assert policy.is_retryable(_status_error(503))
+    assert policy.is_retryable(_status_error(429))
+    assert not policy.is_retryable(_status_error(400))
+    assert not policy.is_retryable(NotImplementedError())
+
+    custom = RetryPolicy(func_is_retryable=lambda e: isinstance(e, KeyError))
+    assert custom.is_retryable(KeyError())
+    assert not custom.is_retryable(ConnectionError())
+
+
+def test_budget_limits_retries():
+    policy = RetryPolicy(budget_ratio=0.5, budget_min_retries_per_second=0.0)
+    for _ in range(4):
+        policy.allow_request()
+    granted = [policy.should_retry(ConnectionError(), 1, 3) for _ in range(4)]
+    assert granted == [True, True, False, False]
+    assert policy.get_stats()["budget_exhausted"] == 2
+
+
+def test_circuit_breaker_transitions():
+    policy = RetryPolicy(breaker_failure_threshold=2, breaker_recovery_timeout=0.0)
+    policy.record_failure()
+    assert policy.circuit_state is CircuitState.CLOSED
+    policy.record_failure()
+    assert policy.circuit_state is CircuitState.OPEN
+
+    # recovery_timeout elapsed: a single trial call is let through
+    assert policy.allow_request()
+    assert policy.circuit_state is CircuitState.HALF_OPEN
+    policy.record_success()
+    assert policy.circuit_state is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_execute_stops_on_non_retryable():
+    oxy = FlakyOxy(name="flaky", retries=5, delay=0)
+    oxy._error = NotImplementedError("not supported")
+    response = await oxy.execute(OxyRequest(arguments={}))
+    assert response.state is OxyState.FAILED
+    assert oxy._calls == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_fails_fast_when_circuit_open():
+    oxy = FlakyOxy(
+        name="flaky",
+        retries=1,
+        retry_policy=RetryPolicy(
+            breaker_failure_threshold=1, breaker_recovery_timeout=60
+        ),
+    )
+    first = await oxy.execute(OxyRequest(arguments={}))
+    second = await oxy.execute(OxyRequest(arguments={}))
+    assert first.state is OxyState.FAILED
+    assert second.state is OxyState.FAILED
+    assert "circuit breaker is open" in second.output
+    assert oxy._calls == 1
+    assert oxy.retry_policy.get_stats()["short_circuited"] == 1
+
+
+def test_oxy_with_policy_dumps_to_json():
+    oxy = FlakyOxy(name="flaky")
+    policy = json.loads(oxy.model_dump_json())["retry_policy"]
+    assert policy["retryable_exceptions"] == ["builtins.Exception"]
+    assert "builtins.NotImplementedError" in policy["non_retryable_exceptions"]
+
+
+@pytest.mark.asyncio
+async def test_retry_execute_does_not_retry_again():
+    class RaisingOxy(FlakyOxy):
+        async def execute(self, oxy_request: OxyRequest) -> OxyResponse:
+            self._calls += 1
+            raise self._error
+
+    oxy = RaisingOxy(name="raising", retries=3, delay=0)
+    response = await OxyRequest(arguments={}).retry_execute(oxy)
+    assert response.state is OxyState.FAILED
+    assert oxy._calls == 1
+    assert oxy.retry_policy.get_stats()["retries"] == 0
@@ -0,0 +1,89 @@
+"""
+Unit tests for the weighted fair scheduler
+"""
+
+import asyncio
+
+import pytest
+
+from oxygent.scheduler import FairScheduler, WeightedFairSemaphore
+
+
+async def _enqueue(semaphore, order, tenant, priority=0, hold=0):
+    await semaphore.acquire(tenant, priority)
+    order.append(tenant if not priority else f"{tenant}:{priority}")
+    await asyncio.sleep(hold)
+    semaphore.release()
+
+
+async def _drain(semaphore, waiters):
+    """Occupy the only slot, queue the waiters, then release it."""
+    await semaphore.acquire("holder")
+    tasks = [asyncio.create_task(w) for w in waiters]
+    await asyncio.sleep(0)
+    semaphore.release()
+    await asyncio.gather(*tasks)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tests
+# ──────────────────────────────────────────────────────────────────────────────
+@pytest.mark.asyncio
+async def test_grants_follow_weights():
+    scheduler = FairScheduler(tenant_weights={"gold": 3, "batch": 1})
+    semaphore = WeightedFairSemaphore(1, scheduler)
+    order = []
+    waiters = [_enqueue(semaphore, order, "batch") for _ in range(8)]
+    waiters += [_enqueue(semaphore, order, "gold") for _ in range(8)]
+    await _drain(semaphore, waiters)
+    # While both are backlogged gold gets three slots for each batch slot
+    assert order[:8].count("gold") == 6
+    assert sorted(order) == ["batch"] * 8 + ["gold"] * 8
+
+
+@pytest.mark.asyncio
+async def test_priority_within_tenant():
+    semaphore = WeightedFairSemaphore(1, FairScheduler())
+    order = []
+    waiters = [_enqueue(semaphore, order, "a", priority=p) for p in (0, 5, 1)]
+    await _drain(semaphore, waiters)
+    assert order == ["a:5", "a:1", "a"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_is_skipped():
+    semaphore = WeightedFairSemaphore(1, FairScheduler())
+    order = []
+    await semaphore.acquire("holder")
+    cancelled = asyncio.create_task(_enqueue(semaphore, order, "x"))
+    waiting = asyncio.create_task(_enqueue(semaphore, order, "y"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    semaphore.release()
+    await waiting
+    assert order == ["y"]
+    assert semaphore.queue_depth == 0
+    assert not semaphore.locked()
+
+
+@pytest.mark.asyncio
+async def test_fast_path_and_stats():
+    scheduler = FairScheduler()
+    semaphore = scheduler.get_semaphore("llm", 2)
+    await semaphore.acquire("t1")
+    await semaphore.acquire("t2")
+    assert semaphore.locked()
+    semaphore.release()
+    semaphore.release()
+    stats = scheduler.get_stats()["llm"]
+    assert stats["t1"]["granted"] == 1
+    assert stats["t1"]["queue_depth"] == 0
+    assert stats["t2"]["max_wait"] == 0.0
+
+
+def test_resolve_tenant():
+    scheduler = FairScheduler()
+    assert scheduler.resolve_tenant({"tenant": "acme"}, {}) == "acme"
+    assert scheduler.resolve_tenant({}, {"x-tenant-id": "beta"}) == "beta"
+    assert scheduler.resolve_tenant({}, {}) == "default"
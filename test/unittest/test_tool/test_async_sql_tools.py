@@ -0,0 +1,88 @@
+import json
+
+import pytest
+import pytest_asyncio
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+
+from oxygent.preset_tools.async_sql_tools import (
+    async_sql_tools,
+    describe_tables,
+    list_tables,
+    run_sql,
+)
+
+
+@pytest_asyncio.fixture
+async def database(tmp_path):
+    async_sql_tools.db_url = f"sqlite+aiosqlite:///{tmp_path / 'tools.db'}"
+    async_sql_tools.max_rows = 1000
+    async_sql_tools.max_output_length = 20000
+    async_sql_tools.chunk_size = 7
+    async with async_sql_tools.get_engine().begin() as conn:
+        await conn.exec_driver_sql("CREATE TABLE items (id INTEGER, name TEXT)")
+        await conn.exec_driver_sql(
+            "INSERT INTO items VALUES "
+            + ",".join(f"({i}, 'item-{i}')" for i in range(50))
+        )
+    yield async_sql_tools
+    await async_sql_tools.dispose()
+
+
+@pytest.mark.asyncio
+async def test_run_sql_returns_rows(database):
+    rows = json.loads(await run_sql("SELECT * FROM items WHERE id < 3"))
+    assert rows == [{"id": i, "name": f"item-{i}"} for i in range(3)]
+
+    rows = json.loads(await run_sql("SELECT * FROM items", limit=10))
+    assert len(rows) == 10
+
+
+@pytest.mark.asyncio
+async def test_run_sql_caps_rows_by_default(database):
+    database.max_rows = 14
+    result = json.loads(await run_sql("SELECT * FROM items"))
+    assert result["truncated"] is True
+    assert len(result["rows"]) == 14
+    assert "first 14 rows" in result["note"]
+
+    result = json.loads(await run_sql("SELECT * FROM items", limit=100))
+    assert result["truncated"] is True
+
+    rows = json.loads(await run_sql("SELECT * FROM items WHERE id < 14"))
+    assert len(rows) == 14
+
+
+@pytest.mark.asyncio
+async def test_run_sql_caps_output_length(database):
+    database.max_output_length = 200
+    output = await run_sql("SELECT * FROM items")
+    result = json.loads(output)
+    assert result["truncated"] is True
+    assert 0 < len(result["rows"]) < 10
+
+
+@pytest.mark.asyncio
+async def test_run_sql_reports_errors(database):
+    result = json.loads(await run_sql("SELECT * FROM missing"))
+    assert "Error running query" in result["error"]
+
+
+@pytest.mark.asyncio
+async def test_schema_is_cached_until_ddl(database):
+    assert json.loads(await list_tables()) == ["items"]
+    columns = json.loads(await describe_tables("items"))
+    assert [column["name"] for column in columns] == ["id", "name"]
+
+    async with database.get_engine().begin() as conn:
+        await conn.exec_driver_sql("CREATE TABLE orders (id INTEGER)")
+    assert json.loads(await list_tables()) == ["items"]
+
+    database.invalidate_schema_cache()
+    assert json.loads(await list_tables()) == ["items", "orders"]
+
+    async with database.get_engine().begin() as conn:
+        await conn.exec_driver_sql("DROP TABLE orders")
+    await run_sql("DROP TABLE IF EXISTS orders")
+    assert json.loads(await list_tables()) == ["items"]
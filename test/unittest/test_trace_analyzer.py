@@ -0,0 +1,144 @@
+"""
+Unit tests for the trace analyzer
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from oxygent.trace_analyzer import TraceAnalyzer, analyze_trace, union_length
+
+BASE = datetime(2025, 10, 1, 12, 0, 0)
+
+
+def _time(ms: float) -> str:
+    return (BASE + timedelta(milliseconds=ms)).strftime("%Y-%m-%d %H:%M:%S.%f") + "000"
+
+
+def _node(node_id, callee, start, end, father="", pre=None, parallel_id=None):
+    return {
+        "node_id": node_id,
+        "trace_id": "trace-1",
+        "callee": callee,
+        "caller": "",
+        "node_type": "agent" if callee.endswith("agent") else "tool",
+        "father_node_id": father,
+        "pre_node_ids": pre or [""],
+        "parallel_id": parallel_id or node_id,
+        "create_time": _time(start),
+        "update_time": _time(end),
+    }
+
+
+@pytest.fixture
+def nodes():
+    """A master agent: llm, then two parallel tools, then llm again.
+
+    master  0 ──────────────────────────────── 100
+    llm_1   5 ── 25
+    tool_a           30 ──── 50
+    tool_b           30 ─────────── 80
+    llm_2                               85 ── 95
+    """
+    return [
+        _node("m", "master_agent", 0, 100),
+        _node("l1", "llm", 5, 25, father="m"),
+        _node("a", "tool_a", 30, 50, father="m", pre=["l1"], parallel_id="p"),
+        _node("b", "tool_b", 30, 80, father="m", pre=["l1"], parallel_id="p"),
+        _node("l2", "llm", 85, 95, father="m", pre=["a", "b"]),
+    ]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tests
+# ──────────────────────────────────────────────────────────────────────────────
+def test_union_length_merges_overlaps():
+    assert union_length([(0, 2), (1, 3), (5, 6)]) == 4
+    assert union_length([]) == 0
+
+
+def test_critical_path_follows_slowest_branch(nodes):
+    analyzer = TraceAnalyzer(nodes)
+    path = analyzer.critical_path()
+    assert [n["node_id"] for n in path] == ["m", "l1", "b", "l2"]
+    critical = {n["node_id"]: n["critical_ms"] for n in path}
+    assert critical == pytest.approx({"m": 20, "l1": 20, "b": 50, "l2": 10}, abs=0.01)
+    assert sum(critical.values()) == pytest.approx(analyzer.duration * 1000)
+
+
+def test_self_and_child_time(nodes):
+    summary = analyze_trace(nodes)
+    assert summary["duration_ms"] == pytest.approx(100)
+    master = summary["critical_path"][0]
+    # The parallel tools count once in the child time
+    assert master["child_ms"] == pytest.approx(20 + 50 + 10, abs=0.01)
+    assert master["self_ms"] == pytest.approx(20, abs=0.01)
+
+    callees = {c["callee"]: c for c in summary["callees"]}
+    assert callees["llm"]["calls"] == 2
+    assert callees["llm"]["total_ms"] == pytest.approx(30, abs=0.01)
+    assert callees["tool_a"]["critical_ms"] == 0
+
+
+def test_parallelism(nodes):
+    parallelism = analyze_trace(nodes)["parallelism"]
+    (group,) = parallelism["groups"]
+    assert group["caller"] == "master_agent"
+    assert group["size"] == 2
+    assert group["span_ms"] == pytest.approx(50, abs=0.01)
+    assert group["speedup"] == pytest.approx(70 / 50, abs=1e-3)
+    assert group["efficiency"] == pytest.approx(0.7, abs=1e-3)
+    # Self time summed over all nodes: 20 + 20 + 20 + 50 + 10
+    assert parallelism["average_parallelism"] == pytest.approx(1.2, abs=1e-3)
+
+
+def test_timings_take_precedence_and_children_are_clamped():
+    nodes = [
+        _node("m", "master_agent", 0, 100),
+        _node("t", "tool", 10, 500, father="m"),
+    ]
+    nodes[0]["extra"] = json.dumps({"timings": {"total": 0.05}})
+    analyzer = TraceAnalyzer(nodes)
+    assert analyzer.duration == pytest.approx(0.05)
+    assert analyzer.nodes["t"]["end"] == analyzer.nodes["m"]["end"]
+
+
+def test_timings_before_create_time_are_not_counted():
+    nodes = [_node("m", "master_agent", 0, 100)]
+    timings = {"semaphore_wait": 2.0, "pre_process": 0.01, "total": 2.06}
+    nodes[0]["extra"] = json.dumps({"timings": timings})
+    analyzer = TraceAnalyzer(nodes)
+    assert analyzer.duration == pytest.approx(0.05)
+
+
+def test_chrome_trace_puts_parallel_calls_in_lanes(nodes):
+    events = analyze_trace(nodes, "chrome")["traceEvents"]
+    lanes = {e["args"]["node_id"]: e["tid"] for e in events if e["ph"] == "X"}
+    assert lanes["l1"] == lanes["m"] == lanes["l2"]
+    assert lanes["a"] != lanes["b"]
+    tool_b = next(e for e in events if e.get("name") == "tool_b")
+    assert tool_b["ts"] == pytest.approx(30000)
+    assert tool_b["dur"] == pytest.approx(50000)
+
+
+def test_speedscope_events_are_nested(nodes):
+    speedscope = analyze_trace(nodes, "speedscope")
+    frames = [frame["name"] for frame in speedscope["shared"]["frames"]]
+    assert set(frames) == {"master_agent", "llm", "tool_a", "tool_b"}
+    for profile in speedscope["profiles"]:
+        stack = []
+        last_at = 0
+        for event in profile["events"]:
+            assert event["at"] >= last_at
+            last_at = event["at"]
+            if event["type"] == "O":
+                stack.append(event["frame"])
+            else:
+                assert stack.pop() == event["frame"]
+        assert not stack
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        analyze_trace([], "svg")
@@ -0,0 +1,116 @@
+"""
+Unit tests for per-phase timings and span export of the Oxy lifecycle
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from oxygent.oxy.base_oxy import Oxy
+from oxygent.schemas import OxyRequest, OxyResponse, OxyState
+from oxygent.tracing import (
+    FileSpanExporter,
+    InMemorySpanExporter,
+    PhaseTimer,
+    Tracer,
+    to_span_id,
+    to_trace_id,
+)
+
+
+class DummyOxy(Oxy):
+    async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
+        return OxyResponse(state=OxyState.COMPLETED, output="ok")
+
+
+@pytest.fixture
+def oxy_response():
+    oxy_request = OxyRequest(
+        arguments={},
+        current_trace_id="trace-1",
+        node_id="node-2",
+        father_node_id="node-1",
+    )
+    return OxyResponse(state=OxyState.COMPLETED, output="ok", oxy_request=oxy_request)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tests
+# ──────────────────────────────────────────────────────────────────────────────
+def test_phase_timer_accumulates_phases():
+    timer = PhaseTimer()
+    timer.mark("pre_process")
+    timer.mark("execute")
+    timer.mark("execute")
+    timings = timer.to_dict()
+    assert list(timings) == ["pre_process", "execute", "total"]
+    assert timings["total"] >= timings["execute"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_execute_records_timings():
+    oxy = DummyOxy(name="dummy", category="tool")
+    response = await oxy.execute(OxyRequest(arguments={}))
+    timings = response.extra["timings"]
+    for phase in (
+        "semaphore_wait",
+        "pre_process",
+        "request_interceptor",
+        "pre_send_message",
+        "execute",
+        "post_process",
+        "post_save_data",
+        "post_send_message",
+        "total",
+    ):
+        assert phase in timings
+
+
+def test_spans_are_parented_by_father_node(oxy_response):
+    exporter = InMemorySpanExporter()
+    tracer = Tracer(exporter, service_name="app")
+    timer = PhaseTimer()
+    timer.mark("execute")
+    tracer.export(DummyOxy(name="dummy"), oxy_response, timer)
+
+    span, phase_span = exporter.get_finished_spans("trace-1")
+    assert span["trace_id"] == to_trace_id("trace-1")
+    assert len(span["trace_id"]) == 32
+    assert span["span_id"] == to_span_id("node-2")
+    assert span["parent_span_id"] == to_span_id("node-1")
+    assert span["status"]["code"] == "STATUS_CODE_OK"
+    assert phase_span["parent_span_id"] == span["span_id"]
+    assert phase_span["name"] == "dummy.execute"
+    assert exporter.get_finished_spans("other-trace") == []
+
+
+def test_file_exporter_writes_json_lines(tmp_path, oxy_response):
+    file_path = tmp_path / "spans.jsonl"
+    tracer = Tracer(FileSpanExporter(str(file_path)), service_name="app")
+    tracer.export(DummyOxy(name="dummy"), oxy_response, PhaseTimer())
+    tracer.shutdown()
+    spans = [json.loads(line) for line in file_path.read_text().splitlines()]
+    assert [span["name"] for span in spans] == ["dummy"]
+
+
+@pytest.mark.asyncio
+async def test_response_loaded_for_restart_is_timed_and_exported():
+    class RestartedOxy(DummyOxy):
+        async def _request_interceptor(self, oxy_request):
+            return OxyResponse(
+                state=OxyState.COMPLETED,
+                output="cached",
+                extra={"timings": {"execute": 9.0, "total": 9.5}},
+                oxy_request=oxy_request,
+            )
+
+    exporter = InMemorySpanExporter()
+    oxy = RestartedOxy(name="dummy", category="tool")
+    oxy.mas = SimpleNamespace(tracer=Tracer(exporter), metrics=None)
+    request = OxyRequest(arguments={}, current_trace_id="trace-1")
+    response = await oxy.execute(request)
+    assert response.output == "cached"
+    assert "execute" not in response.extra["timings"]
+    assert response.extra["timings"]["total"] < 9.0
+    assert exporter.get_finished_spans("trace-1")
@@ -0,0 +1,147 @@
+"""
+Unit tests for the tool synchronization of VearchDB
+"""
+
+import json
+
+import httpx
+import numpy as np
+import pytest
+
+import oxygent.embedding_cache as ec
+from oxygent.databases.db_vector.vearch_db import VearchDB, VectorToolAsync
+
+
+class FakeVearch(VectorToolAsync):
+    """In-memory tool space recording the requests sent to it"""
+
+    def __init__(self, is_bulk_delete_supported=True):
+        self.docs = {}
+        self.requests = []
+        self.is_bulk_delete_supported = is_bulk_delete_supported
+        self.is_down = False
+
+    async def check_info(self, db_name, space_name, master_url):
+        return {"msg": "success"}
+
+    async def search_by_filter(self, db_name, space_name, router_url, data_list):
+        self.requests.append("search")
+        if self.is_down:
+            raise httpx.ConnectError("connection refused")
+        app_name = data_list["query"]["filter"][0]["term"]["app_name"]
+        hits = [
+            {"_id": doc_id, "_source": {}}
+            for doc_id, doc in self.docs.items()
+            if doc["app_name"] == app_name
+        ]
+        return {"hits": {"total": len(hits), "hits": hits}}
+
+    async def insert_batch(self, db_name, space_name, router_url, data_list):
+        self.requests.append("bulk_index")
+        lines = data_list.strip().split("\n")
+        for action, doc in zip(lines[::2], lines[1::2]):
+            self.docs[json.loads(action)["index"]["_id"]] = json.loads(doc)
+
+    async def delete_batch(self, db_name, space_name, router_url, doc_ids):
+        self.requests.append("bulk_delete")
+        if not self.is_bulk_delete_supported:
+            return json.dumps({"code": 1, "msg": "unsupported bulk operation"})
+        for doc_id in doc_ids:
+            self.docs.pop(doc_id, None)
+        return json.dumps(
+            {
+                "code": 0,
+                "msg": "success",
+                "data": {"documents": [{"_id": i, "status": 200} for i in doc_ids]},
+            }
+        )
+
+    async def delete_by_docid(self, db_name, space_name, router_url, doc_id):
+        self.requests.append("delete")
+        self.docs.pop(doc_id, None)
+
+
+TOOLS = [
+    ("app", "agent", "weather", "get the weather"),
+    ("app", "agent", "time", "get the time"),
+    ("app", "agent", "search", "search the web"),
+]
+
+
+@pytest.fixture
+def embedded(tmp_path, monkeypatch):
+    """Texts sent to the embedding service"""
+    monkeypatch.setattr(
+        "oxygent.embedding_cache.Config.get_cache_save_dir", lambda: str(tmp_path)
+    )
+    texts = []
+
+    async def fake_embed(batch):
+        texts.extend(batch)
+        return np.ones((len(batch), 4))
+
+    monkeypatch.setattr(ec, "get_embedding", fake_embed)
+    return texts
+
+
+def make_db(vearch):
+    db = VearchDB({"db_name": "db", "tool_space_name": "tools", "router_url": ""})
+    db.vearch_tools = vearch
+    return db
+
+
+@pytest.mark.asyncio
+async def test_unchanged_tools_are_not_uploaded_again(embedded):
+    vearch = FakeVearch()
+    db = make_db(vearch)
+    await db.create_vearch_table_by_tool_list(TOOLS)
+    assert len(vearch.docs) == 3
+    assert vearch.requests == ["search", "bulk_index"]
+
+    vearch.requests.clear()
+    await make_db(vearch).create_vearch_table_by_tool_list(TOOLS)
+    assert vearch.requests == ["search"]
+    assert len(embedded) == 3
+
+
+@pytest.mark.asyncio
+async def test_changed_and_removed_tools_are_synced(embedded):
+    vearch = FakeVearch()
+    db = make_db(vearch)
+    await db.create_vearch_table_by_tool_list(TOOLS)
+    vearch.requests.clear()
+
+    await db.create_vearch_table_by_tool_list(
+        [TOOLS[0], ("app", "agent", "time", "get the current time")]
+    )
+    assert vearch.requests == ["search", "bulk_index", "bulk_delete"]
+    assert sorted(doc["tool_desc"] for doc in vearch.docs.values()) == [
+        "get the current time",
+        "get the weather",
+    ]
+    assert embedded[3:] == ["get the current time"]
+
+
+@pytest.mark.asyncio
+async def test_ids_left_by_bulk_delete_are_deleted_one_by_one(embedded):
+    vearch = FakeVearch(is_bulk_delete_supported=False)
+    db = make_db(vearch)
+    await db.create_vearch_table_by_tool_list(TOOLS)
+    vearch.requests.clear()
+
+    await db.create_vearch_table_by_tool_list(TOOLS[:1])
+    assert vearch.requests[-2:] == ["delete", "delete"]
+    assert [doc["tool_name"] for doc in vearch.docs.values()] == ["weather"]
+
+
+@pytest.mark.asyncio
+async def test_failed_recall_uploads_all_tools(embedded):
+    vearch = FakeVearch()
+    db = make_db(vearch)
+    await db.create_vearch_table_by_tool_list(TOOLS)
+    vearch.requests.clear()
+
+    vearch.is_down = True
+    await db.create_vearch_table_by_tool_list(TOOLS)
+    assert vearch.requests == ["search", "bulk_index"]
+    assert len(vearch.docs) == 3